@@ -46,13 +46,15 @@ class MistralEmbedder:
         
         print(f"[OK] MistralEmbedder initialized (model: {model}, batch_size: {batch_size})")
     
-    def embed_texts(self, texts: List[str], show_progress: bool = True) -> List[List[float]]:
+    def embed_texts(self, texts: List[str], show_progress: bool = True,
+                    fail_on_error: bool = False) -> List[List[float]]:
         """
         Generate embeddings for list of texts
         
         Args:
             texts: List of text strings to embed
             show_progress: Show progress messages
+            fail_on_error: Raise when a batch fails instead of using zero vectors
             
         Returns:
             List of embedding vectors (each is List[float] of length 1024)
@@ -101,6 +103,8 @@ class MistralEmbedder:
             except Exception as e:
                 print(f" ✗")
                 print(f"  [ERROR] Embedding failed for batch {batch_num}: {e}")
+                if fail_on_error:
+                    raise
                 # Add zero vectors as fallback
                 zero_vector = [0.0] * self.dimensions
                 embeddings.extend([zero_vector] * len(batch))
@@ -3,11 +3,126 @@ Simplified LangChain Extractor - Focus on Strategic Business Information Only
 Filters out casual conversation and personal topics
 """
 
+import os
+import re
+import logging
+import json
+import hashlib
+import sqlite3
+import functools
+import threading
+from pathlib import Path
 from typing import List, Optional
+import httpx
 from pydantic import BaseModel, Field
 from langchain_mistralai import ChatMistralAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
+from langchain_core.runnables import RunnableLambda
+
+from src.core.resilience import CircuitBreaker, CircuitBreakerOpenError, retry_with_backoff
+
+logger = logging.getLogger(__name__)
+
+# Fast JSON decoding for LLM responses (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Token counting for chunk packing (optional - falls back to characters)
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+
+# Whole lines containing personal/casual content (including the newline),
+# so the filter is a single regex substitution
+_CASUAL_LINE_RE = re.compile(
+    r'^.*(?:'
+    r'\begg\b.*\bcook'
+    r'|\bweather\b'
+    r'|\bfamily\b.*\bvacation\b'
+    r'|\bhow.*weekend\b'
+    r'|\bbirthday\b'
+    r'|\bpersonal.*update\b'
+    r').*\n?',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Speaker turn header ("\nJane Doe  00:01")
+_SPEAKER_RE = re.compile(r'\n[A-Z][a-z]+(?: [A-Z][a-z]+)*\s+\d{1,2}:\d{2}')
+
+
+@functools.lru_cache(maxsize=None)
+def _encoding():
+    """cl100k_base encoding, loaded on first use (None if it can't be fetched)
+
+    A cold tiktoken cache downloads the BPE file, so this stays out of import.
+    """
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning("tiktoken encoding unavailable, chunking by characters: %s", e)
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _token_len(text: str) -> int:
+    """Token count of a transcript segment (memoized)"""
+    return len(_encoding().encode(text, disallowed_special=()))
+
+
+# API failures worth retrying: rate limits/server errors and network issues
+_TRANSIENT_ERRORS = (httpx.HTTPStatusError, httpx.TransportError)
+
+# List-valued keys of an extraction result
+_LIST_KEYS = (
+    'people', 'organizations', 'countries', 'topics',
+    'decisions', 'action_items', 'relationships'
+)
+
+# Generic topic names that carry no strategic information
+_TRIVIAL_TOPICS = frozenset({
+    'update', 'discussion', 'meeting', 'call', 'check-in', 'hello', 'introduction'
+})
+
+
+# Word stems that signal strategic/business content; chunks scoring below
+# the prefilter threshold are skipped without an LLM call
+_STRATEGIC_CUES = (
+    'decid', 'decision', 'strateg', 'plan', 'priorit', 'recommend', 'agree',
+    'action', 'follow up', 'follow-up', 'next step', 'deadline', 'deliver',
+    'assign', 'responsib', 'budget', 'fund', 'grant', 'proposal', 'project',
+    'policy', 'government', 'minister', 'partner', 'stakeholder', 'engag',
+    'negotiat', 'campaign', 'research', 'report', 'paper', 'risk', 'organi'
+)
+
+
+def _freeze(obj):
+    """Convert nested dicts/lists into hashable tuples"""
+    if isinstance(obj, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in obj.items()))
+    if isinstance(obj, list):
+        return tuple(_freeze(x) for x in obj)
+    return obj
+
+
+def _dedup_key(item):
+    """Hashable key for an extracted item (fast path for flat dicts)"""
+    if isinstance(item, dict):
+        key = tuple(sorted(item.items()))
+        try:
+            hash(key)
+            return key
+        except TypeError:
+            pass
+    return _freeze(item)
 
 
 # ============================================
@@ -72,6 +187,64 @@ class SimplifiedEntities(BaseModel):
     relationships: List[EntityRelationship] = Field(default_factory=list, description="Relationships between entities")
 
 
+# ============================================
+# OUTPUT PARSER
+# ============================================
+
+_JSON_FENCE_RE = re.compile(r'^```(?:json)?\s*(.*?)\s*```$', re.DOTALL)
+
+
+class _OrjsonOutputParser(JsonOutputParser):
+    """JsonOutputParser that decodes complete responses with orjson"""
+
+    def parse_result(self, result, *, partial: bool = False):
+        text = result[0].text.strip()
+        match = _JSON_FENCE_RE.match(text)
+        if match:
+            text = match.group(1)
+
+        # Only a complete object can parse; partial stream prefixes fall through
+        if text.endswith('}'):
+            try:
+                return orjson.loads(text)
+            except orjson.JSONDecodeError:
+                pass
+
+        return super().parse_result(result, partial=partial)
+
+
+# ============================================
+# RESPONSE CACHE
+# ============================================
+
+class _ResponseCache:
+    """Persistent SQLite key/value store for extraction results"""
+
+    def __init__(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS extractions (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM extractions WHERE key = ?", (key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, value: dict):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO extractions (key, value) VALUES (?, ?)",
+                (key, json.dumps(value, ensure_ascii=False))
+            )
+            self._conn.commit()
+
+
 # ============================================
 # SIMPLIFIED EXTRACTOR
 # ============================================
@@ -79,26 +252,75 @@ class SimplifiedEntities(BaseModel):
 class SimplifiedMistralExtractor:
     """Extract only strategic business information"""
 
-    def __init__(self, api_key: str, model: str = "mistral-large-latest"):
+    def __init__(self, api_key: str, model: str = "mistral-large-latest",
+                 cache_path: Optional[str] = ".cache/extractor_cache.sqlite",
+                 max_concurrency: int = 8, prefilter_threshold: float = 0.2,
+                 request_slots: Optional[threading.Semaphore] = None):
         self.api_key = api_key
         self.model_name = model
+        self.max_concurrency = max_concurrency
+        # Held for each Mistral request; pass a shared semaphore to bound
+        # requests across extractors and other API users
+        self._request_slots = request_slots or threading.BoundedSemaphore(max_concurrency)
+        # Strategic cue hits per 500 characters required to call the LLM (0 disables)
+        self.prefilter_threshold = prefilter_threshold
+
+        # One pooled client shared by every chunk request; keep-alive slots
+        # match the batch concurrency so connections are reused, not reopened
+        self._http = httpx.Client(
+            base_url=os.environ.get("MISTRAL_BASE_URL", "https://api.mistral.ai/v1"),
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+                "Authorization": f"Bearer {api_key}",
+            },
+            timeout=120,
+            limits=httpx.Limits(
+                max_connections=max_concurrency * 2,
+                max_keepalive_connections=max_concurrency
+            )
+        )
 
         self.llm = ChatMistralAI(
+            client=self._http,
             mistral_api_key=api_key,
             model=model,
-            temperature=0.1,
+            temperature=0.0,  # Deterministic output so cached results stay valid
             max_tokens=3000,
             timeout=120,  # 2 minute timeout
             max_retries=2
         )
 
+        # Persistent cache of chunk extractions across runs (None disables)
+        self.cache = _ResponseCache(cache_path) if cache_path else None
+
+        # Schema-derived format instructions are invariant - build them once
+        parser_cls = _OrjsonOutputParser if ORJSON_AVAILABLE else JsonOutputParser
+        self._parser = parser_cls(pydantic_object=SimplifiedEntities)
+        self._format_instructions = self._parser.get_format_instructions()
+
         self.extraction_chain = self._create_extraction_chain()
+
+        # Retry transient API failures with backoff; after repeated failures the
+        # breaker opens and remaining chunks fail fast instead of timing out.
+        # Only transient errors count - a bad model output says nothing about
+        # the API's health
+        self._breaker = CircuitBreaker(failure_threshold=5, timeout=60.0,
+                                       expected_exception=_TRANSIENT_ERRORS)
+        self._run_chain = self._breaker.call(
+            retry_with_backoff(
+                max_attempts=4,
+                initial_delay=2.0,
+                backoff_factor=2.0,
+                exceptions=_TRANSIENT_ERRORS
+            )(self._stream_chain)
+        )
         print(f"[OK] Simplified extractor initialized (model: {model})")
 
     def _create_extraction_chain(self):
         """Create simplified extraction chain"""
 
-        prompt = ChatPromptTemplate.from_messages([
+        messages = [
             ("system", """You are an expert at extracting ONLY strategic business information from meeting transcripts.
 
 IGNORE and DO NOT extract:
@@ -148,33 +370,106 @@ Extract these entities (business context only):
 {format_instructions}
 
 REMEMBER: Skip all personal/casual content. Focus on strategic business substance only.""")
-        ])
+        ]
 
-        parser = JsonOutputParser(pydantic_object=SimplifiedEntities)
-        chain = prompt | self.llm | parser
+        # Prompt changes must invalidate cached extractions
+        # (including the output schema's format instructions, added below)
+        self._prompt_fingerprint = hashlib.sha256(
+            (repr(messages) + self._format_instructions).encode('utf-8')
+        ).hexdigest()
+
+        prompt = ChatPromptTemplate.from_messages(messages)
+        prompt = prompt.partial(format_instructions=self._format_instructions)
+        chain = prompt | self.llm | self._parser
 
         return chain
 
+    def _cache_key(self, chunk: str, meeting_info: dict) -> str:
+        """Cache key for a chunk extraction (model, prompt, chunk, meeting)"""
+        raw = "|".join([
+            self.model_name,
+            self._prompt_fingerprint,
+            chunk,
+            str(meeting_info.get("title")),
+            str(meeting_info.get("date")),
+        ])
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _has_strategic_signal(self, chunk: str) -> bool:
+        """Cheap keyword score deciding whether a chunk is worth an LLM call"""
+        if self.prefilter_threshold <= 0:
+            return True
+
+        low = chunk.lower()
+        hits = sum(low.count(cue) for cue in _STRATEGIC_CUES)
+        return hits / max(1, len(chunk) // 500) >= self.prefilter_threshold
+
+    def _stream_chain(self, inputs: dict) -> dict:
+        """Run the extraction chain, parsing JSON incrementally as tokens arrive"""
+        try:
+            # The parser yields progressively larger dicts; the last is complete
+            result = None
+            with self._request_slots:
+                for partial in self.extraction_chain.stream(inputs):
+                    result = partial
+        except httpx.HTTPStatusError as e:
+            # Client errors other than rate limiting will not succeed on retry
+            status = e.response.status_code
+            if status != 429 and status < 500:
+                raise ValueError(f"Mistral API rejected request ({status})") from e
+            raise
+
+        if result is None:
+            raise ValueError("empty response from model")
+
+        return result
+
     def extract_from_chunk(self, chunk: str, meeting_info: dict) -> dict:
         """Extract from a chunk"""
-        try:
-            parser = JsonOutputParser(pydantic_object=SimplifiedEntities)
+        result = self._extract_chunk(chunk, meeting_info)
+        return self._empty_result() if result is None else result
+
+    def _extract_chunk(self, chunk: str, meeting_info: dict) -> Optional[dict]:
+        """Extract from a chunk; None if the request failed (not merely empty)"""
+        if not self._has_strategic_signal(chunk):
+            logger.info("Skipping chunk with no strategic content (%d chars)", len(chunk))
+            return self._empty_result()
+
+        key = self._cache_key(chunk, meeting_info) if self.cache else None
+        if key:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
 
-            result = self.extraction_chain.invoke({
+        try:
+            result = self._run_chain({
                 "meeting_title": meeting_info.get("title", "Unknown"),
                 "meeting_date": meeting_info.get("date", "Unknown"),
-                "transcript_chunk": chunk,
-                "format_instructions": parser.get_format_instructions()
+                "transcript_chunk": chunk
             })
 
-            return result
+        except CircuitBreakerOpenError as e:
+            logger.warning("Skipping chunk, Mistral API unavailable: %s", e)
+            return None
 
         except Exception as e:
-            print(f"    [WARN] Extraction error: {e}")
-            return self._empty_result()
+            logger.warning("Extraction error: %s", e)
+            return None
+
+        # Only successful extractions are cached
+        if key:
+            self.cache.set(key, result)
+
+        return result
 
-    def extract_entities(self, transcript_text: str, meeting_info: dict) -> dict:
-        """Extract all strategic entities"""
+    def extract_entities(self, transcript_text: str, meeting_info: dict,
+                         failures: Optional[list] = None) -> dict:
+        """Extract all strategic entities
+
+        Failed chunks contribute nothing; pass a list as `failures` to
+        collect their (1-based) chunk numbers and tell a partial result
+        from a complete one.
+        """
 
         print(f"  Extracting: {meeting_info.get('title', 'Unknown')}")
 
@@ -183,20 +478,26 @@ REMEMBER: Skip all personal/casual content. Focus on strategic business substanc
 
         # Split into chunks
         chunks = self._chunk_transcript(filtered_text)
-        print(f"    Processing {len(chunks)} chunk(s)...")
+        logger.info("Processing %d chunk(s)", len(chunks))
 
         all_entities = self._empty_result()
 
-        for i, chunk in enumerate(chunks, 1):
-            print(f"    Chunk {i}/{len(chunks)}... ", end="", flush=True)
-            chunk_entities = self.extract_from_chunk(chunk, meeting_info)
+        # Extract chunks concurrently over the shared LLM client; each call
+        # still goes through the cache/streaming path in extract_from_chunk
+        extractor = RunnableLambda(lambda c: self._extract_chunk(c, meeting_info))
+        results = extractor.batch(chunks, config={"max_concurrency": self.max_concurrency})
+
+        for i, chunk_entities in enumerate(results, 1):
+            if chunk_entities is None:
+                if failures is not None:
+                    failures.append(i)
+                continue
 
             # Merge
-            for key in all_entities:
-                if isinstance(all_entities[key], list):
-                    all_entities[key].extend(chunk_entities.get(key, []))
+            for key in _LIST_KEYS:
+                all_entities[key].extend(chunk_entities.get(key) or ())
 
-            print("[OK]")
+            logger.info("Chunk %d/%d merged", i, len(chunks))
 
         # Deduplicate
         all_entities = self._deduplicate_entities(all_entities)
@@ -212,68 +513,51 @@ REMEMBER: Skip all personal/casual content. Focus on strategic business substanc
 
     def _filter_casual_content(self, text: str) -> str:
         """Remove obvious casual conversation sections"""
-        import re
-
-        # Keywords indicating personal/casual content
-        casual_keywords = [
-            r'\begg\b.*\bcook',
-            r'\bweather\b',
-            r'\bfamily\b.*\bvacation\b',
-            r'\bhow.*weekend\b',
-            r'\bbirthday\b',
-            r'\bpersonal.*update\b'
-        ]
-
-        lines = text.split('\n')
-        filtered_lines = []
-
-        for line in lines:
-            # Skip if line matches casual patterns
-            is_casual = any(re.search(pattern, line, re.IGNORECASE) for pattern in casual_keywords)
-
-            if not is_casual:
-                filtered_lines.append(line)
-
-        return '\n'.join(filtered_lines)
+        return _CASUAL_LINE_RE.sub('', text)
 
     def _filter_trivial_entities(self, entities: dict) -> dict:
         """Remove low-value entities"""
 
         # Filter out generic topics
-        trivial_topics = {'update', 'discussion', 'meeting', 'call', 'check-in', 'hello', 'introduction'}
-        entities['topics'] = [t for t in entities['topics']
-                             if t['name'].lower() not in trivial_topics]
+        entities['topics'] = [t for t in entities.get('topics', [])
+                              if (name := (t.get('name') or '').lower()) and name not in _TRIVIAL_TOPICS]
 
         # Filter out very short action items (likely noise)
-        entities['action_items'] = [a for a in entities['action_items']
-                                    if len(a['task']) > 15]
+        entities['action_items'] = [a for a in entities.get('action_items', [])
+                                    if len(a.get('task') or '') > 15]
 
         # Filter out very short decisions (likely noise)
-        entities['decisions'] = [d for d in entities['decisions']
-                                if len(d['description']) > 20]
+        entities['decisions'] = [d for d in entities.get('decisions', [])
+                                 if len(d.get('description') or '') > 20]
 
         return entities
 
-    def _chunk_transcript(self, text: str, max_chars: int = 12000) -> List[str]:
-        """Split into chunks"""
-        import re
+    def _chunk_transcript(self, text: str, max_chars: int = 12000,
+                          max_tokens: int = 6000) -> List[str]:
+        """Split into chunks (token budget when tiktoken is available, else characters)"""
+        # Slice into speaker turns (header + text) at each header position
+        positions = [0] + [m.start() for m in _SPEAKER_RE.finditer(text)] + [len(text)]
+        segments = [text[positions[i]:positions[i + 1]] for i in range(len(positions) - 1)]
 
-        speaker_pattern = r'\n([A-Z][a-z]+(?: [A-Z][a-z]+)*)\s+\d{1,2}:\d{2}'
-        segments = re.split(f'({speaker_pattern})', text)
+        if _encoding() is not None:
+            measure, budget = _token_len, max_tokens
+        else:
+            measure, budget = len, max_chars
 
         chunks = []
-        current_chunk = ""
+        buf, size = [], 0
 
         for segment in segments:
-            if len(current_chunk) + len(segment) > max_chars:
-                if current_chunk:
-                    chunks.append(current_chunk)
-                current_chunk = segment
+            seg_len = measure(segment)
+            if size + seg_len > budget and buf:
+                chunks.append(''.join(buf))
+                buf, size = [segment], seg_len
             else:
-                current_chunk += segment
+                buf.append(segment)
+                size += seg_len
 
-        if current_chunk:
-            chunks.append(current_chunk)
+        if size:
+            chunks.append(''.join(buf))
 
         if not chunks:
             for i in range(0, len(text), max_chars):
@@ -283,34 +567,22 @@ REMEMBER: Skip all personal/casual content. Focus on strategic business substanc
 
     def _deduplicate_entities(self, entities: dict) -> dict:
         """Remove duplicates"""
-        import json
-
-        for key in entities:
-            if isinstance(entities[key], list):
-                seen = set()
-                unique = []
-                for item in entities[key]:
-                    item_str = json.dumps(item, sort_keys=True)
-                    if item_str not in seen:
-                        seen.add(item_str)
-                        unique.append(item)
-                entities[key] = unique
+        for key, values in entities.items():
+            if isinstance(values, list):
+                # Insertion-ordered dict keeps the first occurrence, one hash per item
+                seen = {}
+                for item in values:
+                    seen.setdefault(_dedup_key(item), item)
+                entities[key] = list(seen.values())
 
         return entities
 
     def _empty_result(self) -> dict:
         """Empty result structure"""
-        return {
-            'people': [],
-            'organizations': [],
-            'countries': [],
-            'topics': [],
-            'decisions': [],
-            'action_items': [],
-            'relationships': []
-        }
+        return {key: [] for key in _LIST_KEYS}
     
-    def extract_relationships(self, transcript_text: str, meeting_info: dict, entities_data: dict) -> List[dict]:
+    def extract_relationships(self, transcript_text: str, meeting_info: dict, entities_data: dict,
+                              failures: Optional[list] = None) -> List[dict]:
         """
         Extract relationships between entities from transcript
         
@@ -318,6 +590,7 @@ REMEMBER: Skip all personal/casual content. Focus on strategic business substanc
             transcript_text: Full transcript text
             meeting_info: Meeting metadata
             entities_data: Previously extracted entities
+            failures: Optional list collecting the numbers of failed chunks
             
         Returns:
             List of relationship dictionaries
@@ -329,24 +602,15 @@ REMEMBER: Skip all personal/casual content. Focus on strategic business substanc
         
         # Split into chunks for relationship extraction
         chunks = self._chunk_transcript(filtered_text, max_chars=12000)
-        print(f"    Processing {len(chunks)} chunk(s) for relationships...")
-        
-        all_relationships = []
+        logger.info("Processing %d chunk(s) for relationships", len(chunks))
         
-        for i, chunk in enumerate(chunks, 1):
-            print(f"    Relationship chunk {i}/{len(chunks)}... ", end="", flush=True)
+        # Create a focused prompt for relationships
+        relationship_prompt = ChatPromptTemplate.from_messages([
+            ("system", """You are an expert at identifying relationships between entities in business transcripts.
             
-            try:
-                # Extract relationships from this chunk
-                parser = JsonOutputParser(pydantic_object=SimplifiedEntities)
-                
-                # Create a focused prompt for relationships
-                relationship_prompt = ChatPromptTemplate.from_messages([
-                    ("system", """You are an expert at identifying relationships between entities in business transcripts.
-                    
 Extract relationships between entities when they are explicitly mentioned or clearly implied.
 Focus on professional/business relationships only."""),
-                    ("user", """Extract entity relationships from this transcript chunk.
+            ("user", """Extract entity relationships from this transcript chunk.
 
 Meeting: {meeting_title}
 Date: {meeting_date}
@@ -363,25 +627,32 @@ Extract relationships between entities mentioned in the text. For each relations
 - Set confidence (0.8 for explicit, 0.6 for implied)
 
 {format_instructions}""")
-                ])
-                
-                relationship_chain = relationship_prompt | self.llm | parser
-                
-                result = relationship_chain.invoke({
-                    "meeting_title": meeting_info.get("title", "Unknown"),
-                    "meeting_date": meeting_info.get("date", "Unknown"),
-                    "transcript_chunk": chunk,
-                    "format_instructions": parser.get_format_instructions()
-                })
+        ])
+        
+        relationship_prompt = relationship_prompt.partial(format_instructions=self._format_instructions)
+        relationship_chain = relationship_prompt | self.llm | self._parser
+        
+        all_relationships = []
+        
+        for i, chunk in enumerate(chunks, 1):
+            try:
+                with self._request_slots:
+                    result = relationship_chain.invoke({
+                        "meeting_title": meeting_info.get("title", "Unknown"),
+                        "meeting_date": meeting_info.get("date", "Unknown"),
+                        "transcript_chunk": chunk
+                    })
                 
                 # Extract relationships from result
                 if 'relationships' in result:
                     all_relationships.extend(result['relationships'])
                 
-                print("[OK]")
+                logger.info("Relationship chunk %d/%d done", i, len(chunks))
                 
             except Exception as e:
-                print(f"[WARN] Relationship extraction error: {e}")
+                logger.warning("Relationship chunk %d/%d failed: %s", i, len(chunks), e)
+                if failures is not None:
+                    failures.append(i)
                 continue
         
         # Deduplicate relationships
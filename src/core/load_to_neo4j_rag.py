@@ -3,12 +3,30 @@ RAG-Optimized Neo4j Loader
 Loads: Chunks, Entities, Meetings, Decisions, Actions with RAG-focused relationships
 """
 
+import csv
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from neo4j import GraphDatabase
-from typing import Dict, List
+from typing import Dict, List, Optional
 import ssl
 import certifi
 
+# Streaming JSON parser (optional) - falls back to json.load of the whole file
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Fast JSON decoding (optional) for the non-streaming path
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import confidentiality detector (optional)
 try:
     from src.core.confidentiality_detector import ConfidentialityDetector
@@ -17,10 +35,126 @@ except ImportError:
     CONFIDENTIALITY_DETECTION = False
 
 
+def _check_iterate(record) -> int:
+    """committedOperations of an apoc.periodic.iterate call; raises if any batch failed
+
+    Failed batches are rolled back server-side while the call itself
+    succeeds, so without this check relationships would be lost silently.
+    """
+    if record['failedBatches'] or record['errorMessages']:
+        errors = '; '.join(record['errorMessages'])
+        raise RuntimeError(f"apoc.periodic.iterate: {record['failedBatches']} batches failed: {errors}")
+    return record['committedOperations']
+
+
+def _rel_op_variants(query: str) -> Dict[str, str]:
+    """CREATE and MERGE variants of a query written with a REL_OP placeholder"""
+    return {op: query.replace('REL_OP', op) for op in ('CREATE', 'MERGE')}
+
+
 class RAGNeo4jLoader:
     """Load RAG-optimized knowledge graph"""
 
-    def __init__(self, uri: str, user: str, password: str, auto_detect_confidentiality: bool = True):
+    # Cypher is kept in constants so every batch sends an identical query
+    # string and hits the server's plan cache. REL_OP queries come in a
+    # CREATE (fresh load) and a MERGE (incremental) variant.
+
+    _Q_MERGE_MEETING = """
+        UNWIND $rows AS r
+        MERGE (m:Meeting {id: r.id})
+        SET m.title = r.title,
+            m.date = r.date,
+            m.category = r.category,
+            m.participants = r.participants,
+            m.transcript_file = r.transcript_file,
+            m.tags = COALESCE(m.tags, r.detected_tags),
+            m.confidentiality_level = COALESCE(m.confidentiality_level, r.detected_conf),
+            m.document_status = COALESCE(m.document_status, r.detected_status),
+            m.created_date = COALESCE(m.created_date, date(r.date)),
+            m.last_modified_date = date(r.date)
+    """
+
+    _Q_MERGE_ENTITY = """
+        UNWIND $rows AS r
+        MERGE (e:Entity {id: r.id})
+        SET e.name = r.name,
+            e.type = r.type,
+            e.role = r.role,
+            e.organization = r.organization,
+            e.org_type = r.org_type,
+            e.status = r.status
+    """
+
+    _Q_MERGE_CHUNK_PARTOF = _rel_op_variants("""
+        UNWIND $rows AS r
+        MERGE (c:Chunk {id: r.id})
+        SET c.text = r.text,
+            c.sequence_number = r.sequence_number,
+            c.speakers = r.speakers,
+            c.start_time = r.start_time,
+            c.chunk_type = r.chunk_type,
+            c.importance_score = r.importance_score,
+            c.meeting_id = r.meeting_id,
+            c.meeting_title = r.meeting_title,
+            c.meeting_date = r.meeting_date,
+            c.tags = COALESCE(c.tags, []),
+            c.confidentiality_level = COALESCE(c.confidentiality_level, 'INTERNAL'),
+            c.document_status = COALESCE(c.document_status, 'FINAL'),
+            c.created_date = COALESCE(c.created_date, date(r.meeting_date)),
+            c.last_modified_date = date(r.meeting_date)
+        WITH c, r
+        MATCH (m:Meeting {id: r.meeting_id_ref})
+        REL_OP (c)-[:PART_OF]->(m)
+    """)
+
+    _Q_DECISION = """
+        UNWIND $rows AS r
+        MERGE (d:Decision {id: r.id})
+        SET d.description = r.description,
+            d.rationale = r.rationale
+        WITH d, r
+        MATCH (m:Meeting {id: r.meeting_id})
+        MERGE (m)-[:MADE_DECISION]->(d)
+    """
+
+    _Q_ACTION = """
+        UNWIND $rows AS r
+        MERGE (a:Action {id: r.id})
+        SET a.task = r.task,
+            a.owner = r.owner
+        WITH a, r
+        MATCH (m:Meeting {id: r.meeting_id})
+        MERGE (m)-[:CREATED_ACTION]->(a)
+    """
+
+    # Link queries are bodies for _write_links, bound to `link` = [start_id, end_id]
+
+    _Q_NEXT_CHUNK = _rel_op_variants("""
+        MATCH (c1:Chunk {id: link[0]})
+        MATCH (c2:Chunk {id: link[1]})
+        REL_OP (c1)-[:NEXT_CHUNK]->(c2)
+    """)
+
+    _Q_MENTIONS = _rel_op_variants("""
+        MATCH (c:Chunk {id: link[0]})
+        MATCH (e:Entity {id: link[1]})
+        REL_OP (c)-[:MENTIONS]->(e)
+    """)
+
+    _Q_RESULTED_IN_DECISION = _rel_op_variants("""
+        MATCH (c:Chunk {id: link[0]})
+        MATCH (d:Decision {id: link[1]})
+        REL_OP (c)-[:RESULTED_IN]->(d)
+    """)
+
+    _Q_RESULTED_IN_ACTION = _rel_op_variants("""
+        MATCH (c:Chunk {id: link[0]})
+        MATCH (a:Action {id: link[1]})
+        REL_OP (c)-[:RESULTED_IN]->(a)
+    """)
+
+    def __init__(self, uri: str, user: str, password: str, auto_detect_confidentiality: bool = True,
+                 database: str = "neo4j", max_workers: int = 4, batch_workers: int = 8):
         # For bolt+s:// URIs with Aura, we need to use certifi certificates
         # Create SSL context with certifi bundle
         ssl_context = ssl.create_default_context(cafile=certifi.where())
@@ -29,8 +163,26 @@ class RAGNeo4jLoader:
         self.driver = GraphDatabase.driver(
             uri,
             auth=(user, password),
-            ssl_context=ssl_context
+            ssl_context=ssl_context,
+            max_connection_pool_size=64,
+            connection_acquisition_timeout=120,
+            max_connection_lifetime=3600,
+            keep_alive=True
         )
+        # Naming the database explicitly skips home-database resolution per session
+        self.database = database
+        # Worker threads for independent load phases (one session each)
+        self.max_workers = max_workers
+        # Worker threads for dispatching batches within a phase
+        self.batch_workers = batch_workers
+        # Set by clear_database() so the next load can take the CREATE path
+        self._database_cleared = False
+        # Whether the server has APOC (probed lazily on first relationship write)
+        self._apoc_available = None
+        # meeting id -> (confidentiality_level, tags) from the detector
+        self._enrichment_cache = {}
+        # Pay the TLS handshakes up front rather than on the first load phase
+        self._warm_pool(max(max_workers, batch_workers))
         print(f"[OK] Connected to Neo4j at {uri}")
         
         # Initialize confidentiality detector
@@ -44,16 +196,40 @@ class RAGNeo4jLoader:
     def close(self):
         self.driver.close()
 
+    def _warm_pool(self, size: int):
+        """Open `size` pooled connections by holding that many transactions at once"""
+        sessions = [self.driver.session(database=self.database) for _ in range(size)]
+        try:
+            for session in sessions:
+                session.begin_transaction().run("RETURN 1").consume()
+        finally:
+            for session in sessions:
+                session.close()
+
+    @staticmethod
+    def _run_write(tx, query, **params):
+        """Transaction function for session.execute_write"""
+        tx.run(query, **params).consume()
+
     def clear_database(self):
         """Clear all data - use with caution!"""
         print("\n[WARN] Clearing database...")
-        with self.driver.session() as session:
+        with self.driver.session(database=self.database) as session:
             session.run("MATCH (n) DETACH DELETE n")
+        self._database_cleared = True
         print("[OK] Database cleared")
 
     def create_schema(self):
-        """Create constraints and indexes for RAG"""
-        print("\nCreating RAG schema...")
+        """Create constraints for RAG loading
+
+        Secondary indexes are maintained on every write, so they are built
+        by create_indexes() after the bulk load rather than before it.
+        """
+        self.create_constraints()
+
+    def create_constraints(self):
+        """Create uniqueness constraints (backing the MERGE/MATCH id lookups)"""
+        print("\nCreating RAG constraints...")
 
         constraints = [
             "CREATE CONSTRAINT chunk_id IF NOT EXISTS FOR (c:Chunk) REQUIRE c.id IS UNIQUE",
@@ -63,6 +239,13 @@ class RAGNeo4jLoader:
             "CREATE CONSTRAINT action_id IF NOT EXISTS FOR (a:Action) REQUIRE a.id IS UNIQUE"
         ]
 
+        self._run_schema_statements(constraints)
+        print("[OK] RAG constraints created")
+
+    def create_indexes(self):
+        """Create secondary and full-text indexes for RAG retrieval"""
+        print("\nCreating RAG indexes...")
+
         indexes = [
             # Critical for RAG retrieval
             "CREATE INDEX chunk_meeting IF NOT EXISTS FOR (c:Chunk) ON (c.meeting_id)",
@@ -75,90 +258,229 @@ class RAGNeo4jLoader:
             "CREATE FULLTEXT INDEX chunk_text IF NOT EXISTS FOR (c:Chunk) ON EACH [c.text]"
         ]
 
-        with self.driver.session() as session:
-            for constraint in constraints:
-                try:
-                    session.run(constraint)
-                except Exception as e:
-                    if "already exists" not in str(e).lower():
-                        print(f"  [WARN] {e}")
+        self._run_schema_statements(indexes)
+        print("[OK] RAG indexes created")
 
-            for index in indexes:
+    def _run_schema_statements(self, statements):
+        """Run DDL statements, ignoring ones that already exist"""
+        with self.driver.session(database=self.database) as session:
+            for statement in statements:
                 try:
-                    session.run(index)
+                    session.run(statement)
                 except Exception as e:
                     if "already exists" not in str(e).lower():
                         print(f"  [WARN] {e}")
 
-        print("[OK] RAG schema created")
-
-    def load_from_json(self, json_file: str):
-        """Load RAG data from JSON"""
-        print(f"\nLoading: {json_file}")
-
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+    def load_from_json(self, json_file: str, first_load: Optional[bool] = None,
+                       buffer_size: int = 100):
+        """Load RAG data from JSON
 
-        transcripts = data['transcripts']
-        entity_index = data.get('entity_index', {})
+        With first_load=True relationships are written with CREATE instead of
+        MERGE, skipping the existence check - only safe into an empty database.
+        Defaults to True right after clear_database(), MERGE otherwise.
 
-        print(f"Found {len(transcripts)} transcripts")
-        print(f"Entity index: {len(entity_index)} entities")
+        When ijson is installed transcripts are streamed and loaded
+        buffer_size at a time, so peak memory is bounded by the buffer and
+        writes start before the whole file is parsed.
+        """
+        print(f"\nLoading: {json_file}")
 
-        # Load in order for relationships
-        self._load_meetings(transcripts)
-        self._load_entities(transcripts, entity_index)
-        self._load_chunks(transcripts)
-        self._create_chunk_flow(transcripts)
-        self._link_chunks_to_entities(transcripts)
-        self._load_entity_relationships(transcripts)
-        self._load_decisions(transcripts)
-        self._load_actions(transcripts)
-        self._link_outcomes_to_chunks(transcripts)
+        if first_load is None:
+            first_load = self._database_cleared
+        self._database_cleared = False
+        rel_op = 'CREATE' if first_load else 'MERGE'
+
+        total = 0
+        with open(json_file, 'rb') as f:
+            if IJSON_AVAILABLE:
+                # use_float keeps numbers as floats - the driver can't send Decimal
+                transcripts_iter = ijson.items(f, 'transcripts.item', use_float=True)
+                entity_index = {}
+            else:
+                data = self._decode_json(f)
+                transcripts_iter = iter(data['transcripts'])
+                entity_index = data.get('entity_index', {})
+                print(f"Entity index: {len(entity_index)} entities")
+
+            for transcripts in iter(lambda: list(islice(transcripts_iter, buffer_size)), []):
+                print(f"\nTranscripts {total + 1}-{total + len(transcripts)}")
+                self._load_transcripts(transcripts, entity_index, rel_op)
+                total += len(transcripts)
+
+        print(f"\nLoaded {total} transcripts")
+
+        # Build secondary indexes once the data is in
+        self.create_indexes()
 
         print("\n[OK] All RAG data loaded!")
 
-    def _load_meetings(self, transcripts):
-        """Load meeting nodes"""
+    @staticmethod
+    def _decode_json(f):
+        """Decode a whole binary JSON file, with orjson when installed"""
+        if ORJSON_AVAILABLE:
+            return orjson.loads(f.read())
+        return json.load(f)
+
+    def _load_transcripts(self, transcripts, entity_index, rel_op):
+        """Run the load phases for one buffer of transcripts"""
+        # Confidentiality detection is CPU-only, so do it before taking sessions
+        meeting_rows = self._meeting_rows(transcripts, self.detector, self._enrichment_cache)
+
+        # Meetings and entities first - everything else links to them
+        self._run_phases([
+            (self._load_meetings, meeting_rows),
+            (self._load_entities, transcripts, entity_index),
+        ])
+
+        # Nodes that only depend on meetings
+        self._run_phases([
+            (self._load_chunks, transcripts, rel_op),
+            (self._load_decisions, transcripts),
+            (self._load_actions, transcripts),
+        ])
+
+        # Relationship phases once all nodes exist
+        self._run_phases([
+            (self._create_chunk_flow, transcripts, rel_op),
+            (self._link_chunks_to_entities, transcripts, rel_op),
+            (self._load_entity_relationships, transcripts),
+            (self._link_outcomes_to_chunks, transcripts, rel_op),
+        ])
+
+    def _run_phases(self, phases):
+        """Run independent load phases concurrently, one session per worker"""
+
+        def run(phase):
+            method, args = phase[0], phase[1:]
+            with self.driver.session(database=self.database) as session:
+                method(session, *args)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(run, phase) for phase in phases]
+            for future in futures:
+                future.result()
+
+    def _write_parallel(self, query, links, batch_size):
+        """Write UNWIND batches from worker threads, one session each"""
+
+        def write(batch):
+            with self.driver.session(database=self.database) as session:
+                session.execute_write(self._run_write, query, links=batch)
+            return len(batch)
+
+        batches = [links[i:i + batch_size] for i in range(0, len(links), batch_size)]
+        total = 0
+
+        with ThreadPoolExecutor(max_workers=self.batch_workers) as executor:
+            for written in executor.map(write, batches):
+                total += written
+                print(f"    Progress: {total}/{len(links)} links created")
+
+        return total
+
+    def _has_apoc(self, session) -> bool:
+        """Check once whether apoc.periodic.iterate can be used"""
+        if self._apoc_available is None:
+            try:
+                session.run("RETURN apoc.version() AS version").single()
+                self._apoc_available = True
+            except Exception:
+                self._apoc_available = False
+                print("  [WARN] APOC not available - using client-side batches")
+        return self._apoc_available
+
+    def _write_links(self, session, query, links, batch_size, parallel=False):
+        """Write relationship rows bound to `link`, batched server-side when possible
+
+        With APOC all rows go over Bolt once and apoc.periodic.iterate commits
+        them in server-side batches; otherwise rows are sent in client-side
+        UNWIND batches (dispatched concurrently if `parallel`). Server-side
+        batches run one at a time: they link to shared nodes (popular
+        entities, decisions), and parallel batches deadlock on those locks
+        beyond APOC's retries. Client-side batches are retried on deadlock
+        by execute_write.
+        """
+        if not links:
+            return 0
+
+        if self._has_apoc(session):
+            record = session.run("""
+                CALL apoc.periodic.iterate(
+                    'UNWIND $links AS link RETURN link',
+                    $query,
+                    {batchSize: $batch_size, parallel: false, retries: 3, params: {links: $links}}
+                ) YIELD committedOperations, failedBatches, errorMessages
+                RETURN committedOperations, failedBatches, errorMessages
+            """, query=query, links=links, batch_size=batch_size).single()
+            return _check_iterate(record)
+
+        batch_query = "UNWIND $links AS link\n" + query
+        if parallel:
+            return self._write_parallel(batch_query, links, batch_size)
+
+        for i in range(0, len(links), batch_size):
+            session.execute_write(self._run_write, batch_query, links=links[i:i + batch_size])
+        return len(links)
+
+    @staticmethod
+    def _meeting_rows(transcripts, detector=None, cache=None):
+        """Meeting rows with detected confidentiality, status and tags
+
+        `detector` is None when detection is off; `cache` maps meeting id to
+        detected (confidentiality_level, tags) across calls.
+        """
+        if cache is None:
+            cache = {}
+        rows = []
+        for t in transcripts:
+            meeting = t['meeting']
+
+            # Auto-detect confidentiality if enabled
+            if detector:
+                detected_conf, detected_tags = RAGNeo4jLoader._detect_meeting(meeting, detector, cache)
+                detected_status = 'FINAL'  # Always FINAL - no drafts in this workflow
+            else:
+                detected_conf = 'INTERNAL'
+                detected_status = 'FINAL'  # Always FINAL - no drafts in this workflow
+                detected_tags = []
+
+            rows.append({
+                **meeting,
+                'detected_conf': detected_conf,
+                'detected_status': detected_status,
+                'detected_tags': detected_tags
+            })
+
+        return rows
+
+    @staticmethod
+    def _detect_meeting(meeting, detector, cache):
+        """Detected (confidentiality_level, tags) for a meeting, cached by id
+
+        Calls the detector directly rather than enrich_meeting(), which also
+        copies the meeting and runs status detection that is not used here.
+        """
+        key = meeting.get('id')
+        cached = cache.get(key) if key else None
+        if cached is None:
+            cached = (detector.detect_confidentiality(meeting),
+                      detector.detect_tags(meeting))
+            if key:
+                cache[key] = cached
+        return cached
+
+    def _load_meetings(self, session, rows):
+        """Load meeting nodes from prepared meeting rows"""
         print("\n1. Loading meetings...")
 
-        with self.driver.session() as session:
-            for t in transcripts:
-                meeting = t['meeting'].copy()
-                
-                # Auto-detect confidentiality if enabled
-                if self.auto_detect and self.detector:
-                    enriched = self.detector.enrich_meeting(meeting)
-                    detected_conf = enriched['confidentiality_level']
-                    detected_status = 'FINAL'  # Always FINAL - no drafts in this workflow
-                    detected_tags = enriched['tags']
-                else:
-                    detected_conf = 'INTERNAL'
-                    detected_status = 'FINAL'  # Always FINAL - no drafts in this workflow
-                    detected_tags = []
-                
-                session.run("""
-                    MERGE (m:Meeting {id: $id})
-                    SET m.title = $title,
-                        m.date = $date,
-                        m.category = $category,
-                        m.participants = $participants,
-                        m.transcript_file = $transcript_file,
-                        m.tags = COALESCE(m.tags, $detected_tags),
-                        m.confidentiality_level = COALESCE(m.confidentiality_level, $detected_conf),
-                        m.document_status = COALESCE(m.document_status, $detected_status),
-                        m.created_date = COALESCE(m.created_date, date($date)),
-                        m.last_modified_date = date($date)
-                """, 
-                    detected_conf=detected_conf,
-                    detected_status=detected_status,
-                    detected_tags=detected_tags,
-                    **meeting
-                )
+        # One UNWIND per batch instead of one round-trip per meeting
+        batch_size = 500
+        for i in range(0, len(rows), batch_size):
+            session.run(self._Q_MERGE_MEETING, rows=rows[i:i + batch_size])
 
-        print(f"  [OK] {len(transcripts)} meetings")
+        print(f"  [OK] {len(rows)} meetings")
 
-    def _load_entities(self, transcripts, entity_index):
+    def _load_entities(self, session, transcripts, entity_index):
         """Load unified entity nodes"""
         print("\n2. Loading entities...")
 
@@ -169,137 +491,86 @@ class RAGNeo4jLoader:
                 if entity['id'] not in entities_map:
                     entities_map[entity['id']] = entity
 
-        with self.driver.session() as session:
-            for entity in entities_map.values():
-                # Convert properties dict to individual parameters
-                props = entity.get('properties', {})
-                session.run("""
-                    MERGE (e:Entity {id: $id})
-                    SET e.name = $name,
-                        e.type = $type,
-                        e.role = $role,
-                        e.organization = $organization,
-                        e.org_type = $org_type,
-                        e.status = $status
-                """,
-                    id=entity['id'],
-                    name=entity['name'],
-                    type=entity['type'],
-                    role=props.get('role'),
-                    organization=props.get('organization'),
-                    org_type=props.get('org_type'),
-                    status=props.get('status')
-                )
+        rows = []
+        for entity in entities_map.values():
+            # Flatten properties dict into individual fields
+            props = entity.get('properties', {})
+            rows.append({
+                'id': entity['id'],
+                'name': entity['name'],
+                'type': entity['type'],
+                'role': props.get('role'),
+                'organization': props.get('organization'),
+                'org_type': props.get('org_type'),
+                'status': props.get('status')
+            })
+
+        batch_size = 1000
+        for i in range(0, len(rows), batch_size):
+            session.run(self._Q_MERGE_ENTITY, rows=rows[i:i + batch_size])
 
         print(f"  [OK] {len(entities_map)} entities")
 
-    def _load_chunks(self, transcripts):
+    def _load_chunks(self, session, transcripts, rel_op='MERGE'):
         """Load chunk nodes - the core of RAG retrieval"""
         print("\n3. Loading chunks...")
 
-        total_chunks = 0
-        with self.driver.session() as session:
-            for t in transcripts:
-                meeting_id = t['meeting']['id']
-
-                for chunk in t.get('chunks', []):
-                    session.run("""
-                        MERGE (c:Chunk {id: $id})
-                        SET c.text = $text,
-                            c.sequence_number = $sequence_number,
-                            c.speakers = $speakers,
-                            c.start_time = $start_time,
-                            c.chunk_type = $chunk_type,
-                            c.importance_score = $importance_score,
-                            c.meeting_id = $meeting_id,
-                            c.meeting_title = $meeting_title,
-                            c.meeting_date = $meeting_date,
-                            c.tags = COALESCE(c.tags, []),
-                            c.confidentiality_level = COALESCE(c.confidentiality_level, 'INTERNAL'),
-                            c.document_status = COALESCE(c.document_status, 'FINAL'),
-                            c.created_date = COALESCE(c.created_date, date($meeting_date)),
-                            c.last_modified_date = date($meeting_date)
-                    """, **chunk)
-
-                    # Link to meeting (PART_OF)
-                    session.run("""
-                        MATCH (c:Chunk {id: $chunk_id})
-                        MATCH (m:Meeting {id: $meeting_id})
-                        MERGE (c)-[:PART_OF]->(m)
-                    """, chunk_id=chunk['id'], meeting_id=meeting_id)
-
-                    total_chunks += 1
-
-        print(f"  [OK] {total_chunks} chunks")
-
-    def _create_chunk_flow(self, transcripts):
-        """Create NEXT_CHUNK relationships for conversation flow"""
-        print("\n4. Creating conversation flow...")
+        all_chunks = [
+            {**chunk, 'meeting_id_ref': t['meeting']['id']}
+            for t in transcripts
+            for chunk in t.get('chunks', [])
+        ]
 
-        total_links = 0
-        with self.driver.session() as session:
-            for t in transcripts:
-                chunks = t.get('chunks', [])
+        # Chunk MERGE and PART_OF link in a single statement per batch
+        batch_size = 500
+        for i in range(0, len(all_chunks), batch_size):
+            session.run(self._Q_MERGE_CHUNK_PARTOF[rel_op], rows=all_chunks[i:i + batch_size])
 
-                # Link sequential chunks
-                for i in range(len(chunks) - 1):
-                    current_id = chunks[i]['id']
-                    next_id = chunks[i + 1]['id']
+        print(f"  [OK] {len(all_chunks)} chunks")
 
-                    session.run("""
-                        MATCH (c1:Chunk {id: $current_id})
-                        MATCH (c2:Chunk {id: $next_id})
-                        MERGE (c1)-[:NEXT_CHUNK]->(c2)
-                    """, current_id=current_id, next_id=next_id)
+    def _create_chunk_flow(self, session, transcripts, rel_op='MERGE'):
+        """Create NEXT_CHUNK relationships for conversation flow"""
+        print("\n4. Creating conversation flow...")
+
+        # Link sequential chunks
+        pairs = [
+            [chunks[i]['id'], chunks[i + 1]['id']]
+            for t in transcripts
+            for chunks in [t.get('chunks', [])]
+            for i in range(len(chunks) - 1)
+        ]
 
-                    total_links += 1
+        total_pairs = self._write_links(session, self._Q_NEXT_CHUNK[rel_op], pairs, batch_size=5000)
 
-        print(f"  [OK] {total_links} NEXT_CHUNK links")
+        print(f"  [OK] {total_pairs} NEXT_CHUNK links")
 
-    def _link_chunks_to_entities(self, transcripts):
+    def _link_chunks_to_entities(self, session, transcripts, rel_op='MERGE'):
         """Create MENTIONS relationships with batch processing"""
         print("\n5. Linking chunks to entities...")
 
-        # Collect all links first
-        all_links = []
+        # Collect all links first, resolving sequences via a per-transcript id list.
+        # Keyed by (chunk_id, entity_id) so duplicate mentions are sent once.
+        unique_links = {}
         for t in transcripts:
-            chunks = t.get('chunks', [])
-            for link in t.get('chunk_entity_links', []):
-                if link['chunk_sequence'] < len(chunks):
-                    chunk_id = chunks[link['chunk_sequence']]['id']
-                    all_links.append({
-                        'chunk_id': chunk_id,
-                        'entity_id': link['entity_id']
-                    })
+            seq_ids = [c['id'] for c in t.get('chunks', [])]
+            unique_links.update(dict.fromkeys(
+                (seq_ids[link['chunk_sequence']], link['entity_id'])
+                for link in t.get('chunk_entity_links', [])
+                if link['chunk_sequence'] < len(seq_ids)
+            ))
 
-        print(f"  Processing {len(all_links)} MENTIONS relationships...")
-
-        # Process in batches to avoid connection timeout
-        batch_size = 500
-        total_mentions = 0
+        # [chunk_id, entity_id] pairs pack smaller over Bolt than two-key maps
+        all_links = [list(pair) for pair in unique_links]
 
-        for i in range(0, len(all_links), batch_size):
-            batch = all_links[i:i + batch_size]
-
-            # Create new session for each batch to avoid timeout
-            with self.driver.session() as session:
-                # Use UNWIND for batch processing (much faster)
-                session.run("""
-                    UNWIND $links as link
-                    MATCH (c:Chunk {id: link.chunk_id})
-                    MATCH (e:Entity {id: link.entity_id})
-                    MERGE (c)-[:MENTIONS]->(e)
-                """, links=batch)
-
-                total_mentions += len(batch)
+        print(f"  Processing {len(all_links)} MENTIONS relationships...")
 
-                # Progress indicator
-                if (i + batch_size) % 2000 == 0 or (i + batch_size) >= len(all_links):
-                    print(f"    Progress: {min(i + batch_size, len(all_links))}/{len(all_links)} links created")
+        # Without APOC, batches are dispatched concurrently from worker sessions
+        total_mentions = self._write_links(session, self._Q_MENTIONS[rel_op], all_links,
+                                          batch_size=5000, parallel=True)
 
         print(f"  [OK] {total_mentions} MENTIONS links")
 
-    def _load_entity_relationships(self, transcripts):
+    def _load_entity_relationships(self, session, transcripts):
         """Create Entity → Entity relationships"""
         print("\n6. Loading entity relationships...")
 
@@ -322,112 +593,100 @@ class RAGNeo4jLoader:
         for i in range(0, len(all_relationships), batch_size):
             batch = all_relationships[i:i + batch_size]
 
-            with self.driver.session() as session:
-                # Use UNWIND for batch processing
-                session.run("""
-                    UNWIND $relationships as rel
-                    MATCH (e1:Entity {id: rel.source_entity_id})
-                    MATCH (e2:Entity {id: rel.target_entity_id})
-                    MERGE (e1)-[r:RELATES_TO]->(e2)
-                    SET r.relationship_type = rel.relationship_type,
-                        r.context = rel.context,
-                        r.confidence = rel.confidence,
-                        r.source_type = rel.source_entity_type,
-                        r.target_type = rel.target_entity_type
-                """, relationships=batch)
-
-                total_rels += len(batch)
-
-                # Progress indicator
-                if (i + batch_size) % 1000 == 0 or (i + batch_size) >= len(all_relationships):
-                    print(f"    Progress: {min(i + batch_size, len(all_relationships))}/{len(all_relationships)} relationships created")
+            # Use UNWIND for batch processing
+            session.execute_write(self._run_write, """
+                UNWIND $relationships as rel
+                MATCH (e1:Entity {id: rel.source_entity_id})
+                MATCH (e2:Entity {id: rel.target_entity_id})
+                MERGE (e1)-[r:RELATES_TO]->(e2)
+                SET r.relationship_type = rel.relationship_type,
+                    r.context = rel.context,
+                    r.confidence = rel.confidence,
+                    r.source_type = rel.source_entity_type,
+                    r.target_type = rel.target_entity_type
+            """, relationships=batch)
+
+            total_rels += len(batch)
+
+            # Progress indicator
+            if (i + batch_size) % 1000 == 0 or (i + batch_size) >= len(all_relationships):
+                print(f"    Progress: {min(i + batch_size, len(all_relationships))}/{len(all_relationships)} relationships created")
 
         # Now create specific relationship types based on relationship_type
         # This allows for better querying with specific types
         print("  Creating typed relationships...")
-        with self.driver.session() as session:
-            # Create specific relationship types for common patterns
-            # Use apoc.create.relationship for dynamic relationship creation
-            relationship_types = [
-                'WORKS_FOR', 'WORKS_WITH', 'REPRESENTS', 'CONSULTS_FOR',
-                'COLLABORATES_WITH', 'MENTIONED_WITH', 'REPORTS_TO',
-                'OPERATES_IN', 'BASED_IN', 'ACTIVE_IN',
-                'PARTNERS_WITH', 'FOCUSES_ON', 'RELATED_TO'
-            ]
-            
-            for rel_type in relationship_types:
-                # Use string concatenation carefully - Neo4j doesn't support dynamic relationship types in MATCH
-                # So we'll query with WHERE and create relationships with apoc if available, or use a workaround
-                try:
-                    # Try using apoc if available
-                    session.run("""
-                        MATCH (e1:Entity)-[r:RELATES_TO]->(e2:Entity)
-                        WHERE r.relationship_type = $rel_type
-                        CALL apoc.create.relationship(e1, $rel_type, {context: r.context, confidence: r.confidence, source_type: r.source_type, target_type: r.target_type}, e2) YIELD rel
-                        RETURN count(rel) as created
-                    """, rel_type=rel_type)
-                except:
-                    # Fallback: Keep using RELATES_TO with relationship_type property
-                    # This still works for queries using WHERE r.relationship_type = 'WORKS_FOR'
-                    pass
+        # Create specific relationship types for common patterns
+        # Use apoc.create.relationship for dynamic relationship creation
+        relationship_types = [
+            'WORKS_FOR', 'WORKS_WITH', 'REPRESENTS', 'CONSULTS_FOR',
+            'COLLABORATES_WITH', 'MENTIONED_WITH', 'REPORTS_TO',
+            'OPERATES_IN', 'BASED_IN', 'ACTIVE_IN',
+            'PARTNERS_WITH', 'FOCUSES_ON', 'RELATED_TO'
+        ]
+        
+        for rel_type in relationship_types:
+            # Use string concatenation carefully - Neo4j doesn't support dynamic relationship types in MATCH
+            # So we'll query with WHERE and create relationships with apoc if available, or use a workaround
+            try:
+                # Try using apoc if available
+                session.run("""
+                    MATCH (e1:Entity)-[r:RELATES_TO]->(e2:Entity)
+                    WHERE r.relationship_type = $rel_type
+                    CALL apoc.create.relationship(e1, $rel_type, {context: r.context, confidence: r.confidence, source_type: r.source_type, target_type: r.target_type}, e2) YIELD rel
+                    RETURN count(rel) as created
+                """, rel_type=rel_type)
+            except:
+                # Fallback: Keep using RELATES_TO with relationship_type property
+                # This still works for queries using WHERE r.relationship_type = 'WORKS_FOR'
+                pass
 
         print(f"  [OK] {total_rels} entity relationships loaded")
 
-    def _load_decisions(self, transcripts):
+    def _load_decisions(self, session, transcripts):
         """Load decision nodes"""
         print("\n7. Loading decisions...")
 
-        total_decisions = 0
-        with self.driver.session() as session:
-            for t in transcripts:
-                meeting_id = t['meeting']['id']
-
-                for decision in t.get('decisions', []):
-                    session.run("""
-                        MERGE (d:Decision {id: $id})
-                        SET d.description = $description,
-                            d.rationale = $rationale
-                    """, **decision)
-
-                    # Link to meeting
-                    session.run("""
-                        MATCH (m:Meeting {id: $meeting_id})
-                        MATCH (d:Decision {id: $decision_id})
-                        MERGE (m)-[:MADE_DECISION]->(d)
-                    """, meeting_id=meeting_id, decision_id=decision['id'])
+        rows = [
+            {
+                'id': d['id'],
+                'description': d['description'],
+                'rationale': d.get('rationale'),
+                'meeting_id': t['meeting']['id']
+            }
+            for t in transcripts
+            for d in t.get('decisions', [])
+        ]
 
-                    total_decisions += 1
+        # Node MERGE and meeting link in one statement per batch
+        batch_size = 500
+        for i in range(0, len(rows), batch_size):
+            session.run(self._Q_DECISION, rows=rows[i:i + batch_size])
 
-        print(f"  [OK] {total_decisions} decisions")
+        print(f"  [OK] {len(rows)} decisions")
 
-    def _load_actions(self, transcripts):
+    def _load_actions(self, session, transcripts):
         """Load action nodes"""
         print("\n8. Loading actions...")
 
-        total_actions = 0
-        with self.driver.session() as session:
-            for t in transcripts:
-                meeting_id = t['meeting']['id']
-
-                for action in t.get('actions', []):
-                    session.run("""
-                        MERGE (a:Action {id: $id})
-                        SET a.task = $task,
-                            a.owner = $owner
-                    """, **action)
-
-                    # Link to meeting
-                    session.run("""
-                        MATCH (m:Meeting {id: $meeting_id})
-                        MATCH (a:Action {id: $action_id})
-                        MERGE (m)-[:CREATED_ACTION]->(a)
-                    """, meeting_id=meeting_id, action_id=action['id'])
+        rows = [
+            {
+                'id': a['id'],
+                'task': a['task'],
+                'owner': a.get('owner'),
+                'meeting_id': t['meeting']['id']
+            }
+            for t in transcripts
+            for a in t.get('actions', [])
+        ]
 
-                    total_actions += 1
+        # Node MERGE and meeting link in one statement per batch
+        batch_size = 500
+        for i in range(0, len(rows), batch_size):
+            session.run(self._Q_ACTION, rows=rows[i:i + batch_size])
 
-        print(f"  [OK] {total_actions} actions")
+        print(f"  [OK] {len(rows)} actions")
 
-    def _link_outcomes_to_chunks(self, transcripts):
+    def _link_outcomes_to_chunks(self, session, transcripts, rel_op='MERGE'):
         """Create RESULTED_IN relationships from chunks to decisions/actions with batch processing"""
         print("\n9. Linking outcomes to source chunks...")
 
@@ -436,69 +695,202 @@ class RAGNeo4jLoader:
         action_links = []
 
         for t in transcripts:
-            chunks = t.get('chunks', [])
+            seq_ids = [c['id'] for c in t.get('chunks', [])]
 
             # Collect decision links
-            for decision in t.get('decisions', []):
-                for seq in decision.get('source_chunk_sequences', []):
-                    if seq < len(chunks):
-                        chunk_id = chunks[seq]['id']
-                        decision_links.append({
-                            'chunk_id': chunk_id,
-                            'outcome_id': decision['id']
-                        })
+            decision_links.extend(
+                [seq_ids[seq], decision['id']]
+                for decision in t.get('decisions', [])
+                for seq in decision.get('source_chunk_sequences', [])
+                if seq < len(seq_ids)
+            )
 
             # Collect action links
-            for action in t.get('actions', []):
-                for seq in action.get('source_chunk_sequences', []):
-                    if seq < len(chunks):
-                        chunk_id = chunks[seq]['id']
-                        action_links.append({
-                            'chunk_id': chunk_id,
-                            'outcome_id': action['id']
-                        })
+            action_links.extend(
+                [seq_ids[seq], action['id']]
+                for action in t.get('actions', [])
+                for seq in action.get('source_chunk_sequences', [])
+                if seq < len(seq_ids)
+            )
 
         print(f"  Processing {len(decision_links)} decision links and {len(action_links)} action links...")
 
-        total_links = 0
-
-        # Process decision links in batches
-        if decision_links:
-            batch_size = 500
-            for i in range(0, len(decision_links), batch_size):
-                batch = decision_links[i:i + batch_size]
-                with self.driver.session() as session:
-                    session.run("""
-                        UNWIND $links as link
-                        MATCH (c:Chunk {id: link.chunk_id})
-                        MATCH (d:Decision {id: link.outcome_id})
-                        MERGE (c)-[:RESULTED_IN]->(d)
-                    """, links=batch)
-                    total_links += len(batch)
-
-        # Process action links in batches
-        if action_links:
-            batch_size = 500
-            for i in range(0, len(action_links), batch_size):
-                batch = action_links[i:i + batch_size]
-                with self.driver.session() as session:
-                    session.run("""
-                        UNWIND $links as link
-                        MATCH (c:Chunk {id: link.chunk_id})
-                        MATCH (a:Action {id: link.outcome_id})
-                        MERGE (c)-[:RESULTED_IN]->(a)
-                    """, links=batch)
-                    total_links += len(batch)
+        total_links = self._write_links(session, self._Q_RESULTED_IN_DECISION[rel_op],
+                                        decision_links, batch_size=5000)
+
+        total_links += self._write_links(session, self._Q_RESULTED_IN_ACTION[rel_op],
+                                         action_links, batch_size=5000)
 
         print(f"  [OK] {total_links} RESULTED_IN links")
 
+    @staticmethod
+    def export_to_admin_csv(json_file: str, out_dir: str, database: str = "neo4j",
+                            auto_detect_confidentiality: bool = True) -> str:
+        """Write neo4j-admin import CSVs for an offline initial load
+
+        Bypasses Bolt entirely, which is far faster for large graphs, but
+        `neo4j-admin database import full` only works on a stopped,
+        self-hosted server and replaces the target database - not usable
+        on Aura. Only reads the JSON, so no loader (or running server) is
+        needed:
+
+            RAGNeo4jLoader.export_to_admin_csv(json_file, out_dir)
+
+        Typed entity relationships (WORKS_FOR etc.) are not exported; only
+        the generic RELATES_TO is.
+
+        Returns the import command to run.
+        """
+        print(f"\nExporting admin-import CSVs: {json_file} -> {out_dir}")
+
+        with open(json_file, 'rb') as f:
+            transcripts = RAGNeo4jLoader._decode_json(f)['transcripts']
+
+        detector = None
+        if auto_detect_confidentiality and CONFIDENTIALITY_DETECTION:
+            detector = ConfidentialityDetector()
+
+        os.makedirs(out_dir, exist_ok=True)
+
+        def write(name, header, rows):
+            path = os.path.join(out_dir, name)
+            with open(path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(header)
+                writer.writerows(rows)
+            return path
+
+        def array(values):
+            return ';'.join(str(v) for v in values or [])
+
+        meetings = {}
+        for m in RAGNeo4jLoader._meeting_rows(transcripts, detector):
+            meetings[m['id']] = [
+                m['id'], m.get('title'), m.get('date'), m.get('category'),
+                array(m.get('participants')), m.get('transcript_file'),
+                array(m['detected_tags']), m['detected_conf'], m['detected_status'],
+                m.get('date'), m.get('date')
+            ]
+
+        entities, chunks, decisions, actions = {}, {}, {}, {}
+        # Every CSV row becomes a new relationship, so MENTIONS and RELATES_TO
+        # are keyed like the live path's MERGEs (last RELATES_TO row wins)
+        part_of, next_chunk, mentions, relates_to = [], [], {}, {}
+        made_decision, created_action = [], []
+        decision_sources, action_sources = [], []
+
+        for t in transcripts:
+            meeting_id = t['meeting']['id']
+            seq_ids = [c['id'] for c in t.get('chunks', [])]
+
+            for e in t.get('entities', []):
+                props = e.get('properties', {})
+                entities.setdefault(e['id'], [
+                    e['id'], e['name'], e['type'], props.get('role'),
+                    props.get('organization'), props.get('org_type'), props.get('status')
+                ])
+
+            for c in t.get('chunks', []):
+                chunks[c['id']] = [
+                    c['id'], c.get('text'), c.get('sequence_number'), array(c.get('speakers')),
+                    c.get('start_time'), c.get('chunk_type'), c.get('importance_score'),
+                    c.get('meeting_id'), c.get('meeting_title'), c.get('meeting_date'),
+                    'INTERNAL', 'FINAL', c.get('meeting_date'), c.get('meeting_date')
+                ]
+                part_of.append([c['id'], meeting_id, 'PART_OF'])
+
+            next_chunk.extend([a, b, 'NEXT_CHUNK'] for a, b in zip(seq_ids, seq_ids[1:]))
+
+            mentions.update(dict.fromkeys(
+                (seq_ids[link['chunk_sequence']], link['entity_id'])
+                for link in t.get('chunk_entity_links', [])
+                if link['chunk_sequence'] < len(seq_ids)
+            ))
+
+            for rel in t.get('entity_relationships', []):
+                relates_to[rel['source_entity_id'], rel['target_entity_id']] = [
+                    rel['source_entity_id'], rel['target_entity_id'], 'RELATES_TO',
+                    rel.get('relationship_type'), rel.get('context'), rel.get('confidence'),
+                    rel.get('source_entity_type'), rel.get('target_entity_type')
+                ]
+
+            for d in t.get('decisions', []):
+                decisions[d['id']] = [d['id'], d['description'], d.get('rationale')]
+                made_decision.append([meeting_id, d['id'], 'MADE_DECISION'])
+                decision_sources.extend(
+                    [seq_ids[seq], d['id'], 'RESULTED_IN']
+                    for seq in d.get('source_chunk_sequences', []) if seq < len(seq_ids)
+                )
+
+            for a in t.get('actions', []):
+                actions[a['id']] = [a['id'], a['task'], a.get('owner')]
+                created_action.append([meeting_id, a['id'], 'CREATED_ACTION'])
+                action_sources.extend(
+                    [seq_ids[seq], a['id'], 'RESULTED_IN']
+                    for seq in a.get('source_chunk_sequences', []) if seq < len(seq_ids)
+                )
+
+        nodes = {
+            'Meeting': write('meetings.csv', [
+                'id:ID(Meeting)', 'title', 'date', 'category', 'participants:string[]',
+                'transcript_file', 'tags:string[]', 'confidentiality_level', 'document_status',
+                'created_date:date', 'last_modified_date:date'
+            ], meetings.values()),
+            'Entity': write('entities.csv', [
+                'id:ID(Entity)', 'name', 'type', 'role', 'organization', 'org_type', 'status'
+            ], entities.values()),
+            'Chunk': write('chunks.csv', [
+                'id:ID(Chunk)', 'text', 'sequence_number:int', 'speakers:string[]',
+                'start_time', 'chunk_type', 'importance_score:float', 'meeting_id',
+                'meeting_title', 'meeting_date', 'confidentiality_level', 'document_status',
+                'created_date:date', 'last_modified_date:date'
+            ], chunks.values()),
+            'Decision': write('decisions.csv', [
+                'id:ID(Decision)', 'description', 'rationale'
+            ], decisions.values()),
+            'Action': write('actions.csv', [
+                'id:ID(Action)', 'task', 'owner'
+            ], actions.values()),
+        }
+
+        relationships = [
+            write('part_of.csv', [':START_ID(Chunk)', ':END_ID(Meeting)', ':TYPE'], part_of),
+            write('next_chunk.csv', [':START_ID(Chunk)', ':END_ID(Chunk)', ':TYPE'], next_chunk),
+            write('mentions.csv', [':START_ID(Chunk)', ':END_ID(Entity)', ':TYPE'],
+                  ([chunk_id, entity_id, 'MENTIONS'] for chunk_id, entity_id in mentions)),
+            write('relates_to.csv', [
+                ':START_ID(Entity)', ':END_ID(Entity)', ':TYPE', 'relationship_type',
+                'context', 'confidence', 'source_type', 'target_type'
+            ], relates_to.values()),
+            write('made_decision.csv', [':START_ID(Meeting)', ':END_ID(Decision)', ':TYPE'], made_decision),
+            write('created_action.csv', [':START_ID(Meeting)', ':END_ID(Action)', ':TYPE'], created_action),
+            # ID spaces are per label, so RESULTED_IN needs one file per target
+            write('resulted_in_decisions.csv', [':START_ID(Chunk)', ':END_ID(Decision)', ':TYPE'], decision_sources),
+            write('resulted_in_actions.csv', [':START_ID(Chunk)', ':END_ID(Action)', ':TYPE'], action_sources),
+        ]
+
+        command = ' '.join(
+            ['neo4j-admin database import full']
+            + [f'--nodes={label}={path}' for label, path in nodes.items()]
+            + [f'--relationships={path}' for path in relationships]
+            + ['--multiline-fields=true', '--skip-bad-relationships=true',
+               '--skip-duplicate-nodes=true', database]
+        )
+
+        print(f"  [OK] {len(meetings)} meetings, {len(chunks)} chunks, {len(entities)} entities")
+        print("  Stop the server, then run:")
+        print(f"    {command}")
+        print("  Afterwards start it and run create_schema() + create_indexes()")
+
+        return command
+
     def get_stats(self):
         """Show database statistics"""
         print("\n" + "="*70)
         print("RAG KNOWLEDGE GRAPH STATISTICS")
         print("="*70)
 
-        with self.driver.session() as session:
+        with self.driver.session(database=self.database) as session:
             # Node counts
             nodes = {
                 'Chunks': 'Chunk',
@@ -508,21 +900,35 @@ class RAGNeo4jLoader:
                 'Actions': 'Action'
             }
 
+            if self._has_apoc(session):
+                # Label and relationship-type counts from the count store in one call
+                record = session.run(
+                    "CALL apoc.meta.stats() YIELD labels, relTypesCount RETURN labels, relTypesCount"
+                ).single()
+                label_counts = record['labels']
+                rel_counts = sorted(record['relTypesCount'].items(), key=lambda kv: kv[1], reverse=True)
+            else:
+                # One round-trip for all label counts
+                result = session.run(" UNION ALL ".join(
+                    f"MATCH (n:{node_type}) RETURN '{node_type}' AS label, count(n) AS count"
+                    for node_type in nodes.values()
+                ))
+                label_counts = {record['label']: record['count'] for record in result}
+                result = session.run("""
+                    MATCH ()-[r]->()
+                    RETURN type(r) as type, count(r) as count
+                    ORDER BY count DESC
+                """)
+                rel_counts = [(record['type'], record['count']) for record in result]
+
             print("\nNodes:")
             for label, node_type in nodes.items():
-                result = session.run(f"MATCH (n:{node_type}) RETURN count(n) as count")
-                count = result.single()['count']
-                print(f"  {label:20} {count:>6}")
+                print(f"  {label:20} {label_counts.get(node_type, 0):>6}")
 
             # Relationship counts
             print("\nRelationships:")
-            result = session.run("""
-                MATCH ()-[r]->()
-                RETURN type(r) as type, count(r) as count
-                ORDER BY count DESC
-            """)
-            for record in result:
-                print(f"  {record['type']:25} {record['count']:>6}")
+            for rel_type, count in rel_counts:
+                print(f"  {rel_type:25} {count:>6}")
 
             # RAG-specific stats
             print("\nRAG Metrics:")
@@ -533,7 +939,7 @@ class RAGNeo4jLoader:
                 WITH m, count(c) as chunk_count
                 RETURN avg(chunk_count) as avg_chunks
             """)
-            avg_chunks = result.single()['avg_chunks']
+            avg_chunks = result.single()['avg_chunks'] or 0
             print(f"  Avg chunks/meeting:      {avg_chunks:.1f}")
 
             # Chunks by type
@@ -556,17 +962,17 @@ class RAGNeo4jLoader:
             print("\n  Top 10 mentioned entities:")
             for record in result:
                 print(f"    {record['entity']:30} ({record['type']:12}) {record['mentions']:>4} mentions")
-        
-        # Relationship statistics
-        print("\n**Entity Relationships:**")
-        result = session.run("""
-            MATCH ()-[r:RELATES_TO]->()
-            RETURN r.relationship_type as rel_type, count(*) as count
-            ORDER BY count DESC
-        """)
-        
-        for record in result:
-            print(f"    {record['rel_type']:20} {record['count']:>4} relationships")
+
+            # Relationship statistics
+            print("\n**Entity Relationships:**")
+            result = session.run("""
+                MATCH ()-[r:RELATES_TO]->()
+                RETURN r.relationship_type as rel_type, count(*) as count
+                ORDER BY count DESC
+            """)
+
+            for record in result:
+                print(f"    {record['rel_type']:20} {record['count']:>4} relationships")
 
 
 def main():
@@ -3,35 +3,544 @@ Unified RAG-Optimized Neo4j Loader
 Supports: Meetings, Documents, WhatsApp Chats
 """
 
+import csv
+import hashlib
 import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timezone
+from functools import lru_cache
+from itertools import islice
 from neo4j import GraphDatabase
-from typing import Dict, List, Optional
+from neo4j.time import DateTime
+from typing import Dict, Iterable, List, Optional
 import ssl
 import certifi
 
+# Streaming JSON parser (optional) - lets main() stream messages from disk
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Fast JSON decoding (optional) for the non-streaming path
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Progress bars (optional) - falls back to time-throttled progress lines
+try:
+    from tqdm import tqdm
+    TQDM_AVAILABLE = True
+except ImportError:
+    TQDM_AVAILABLE = False
+
+# Rows per server-side transaction when apoc.periodic.iterate is used
+APOC_BATCH_SIZE = 10000
+
+# Minimum seconds between fallback progress lines
+PROGRESS_INTERVAL = 2.0
+
+
+@lru_cache(maxsize=4096)
+def _hash_id(text: str) -> str:
+    """md5-based id, matching the parsers' _generate_id so Person ids line up"""
+    return hashlib.md5(text.encode()).hexdigest()[:12]
+
+
+def _to_datetime(value: Optional[str]) -> Optional[DateTime]:
+    """Parse an ISO timestamp client-side, as Cypher's datetime() would
+
+    Naive timestamps are taken as UTC so the stored type stays DateTime
+    rather than LocalDateTime.
+    """
+    if value is None:
+        return None
+    dt = DateTime.from_iso_format(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def _check_iterate(record) -> int:
+    """committedOperations of an apoc.periodic.iterate call; raises if any batch failed
+
+    Failed batches are rolled back server-side while the call itself
+    succeeds, so without this check rows would be lost silently.
+    """
+    if record['failedBatches'] or record['errorMessages']:
+        errors = '; '.join(record['errorMessages'])
+        raise RuntimeError(f"apoc.periodic.iterate: {record['failedBatches']} batches failed: {errors}")
+    return record['committedOperations']
+
+
+def _write_op_variants(query: str) -> Dict[str, str]:
+    """CREATE and MERGE variants of a query written with a WRITE_OP placeholder"""
+    return {op: query.replace('WRITE_OP', op) for op in ('CREATE', 'MERGE')}
+
+
+class _ThrottledProgress:
+    """Minimal tqdm stand-in printing at most one line per PROGRESS_INTERVAL"""
+
+    def __init__(self, total: int, desc: str):
+        self.total = total
+        self.desc = desc
+        self.n = 0
+        self._last_print = time.monotonic()
+
+    def update(self, n: int):
+        self.n += n
+        now = time.monotonic()
+        if now - self._last_print >= PROGRESS_INTERVAL:
+            self._last_print = now
+            print(f"    Progress: {self.n}/{self.total} {self.desc}")
+
+    def close(self):
+        pass
+
+
+def _progress(total: int, desc: str):
+    """Progress tracker for batch loops; the phase's [OK] line reports the total"""
+    if TQDM_AVAILABLE:
+        return tqdm(total=total, desc=f"    {desc}", unit="rows", leave=False)
+    return _ThrottledProgress(total, desc)
+
+
+def _iter_json_items(json_file: str, prefix: str):
+    """Yield the items of one top-level JSON array, streaming from disk"""
+    with open(json_file, 'rb') as f:
+        # use_float keeps numbers as floats - the driver can't send Decimal
+        yield from ijson.items(f, f'{prefix}.item', use_float=True)
+
+
+def _read_json_sections(json_file: str, skip: str) -> Dict:
+    """Build every top-level value except `skip` in one streaming pass"""
+    sections = {}
+    key, builder = None, None
+    with open(json_file, 'rb') as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if prefix:
+                if builder is not None:
+                    builder.event(event, value)
+            elif event in ('map_key', 'end_map'):
+                if builder is not None:
+                    sections[key] = builder.value
+                key = value
+                builder = ijson.ObjectBuilder() if event == 'map_key' and value != skip else None
+    return sections
+
+
+def read_chat_json(json_file: str) -> Dict:
+    """Read a WhatsApp chat export for load_whatsapp_chat
+
+    With ijson installed, 'messages' is a generator streamed from the file
+    (the bulk of an export), so message text is never all in memory at
+    once; the small sections are built in one earlier pass. Without ijson
+    the whole file is decoded at once, with orjson when installed.
+    """
+    if not IJSON_AVAILABLE:
+        with open(json_file, 'rb') as f:
+            if ORJSON_AVAILABLE:
+                return orjson.loads(f.read())
+            return json.load(f)
+
+    chat_data = _read_json_sections(json_file, skip='messages')
+    chat_data['messages'] = _iter_json_items(json_file, 'messages')
+    return chat_data
+
+
+# Cypher is kept in module constants so every batch sends the identical query
+# string (one server plan-cache entry each) and can be EXPLAINed on its own.
+# Queries run through _write_rows bind `row`. Temporal parameters arrive as
+# DateTime values (_to_datetime), so the server doesn't parse them per row.
+# WRITE_OP queries come in a CREATE (cold load) and a MERGE (incremental)
+# variant; Person entities are always MERGEd since sources share them.
+
+_Q_MERGE_CONVERSATION = """
+    MERGE (s:Source:Conversation:WhatsAppGroup {id: $id})
+    SET s.group_name = $group_name,
+        s.title = $group_name,
+        s.created_date = $created_date,
+        s.export_date = $export_date,
+        s.participant_count = $participant_count,
+        s.message_count = $message_count,
+        s.date_range_start = $date_range_start,
+        s.date_range_end = $date_range_end,
+        s.date = $date,
+        s.source_file = $source_file,
+        s.source_type = 'whatsapp_chat',
+        s.platform = $platform,
+        s.conversation_type = $conversation_type
+"""
+
+_Q_PARTICIPANTS = _write_op_variants("""
+    UNWIND $participants as p
+    MERGE (e:Entity:Person {id: p.id})
+    SET e.name = p.name,
+        e.type = 'Person',
+        e.message_count = p.message_count,
+        e.media_shared_count = p.media_shared_count
+    WITH e, p
+    MATCH (c:Conversation {id: $conversation_id})
+    WRITE_OP (e)-[r:PARTICIPATES_IN]->(c)
+    SET r.first_message_date = p.first_message_date,
+        r.last_message_date = p.last_message_date,
+        r.message_count = p.message_count
+""")
+
+# OPTIONAL MATCH keeps messages whose sender isn't a participant
+_Q_MESSAGE = _write_op_variants("""
+    WRITE_OP (m:Message {id: row.id})
+    SET m.text = row.text,
+        m.sender = row.sender,
+        m.timestamp = row.timestamp,
+        m.message_type = row.message_type,
+        m.media_type = row.media_type,
+        m.is_forwarded = row.is_forwarded,
+        m.sequence_in_conversation = row.sequence_in_conversation,
+        m.conversation_id = row.conversation_id
+    WITH m, row
+    OPTIONAL MATCH (e:Entity:Person {id: row.sender_id})
+    FOREACH (_ IN CASE WHEN e IS NULL THEN [] ELSE [1] END |
+        WRITE_OP (m)-[:SENT_BY]->(e))
+    WITH DISTINCT m, row
+    MATCH (c:Conversation {id: row.conversation_id})
+    WRITE_OP (m)-[:IN_CONVERSATION]->(c)
+""")
+
+_Q_MESSAGE_FLOW = _write_op_variants("""
+    MATCH (m:Message {conversation_id: $conversation_id})
+    WITH m ORDER BY m.sequence_in_conversation
+    WITH collect(m) AS ms
+    UNWIND range(0, size(ms) - 2) AS i
+    WITH ms[i] AS m1, ms[i + 1] AS m2
+    WRITE_OP (m1)-[:NEXT_MESSAGE]->(m2)
+    RETURN count(*) AS links
+""")
+
+# Chunk boundaries share timestamps at minute resolution, so each message
+# takes the earliest chunk that contains it
+_Q_MESSAGE_IN_CHUNK = _write_op_variants("""
+    CALL {
+        WITH m
+        MATCH (c:Chunk)
+        WHERE c.source_id = m.conversation_id
+          AND c.time_start <= m.timestamp <= c.time_end
+        RETURN c ORDER BY c.sequence_number LIMIT 1
+    }
+    WRITE_OP (m)-[:IN_CHUNK]->(c)
+""")
+
+_Q_LINK_MESSAGES_TO_CHUNKS = {
+    op: "MATCH (m:Message {conversation_id: $conversation_id})" + query + "RETURN count(*) AS links"
+    for op, query in _Q_MESSAGE_IN_CHUNK.items()
+}
+
+# Streams messages through the join in 1000-row transactions
+_Q_LINK_MESSAGES_TO_CHUNKS_APOC = """
+    CALL apoc.periodic.iterate(
+        'MATCH (m:Message {conversation_id: $conversation_id}) RETURN m',
+        $query,
+        {batchSize: 1000, parallel: false, params: {conversation_id: $conversation_id}}
+    ) YIELD committedOperations, failedBatches, errorMessages
+    RETURN committedOperations, failedBatches, errorMessages
+"""
+
+_Q_CHUNK_PARTOF = _write_op_variants("""
+    UNWIND $chunks as chunk
+    WRITE_OP (c:Chunk {id: chunk.id})
+    SET c.text = chunk.text,
+        c.sequence_number = chunk.sequence_number,
+        c.importance_score = chunk.importance_score,
+        c.source_id = chunk.source_id,
+        c.source_title = chunk.source_title,
+        c.source_date = chunk.source_date,
+        c.source_type = chunk.source_type,
+        c.participants = chunk.participants,
+        c.message_count = chunk.message_count,
+        c.time_start = chunk.time_start,
+        c.time_end = chunk.time_end,
+        c.chunk_duration_minutes = chunk.chunk_duration_minutes,
+        c.has_media = chunk.has_media,
+        c.media_count = chunk.media_count
+    WITH c
+    MATCH (s:Source {id: $source_id})
+    WRITE_OP (c)-[:PART_OF]->(s)
+""")
+
+# Labels can't be parameterised, so there is one query per label suffix
+_ENTITY_LABELS = ('Person', 'Organization', 'Topic', 'Country')
+_Q_MERGE_ENTITY = {
+    suffix: f"""
+    UNWIND $entities as entity
+    MERGE (e:Entity{suffix} {{id: entity.id}})
+    SET e.name = entity.name,
+        e.type = entity.type,
+        e.role = entity.role,
+        e.organization = entity.organization,
+        e.org_type = entity.org_type,
+        e.status = entity.status
+"""
+    for suffix in [''] + [f':{label}' for label in _ENTITY_LABELS]
+}
+
+_Q_NEXT_CHUNK = _write_op_variants("""
+    UNWIND $links as link
+    MATCH (c1:Chunk {id: link.current_id})
+    MATCH (c2:Chunk {id: link.next_id})
+    WRITE_OP (c1)-[:NEXT_CHUNK]->(c2)
+""")
+
+_Q_MENTIONS = _write_op_variants("""
+    MATCH (c:Chunk {id: row.chunk_id})
+    MATCH (e:Entity {id: row.entity_id})
+    WRITE_OP (c)-[:MENTIONS]->(e)
+""")
+
+# Cold-start LOAD CSV queries (bulk_import_csv). CSV fields arrive as strings,
+# so they are converted back here; ';'-joined fields are lists. Entities and
+# participants share Person ids, so only those are MERGEd.
+
+_Q_CSV_PARTICIPANTS = """
+    LOAD CSV WITH HEADERS FROM $url AS row
+    CALL {
+        WITH row
+        MERGE (e:Entity:Person {id: row.id})
+        SET e.name = row.name,
+            e.type = 'Person',
+            e.message_count = toInteger(row.message_count),
+            e.media_shared_count = toInteger(row.media_shared_count)
+        WITH e, row
+        MATCH (c:Conversation {id: $conversation_id})
+        CREATE (e)-[r:PARTICIPATES_IN]->(c)
+        SET r.first_message_date = datetime(row.first_message_date),
+            r.last_message_date = datetime(row.last_message_date),
+            r.message_count = toInteger(row.message_count)
+    } IN TRANSACTIONS OF 10000 ROWS
+"""
+
+_Q_CSV_ENTITY = {
+    suffix: f"""
+    LOAD CSV WITH HEADERS FROM $url AS row
+    CALL {{
+        WITH row
+        MERGE (e:Entity{suffix} {{id: row.id}})
+        SET e.name = row.name,
+            e.type = row.type,
+            e.role = row.role,
+            e.organization = row.organization,
+            e.org_type = row.org_type,
+            e.status = row.status
+    }} IN TRANSACTIONS OF 10000 ROWS
+"""
+    for suffix in _Q_MERGE_ENTITY
+}
+
+_Q_CSV_CHUNKS = """
+    LOAD CSV WITH HEADERS FROM $url AS row
+    CALL {
+        WITH row
+        CREATE (c:Chunk {id: row.id})
+        SET c.text = row.text,
+            c.sequence_number = toInteger(row.sequence_number),
+            c.importance_score = toFloat(row.importance_score),
+            c.source_id = row.source_id,
+            c.source_title = row.source_title,
+            c.source_date = row.source_date,
+            c.source_type = row.source_type,
+            c.participants = CASE WHEN row.participants IS NULL THEN [] ELSE split(row.participants, ';') END,
+            c.message_count = toInteger(row.message_count),
+            c.time_start = datetime(row.time_start),
+            c.time_end = datetime(row.time_end),
+            c.chunk_duration_minutes = toFloat(row.chunk_duration_minutes),
+            c.has_media = toBoolean(row.has_media),
+            c.media_count = toInteger(row.media_count)
+        WITH c
+        MATCH (s:Source {id: $conversation_id})
+        CREATE (c)-[:PART_OF]->(s)
+    } IN TRANSACTIONS OF 10000 ROWS
+"""
+
+_Q_CSV_MESSAGES = """
+    LOAD CSV WITH HEADERS FROM $url AS row
+    CALL {
+        WITH row
+        CREATE (m:Message {id: row.id})
+        SET m.text = row.text,
+            m.sender = row.sender,
+            m.timestamp = datetime(row.timestamp),
+            m.message_type = row.message_type,
+            m.media_type = row.media_type,
+            m.is_forwarded = toBoolean(row.is_forwarded),
+            m.sequence_in_conversation = toInteger(row.sequence_in_conversation),
+            m.conversation_id = row.conversation_id
+        WITH m, row
+        OPTIONAL MATCH (e:Entity:Person {id: row.sender_id})
+        FOREACH (_ IN CASE WHEN e IS NULL THEN [] ELSE [1] END |
+            CREATE (m)-[:SENT_BY]->(e))
+        WITH m, row
+        MATCH (c:Conversation {id: row.conversation_id})
+        CREATE (m)-[:IN_CONVERSATION]->(c)
+    } IN TRANSACTIONS OF 10000 ROWS
+"""
+
+_Q_CSV_NEXT_CHUNK = """
+    LOAD CSV WITH HEADERS FROM $url AS row
+    CALL {
+        WITH row
+        MATCH (c1:Chunk {id: row.start_id})
+        MATCH (c2:Chunk {id: row.end_id})
+        CREATE (c1)-[:NEXT_CHUNK]->(c2)
+    } IN TRANSACTIONS OF 10000 ROWS
+"""
+
+_Q_CSV_MENTIONS = """
+    LOAD CSV WITH HEADERS FROM $url AS row
+    CALL {
+        WITH row
+        MATCH (c:Chunk {id: row.start_id})
+        MATCH (e:Entity {id: row.end_id})
+        CREATE (c)-[:MENTIONS]->(e)
+    } IN TRANSACTIONS OF 10000 ROWS
+"""
+
 
 class UnifiedRAGNeo4jLoader:
     """Load RAG-optimized knowledge graph with support for multiple source types"""
 
-    def __init__(self, uri: str, user: str, password: str):
+    def __init__(self, uri: str, user: str, password: str, database: str = "neo4j",
+                 max_workers: int = 8, node_batch: int = 1000, rel_batch: int = 10000):
         # For bolt+s:// URIs with Aura, we need to use certifi certificates
         ssl_context = ssl.create_default_context(cafile=certifi.where())
 
-        # Connect with SSL context
+        # Connect with SSL context. Phase sessions and the batch sessions they
+        # fan out to can both be open, so the pool covers twice max_workers;
+        # the larger fetch_size streams get_stats results in fewer round-trips
         self.driver = GraphDatabase.driver(
             uri,
             auth=(user, password),
-            ssl_context=ssl_context
+            ssl_context=ssl_context,
+            max_connection_pool_size=max(32, 2 * max_workers),
+            connection_acquisition_timeout=60,
+            connection_timeout=30,
+            keep_alive=True,
+            fetch_size=10000
         )
+        # Naming the database explicitly skips home-database resolution per session
+        self.database = database
+        # Worker threads for concurrent phases and batches (one session each)
+        self.max_workers = max_workers
+        # Client-side batch sizes: node MERGEs set many properties and take more
+        # locks; relationship-only rows are two ids, so they batch much larger
+        self._node_batch = node_batch
+        self._rel_batch = rel_batch
+        # Whether the server has APOC (probed lazily on first bulk write)
+        self._apoc_available = None
         print(f"[OK] Connected to Neo4j at {uri}")
 
     def close(self):
         self.driver.close()
 
+    @staticmethod
+    def _run_write(tx, query, **params):
+        """Transaction function for session.execute_write"""
+        tx.run(query, **params).consume()
+
+    @staticmethod
+    def _run_write_single(tx, query, **params):
+        """Transaction function for session.execute_write returning one record"""
+        return tx.run(query, **params).single()
+
+    def _run_phases(self, phases):
+        """Run independent load phases concurrently, one session per worker"""
+
+        def run(phase):
+            method, args = phase[0], phase[1:]
+            with self.driver.session(database=self.database) as session:
+                return method(session, *args)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(run, phase) for phase in phases]
+            return [future.result() for future in futures]
+
+    def _write_parallel(self, query, rows, batch_size, label):
+        """Write UNWIND batches ($rows) from worker threads, one session each"""
+
+        def write(batch):
+            with self.driver.session(database=self.database) as session:
+                session.execute_write(self._run_write, query, rows=batch)
+            return len(batch)
+
+        batches = [rows[i:i + batch_size] for i in range(0, len(rows), batch_size)]
+        total = 0
+        progress = _progress(len(rows), label)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for written in executor.map(write, batches):
+                total += written
+                progress.update(written)
+
+        progress.close()
+        return total
+
+    def _has_apoc(self, session) -> bool:
+        """Check once whether apoc.periodic.iterate can be used"""
+        if self._apoc_available is None:
+            try:
+                session.run("RETURN apoc.version() AS version").single()
+                self._apoc_available = True
+            except Exception:
+                self._apoc_available = False
+                print("  [WARN] APOC not available - using client-side batches")
+        return self._apoc_available
+
+    def _write_rows(self, session, query, rows, batch_size, label, parallel=False):
+        """Write rows bound to `row`, batched server-side when possible
+
+        With APOC the full list goes over Bolt once and apoc.periodic.iterate
+        commits it in server-side batches; otherwise rows are sent in
+        client-side UNWIND batches (dispatched concurrently if `parallel`).
+        Server-side batches run one at a time: they write relationships to
+        shared nodes (Conversation, Person, popular entities), and parallel
+        batches deadlock on those locks beyond APOC's retries. Client-side
+        batches are retried on deadlock by execute_write.
+        """
+        if not rows:
+            return 0
+
+        if self._has_apoc(session):
+            record = session.run("""
+                CALL apoc.periodic.iterate(
+                    'UNWIND $rows AS row RETURN row',
+                    $query,
+                    {batchSize: $batch_size, parallel: false, retries: 3, params: {rows: $rows}}
+                ) YIELD committedOperations, failedBatches, errorMessages
+                RETURN committedOperations, failedBatches, errorMessages
+            """, query=query, rows=rows, batch_size=APOC_BATCH_SIZE).single()
+            return _check_iterate(record)
+
+        batch_query = "UNWIND $rows AS row\n" + query
+        if parallel:
+            return self._write_parallel(batch_query, rows, batch_size, label)
+
+        total = 0
+        progress = _progress(len(rows), label)
+        for i in range(0, len(rows), batch_size):
+            batch = rows[i:i + batch_size]
+            session.execute_write(self._run_write, batch_query, rows=batch)
+            total += len(batch)
+            progress.update(len(batch))
+        progress.close()
+        return total
+
     def clear_database(self):
         """Clear all data - use with caution!"""
         print("\n[WARN] Clearing database...")
-        with self.driver.session() as session:
+        with self.driver.session(database=self.database) as session:
             session.run("MATCH (n) DETACH DELETE n")
         print("[OK] Database cleared")
 
@@ -63,6 +572,7 @@ class UnifiedRAGNeo4jLoader:
             "CREATE INDEX chunk_source IF NOT EXISTS FOR (c:Chunk) ON (c.source_id)",
             "CREATE INDEX chunk_source_type IF NOT EXISTS FOR (c:Chunk) ON (c.source_type)",
             "CREATE INDEX chunk_importance IF NOT EXISTS FOR (c:Chunk) ON (c.importance_score)",
+            "CREATE INDEX chunk_time_start IF NOT EXISTS FOR (c:Chunk) ON (c.time_start)",
 
             # Full-text search
             "CREATE FULLTEXT INDEX chunk_text IF NOT EXISTS FOR (c:Chunk) ON EACH [c.text]",
@@ -79,37 +589,50 @@ class UnifiedRAGNeo4jLoader:
             "CREATE INDEX message_timestamp IF NOT EXISTS FOR (m:Message) ON (m.timestamp)",
             "CREATE INDEX message_sender IF NOT EXISTS FOR (m:Message) ON (m.sender)",
             "CREATE INDEX message_conversation IF NOT EXISTS FOR (m:Message) ON (m.conversation_id)",
+            "CREATE INDEX message_sequence IF NOT EXISTS FOR (m:Message) ON (m.sequence_in_conversation)",
 
             # Backward compatibility (old meeting indexes)
             "CREATE INDEX chunk_meeting IF NOT EXISTS FOR (c:Chunk) ON (c.meeting_id)",
             "CREATE INDEX meeting_date IF NOT EXISTS FOR (m:Meeting) ON (m.date)"
         ]
 
-        with self.driver.session() as session:
-            for constraint in constraints:
-                try:
-                    session.run(constraint)
-                except Exception as e:
-                    if "already exists" not in str(e).lower() and "equivalent" not in str(e).lower():
-                        print(f"  [WARN] {e}")
+        # Constraints before indexes; each group is issued concurrently
+        self._run_schema_statements(constraints)
+        self._run_schema_statements(indexes)
+
+        print("[OK] Unified RAG schema created")
+
+    def _run_schema_statements(self, statements, max_workers: int = 4):
+        """Run DDL statements concurrently, one session each
 
-            for index in indexes:
+        IF NOT EXISTS only covers a same-named schema object; an equivalent
+        one under another name (e.g. from the RAG loader) still raises, so
+        those errors are filtered rather than reported.
+        """
+
+        def run(statement):
+            with self.driver.session(database=self.database) as session:
                 try:
-                    session.run(index)
+                    session.run(statement).consume()
                 except Exception as e:
                     if "already exists" not in str(e).lower() and "equivalent" not in str(e).lower():
                         print(f"  [WARN] {e}")
 
-        print("[OK] Unified RAG schema created")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(run, statements))
 
-    def load_whatsapp_chat(self, chat_data: Dict):
+    def load_whatsapp_chat(self, chat_data: Dict, cold_load: bool = False):
         """
         Load WhatsApp chat data
 
+        With cold_load (an empty database, e.g. right after clear_database)
+        messages, chunks and links are CREATEd, skipping MERGE's lookup.
+
         Expected structure:
         {
             'conversation': {...},
-            'messages': [...],
+            'messages': [...],            # any iterable, e.g. from read_chat_json
+
             'chunks': [...],
             'participants': [...],
             'entities': [...],
@@ -118,289 +641,323 @@ class UnifiedRAGNeo4jLoader:
         """
         print(f"\n[LOG] Loading WhatsApp chat: {chat_data['conversation']['group_name']}")
 
-        # Load conversation (as Source)
-        self._load_conversation(chat_data['conversation'])
+        conversation_id = chat_data['conversation']['id']
+        write_op = 'CREATE' if cold_load else 'MERGE'
 
-        # Load participants (as Entity:Person)
-        self._load_participants(chat_data['participants'], chat_data['conversation']['id'])
+        # Resolve senders to participant entity ids so SENT_BY matches on the
+        # unique id constraint rather than the non-unique name index
+        sender_ids = {p['name']: self._generate_id(p['name']) for p in chat_data['participants']}
 
-        # Load entities
-        if chat_data.get('entities'):
-            self._load_entities_list(chat_data['entities'])
+        # Load conversation (as Source) - everything else links to it
+        self._run_phases([
+            (self._load_conversation, chat_data['conversation']),
+        ])
 
-        # Load messages
-        self._load_messages(chat_data['messages'])
+        # Participants (as Entity:Person), entities and chunks are independent
+        phases = [
+            (self._load_participants, chat_data['participants'], conversation_id, write_op),
+            (self._load_chunks_list, chat_data['chunks'], conversation_id, write_op),
+        ]
+        if chat_data.get('entities'):
+            phases.append((self._load_entities_list, chat_data['entities']))
+        self._run_phases(phases)
 
-        # Load chunks
-        self._load_chunks_list(chat_data['chunks'], chat_data['conversation']['id'])
+        # Messages need their senders; chunk links need chunks and entities
+        phases = [
+            (self._load_messages, chat_data['messages'], sender_ids, write_op),
+            (self._create_chunk_flow_from_list, chat_data['chunks'], write_op),
+        ]
+        if chat_data.get('chunk_entity_links'):
+            phases.append((self._link_chunks_to_entities_from_list, chat_data['chunks'],
+                           chat_data['chunk_entity_links'], write_op))
+        self._run_phases(phases)
 
-        # Link messages to chunks
-        self._link_messages_to_chunks(chat_data['messages'], chat_data['chunks'])
+        # Message flow and message-chunk links once messages exist
+        self._run_phases([
+            (self._create_message_flow, conversation_id, write_op),
+            (self._link_messages_to_chunks, conversation_id, write_op),
+        ])
 
-        # Create chunk flow
-        self._create_chunk_flow_from_list(chat_data['chunks'])
+        print(f"[OK] WhatsApp chat loaded successfully")
 
-        # Link chunks to entities
-        if chat_data.get('chunk_entity_links'):
-            self._link_chunks_to_entities_from_list(chat_data['chunks'], chat_data['chunk_entity_links'])
+    def bulk_import_csv(self, chat_data: Dict, import_dir: str):
+        """
+        Cold-start load of a WhatsApp chat through LOAD CSV
+
+        Writes node and relationship CSVs into `import_dir`, which must be the
+        server's import directory (file:/// URLs resolve against it), then
+        loads each with CALL {...} IN TRANSACTIONS. Messages, chunks and links
+        are CREATEd, so use this on an empty database (after clear_database);
+        load_whatsapp_chat remains the MERGE path for incremental updates.
+        Not usable on Aura, which can't read local files.
+        """
+        print(f"\n[LOG] Bulk importing WhatsApp chat: {chat_data['conversation']['group_name']}")
+
+        conversation_id = chat_data['conversation']['id']
+        sender_ids = {p['name']: self._generate_id(p['name']) for p in chat_data['participants']}
+
+        os.makedirs(import_dir, exist_ok=True)
+
+        def write(name, header, rows):
+            with open(os.path.join(import_dir, name), 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=header, extrasaction='ignore')
+                writer.writeheader()
+                count = 0
+                for row in rows:
+                    writer.writerow(row)
+                    count += 1
+            return count
+
+        def array(values):
+            return ';'.join(str(v) for v in values or [])
+
+        chunks = chat_data['chunks']
+        chunk_ids = [c['id'] for c in sorted(chunks, key=lambda c: c['sequence_number'])]
+
+        files = {}
+        files['participants.csv'] = write('participants.csv', [
+            'id', 'name', 'message_count', 'media_shared_count', 'first_message_date', 'last_message_date'
+        ], self._participant_rows(chat_data['participants']))
+
+        entities_by_label = {}
+        for entity in chat_data.get('entities') or []:
+            props = entity.get('properties', {})
+            label_suffix = f":{entity['type']}" if entity['type'] in _ENTITY_LABELS else ""
+            entities_by_label.setdefault(label_suffix, []).append(
+                {'id': entity['id'], 'name': entity['name'], 'type': entity['type'], **props}
+            )
+        entity_files = {}
+        for label_suffix, rows in entities_by_label.items():
+            name = f"entities{label_suffix.replace(':', '_').lower()}.csv"
+            files[name] = write(name, ['id', 'name', 'type', 'role', 'organization', 'org_type', 'status'], rows)
+            entity_files[name] = label_suffix
+
+        files['chunks.csv'] = write('chunks.csv', [
+            'id', 'text', 'sequence_number', 'importance_score', 'source_id', 'source_title',
+            'source_date', 'source_type', 'participants', 'message_count', 'time_start', 'time_end',
+            'chunk_duration_minutes', 'has_media', 'media_count'
+        ], ({**c, 'participants': array(c.get('participants'))} for c in chunks))
+
+        # Messages are written as they stream in, never held as a list
+        files['messages.csv'] = write('messages.csv', [
+            'id', 'text', 'sender', 'sender_id', 'timestamp', 'message_type', 'media_type',
+            'is_forwarded', 'sequence_in_conversation', 'conversation_id'
+        ], ({**m, 'sender_id': sender_ids.get(m['sender'])} for m in chat_data['messages']))
+
+        files['next_chunk.csv'] = write('next_chunk.csv', ['start_id', 'end_id'], (
+            {'start_id': a, 'end_id': b} for a, b in zip(chunk_ids, chunk_ids[1:])
+        ))
+
+        # Chunk sequences index the chunk list; duplicate links are dropped
+        mentions = dict.fromkeys(
+            (chunks[link['chunk_sequence']]['id'], link['entity_id'])
+            for link in chat_data.get('chunk_entity_links') or []
+            if link['chunk_sequence'] < len(chunks)
+        )
+        files['mentions.csv'] = write('mentions.csv', ['start_id', 'end_id'], (
+            {'start_id': a, 'end_id': b} for a, b in mentions
+        ))
 
-        print(f"[OK] WhatsApp chat loaded successfully")
+        print(f"  [OK] CSVs written to {import_dir}")
 
-    def _load_conversation(self, conversation: Dict):
-        """Load conversation as Source node"""
-        print(f"  [LOG] Loading conversation...")
+        # Same dependency waves as load_whatsapp_chat
+        self._run_phases([(self._load_conversation, chat_data['conversation'])])
 
-        with self.driver.session() as session:
-            session.run("""
-                MERGE (s:Source:Conversation:WhatsAppGroup {id: $id})
-                SET s.group_name = $group_name,
-                    s.title = $group_name,
-                    s.created_date = datetime($created_date),
-                    s.export_date = datetime($export_date),
-                    s.participant_count = $participant_count,
-                    s.message_count = $message_count,
-                    s.date_range_start = datetime($date_range_start),
-                    s.date_range_end = datetime($date_range_end),
-                    s.date = $date_range_start,
-                    s.source_file = $source_file,
-                    s.source_type = 'whatsapp_chat',
-                    s.platform = $platform,
-                    s.conversation_type = $conversation_type
-            """, **conversation)
+        phases = [
+            (self._load_csv, _Q_CSV_PARTICIPANTS, 'participants.csv', files, conversation_id),
+            (self._load_csv, _Q_CSV_CHUNKS, 'chunks.csv', files, conversation_id),
+        ]
+        phases.extend(
+            (self._load_csv, _Q_CSV_ENTITY[label_suffix], name, files, conversation_id)
+            for name, label_suffix in entity_files.items()
+        )
+        self._run_phases(phases)
 
-        print(f"  [OK] Conversation: {conversation['group_name']}")
+        self._run_phases([
+            (self._load_csv, _Q_CSV_MESSAGES, 'messages.csv', files, conversation_id),
+            (self._load_csv, _Q_CSV_NEXT_CHUNK, 'next_chunk.csv', files, conversation_id),
+            (self._load_csv, _Q_CSV_MENTIONS, 'mentions.csv', files, conversation_id),
+        ])
 
-    def _load_participants(self, participants: List[Dict], conversation_id: str):
-        """Load participants as Entity:Person nodes and link to conversation"""
-        print(f"  [LOG] Loading {len(participants)} participants...")
+        self._run_phases([
+            (self._create_message_flow, conversation_id, 'CREATE'),
+            (self._link_messages_to_chunks, conversation_id, 'CREATE'),
+        ])
 
-        with self.driver.session() as session:
-            for participant in participants:
-                # Create entity
-                entity_id = self._generate_id(participant['name'])
-                session.run("""
-                    MERGE (e:Entity:Person {id: $id})
-                    SET e.name = $name,
-                        e.type = 'Person',
-                        e.message_count = $message_count,
-                        e.media_shared_count = $media_shared_count
-                """,
-                    id=entity_id,
-                    name=participant['name'],
-                    message_count=participant.get('message_count', 0),
-                    media_shared_count=participant.get('media_shared_count', 0)
-                )
-
-                # Link to conversation
-                session.run("""
-                    MATCH (e:Entity:Person {id: $entity_id})
-                    MATCH (c:Conversation {id: $conversation_id})
-                    MERGE (e)-[r:PARTICIPATES_IN]->(c)
-                    SET r.first_message_date = datetime($first_message_date),
-                        r.last_message_date = datetime($last_message_date),
-                        r.message_count = $message_count
-                """,
-                    entity_id=entity_id,
-                    conversation_id=conversation_id,
-                    first_message_date=participant.get('first_message_date'),
-                    last_message_date=participant.get('last_message_date'),
-                    message_count=participant.get('message_count', 0)
-                )
+        print("[OK] WhatsApp chat bulk imported")
 
-        print(f"  [OK] {len(participants)} participants loaded")
+    def _load_csv(self, session, query: str, name: str, files: Dict[str, int], conversation_id: str):
+        """Run one LOAD CSV import of a file written by bulk_import_csv"""
+        if not files[name]:
+            return
 
-    def _load_messages(self, messages: List[Dict]):
-        """Load individual WhatsApp messages"""
-        print(f"  [LOG] Loading {len(messages)} messages...")
+        # CALL {...} IN TRANSACTIONS must run in an auto-commit transaction
+        session.run(query, url=f"file:///{name}", conversation_id=conversation_id).consume()
 
-        # Batch processing for performance
-        batch_size = 500
-        total_loaded = 0
+        print(f"  [OK] {files[name]} rows loaded from {name}")
 
-        for i in range(0, len(messages), batch_size):
-            batch = messages[i:i + batch_size]
-
-            with self.driver.session() as session:
-                session.run("""
-                    UNWIND $messages as msg
-                    MERGE (m:Message {id: msg.id})
-                    SET m.text = msg.text,
-                        m.sender = msg.sender,
-                        m.timestamp = datetime(msg.timestamp),
-                        m.message_type = msg.message_type,
-                        m.media_type = msg.media_type,
-                        m.is_forwarded = msg.is_forwarded,
-                        m.sequence_in_conversation = msg.sequence_in_conversation,
-                        m.conversation_id = msg.conversation_id
-                """, messages=batch)
-
-                # Link messages to sender (Entity:Person)
-                session.run("""
-                    UNWIND $messages as msg
-                    MATCH (m:Message {id: msg.id})
-                    MATCH (e:Entity:Person {name: msg.sender})
-                    MERGE (m)-[:SENT_BY]->(e)
-                """, messages=batch)
-
-                # Link messages to conversation
-                session.run("""
-                    UNWIND $messages as msg
-                    MATCH (m:Message {id: msg.id})
-                    MATCH (c:Conversation {id: msg.conversation_id})
-                    MERGE (m)-[:IN_CONVERSATION]->(c)
-                """, messages=batch)
-
-                total_loaded += len(batch)
-
-            if total_loaded % 2000 == 0 or total_loaded >= len(messages):
-                print(f"    Progress: {total_loaded}/{len(messages)} messages loaded")
-
-        # Create message flow (NEXT_MESSAGE relationships)
-        self._create_message_flow(messages)
-
-        print(f"  [OK] {len(messages)} messages loaded")
-
-    def _create_message_flow(self, messages: List[Dict]):
-        """Create NEXT_MESSAGE relationships"""
-        print(f"  [LOG] Creating message flow...")
+    def _load_conversation(self, session, conversation: Dict):
+        """Load conversation as Source node"""
+        print(f"  [LOG] Loading conversation...")
 
-        # Sort by sequence
-        sorted_messages = sorted(messages, key=lambda m: m['sequence_in_conversation'])
+        params = dict(conversation)
+        params['date'] = conversation.get('date_range_start')
+        for key in ('created_date', 'export_date', 'date_range_start', 'date_range_end'):
+            params[key] = _to_datetime(conversation.get(key))
 
-        # Create relationships in batches
-        batch_size = 500
-        links = []
+        session.execute_write(self._run_write, _Q_MERGE_CONVERSATION, **params)
 
-        for i in range(len(sorted_messages) - 1):
-            links.append({
-                'current_id': sorted_messages[i]['id'],
-                'next_id': sorted_messages[i + 1]['id']
-            })
+        print(f"  [OK] Conversation: {conversation['group_name']}")
 
-        total_links = 0
-        for i in range(0, len(links), batch_size):
-            batch = links[i:i + batch_size]
+    def _load_participants(self, session, participants: List[Dict], conversation_id: str,
+                           write_op: str = 'MERGE'):
+        """Load participants as Entity:Person nodes and link to conversation"""
+        print(f"  [LOG] Loading {len(participants)} participants...")
 
-            with self.driver.session() as session:
-                session.run("""
-                    UNWIND $links as link
-                    MATCH (m1:Message {id: link.current_id})
-                    MATCH (m2:Message {id: link.next_id})
-                    MERGE (m1)-[:NEXT_MESSAGE]->(m2)
-                """, links=batch)
+        rows = [
+            {**row,
+             'first_message_date': _to_datetime(row['first_message_date']),
+             'last_message_date': _to_datetime(row['last_message_date'])}
+            for row in self._participant_rows(participants)
+        ]
 
-                total_links += len(batch)
+        # Person MERGE and conversation link in one statement per batch
+        batch_size = self._node_batch
+        for i in range(0, len(rows), batch_size):
+            session.execute_write(self._run_write, _Q_PARTICIPANTS[write_op],
+                                  participants=rows[i:i + batch_size], conversation_id=conversation_id)
 
-        print(f"  [OK] {total_links} NEXT_MESSAGE links created")
+        print(f"  [OK] {len(participants)} participants loaded")
 
-    def _link_messages_to_chunks(self, messages: List[Dict], chunks: List[Dict]):
-        """Link messages to their parent chunks"""
-        print(f"  [LOG] Linking messages to chunks...")
+    def _participant_rows(self, participants: List[Dict]) -> List[Dict]:
+        """Participant rows keyed by their Person entity id"""
+        return [
+            {
+                'id': self._generate_id(participant['name']),
+                'name': participant['name'],
+                'message_count': participant.get('message_count', 0),
+                'media_shared_count': participant.get('media_shared_count', 0),
+                'first_message_date': participant.get('first_message_date'),
+                'last_message_date': participant.get('last_message_date')
+            }
+            for participant in participants
+        ]
 
-        # Build message ID to chunk ID mapping
-        # This requires matching timestamps
-        links = []
+    def _load_messages(self, session, messages: Iterable[Dict], sender_ids: Dict[str, str],
+                       write_op: str = 'MERGE'):
+        """Load individual WhatsApp messages
 
-        for message in messages:
-            msg_timestamp = message['timestamp']
+        Consumes `messages` in buffers, so it may be a stream.
+        """
+        print(f"  [LOG] Loading messages...")
 
-            # Find chunk that contains this message
-            for chunk in chunks:
-                chunk_start = chunk['time_start']
-                chunk_end = chunk['time_end']
+        total_loaded = 0
+        messages = iter(messages)
+
+        for batch in iter(lambda: list(islice(messages, APOC_BATCH_SIZE)), []):
+            # Copies: the caller's messages (also loaded into Postgres) stay untouched
+            rows = [
+                {**msg,
+                 'sender_id': sender_ids.get(msg['sender']),
+                 'timestamp': _to_datetime(msg['timestamp'])}
+                for msg in batch
+            ]
+            total_loaded += self._write_messages(session, rows, write_op)
+
+        print(f"  [OK] {total_loaded} messages loaded")
+
+    def _write_messages(self, session, messages: List[Dict], write_op: str = 'MERGE') -> int:
+        """Write one buffer of messages with their sender/conversation links"""
+        # Message, sender link and conversation link in one statement per
+        # batch; without APOC batches are written concurrently from worker
+        # sessions.
+        return self._write_rows(session, _Q_MESSAGE[write_op], messages, batch_size=self._node_batch,
+                                label="messages loaded", parallel=True)
+
+    def _create_message_flow(self, session, conversation_id: str, write_op: str = 'MERGE'):
+        """Create NEXT_MESSAGE relationships
+
+        Ordered and linked server-side from the loaded messages, so no id
+        pairs travel over Bolt.
+        """
+        print(f"  [LOG] Creating message flow...")
 
-                if chunk_start <= msg_timestamp <= chunk_end:
-                    links.append({
-                        'message_id': message['id'],
-                        'chunk_id': chunk['id']
-                    })
-                    break
+        total_links = session.execute_write(
+            self._run_write_single, _Q_MESSAGE_FLOW[write_op], conversation_id=conversation_id
+        )['links']
 
-        # Create relationships in batches
-        batch_size = 500
-        total_links = 0
+        print(f"  [OK] {total_links} NEXT_MESSAGE links created")
 
-        for i in range(0, len(links), batch_size):
-            batch = links[i:i + batch_size]
+    def _link_messages_to_chunks(self, session, conversation_id: str, write_op: str = 'MERGE'):
+        """Link messages to their parent chunks
 
-            with self.driver.session() as session:
-                session.run("""
-                    UNWIND $links as link
-                    MATCH (m:Message {id: link.message_id})
-                    MATCH (c:Chunk {id: link.chunk_id})
-                    MERGE (m)-[:IN_CHUNK]->(c)
-                """, links=batch)
+        Joined server-side on the chunk time window (see _Q_MESSAGE_IN_CHUNK).
+        """
+        print(f"  [LOG] Linking messages to chunks...")
 
-                total_links += len(batch)
+        if self._has_apoc(session):
+            # Auto-commit: apoc.periodic.iterate commits its own batches
+            total_links = _check_iterate(session.run(
+                _Q_LINK_MESSAGES_TO_CHUNKS_APOC, query=_Q_MESSAGE_IN_CHUNK[write_op],
+                conversation_id=conversation_id
+            ).single())
+        else:
+            total_links = session.execute_write(
+                self._run_write_single, _Q_LINK_MESSAGES_TO_CHUNKS[write_op], conversation_id=conversation_id
+            )['links']
 
         print(f"  [OK] {total_links} message-chunk links created")
 
-    def _load_chunks_list(self, chunks: List[Dict], source_id: str):
+    def _load_chunks_list(self, session, chunks: List[Dict], source_id: str, write_op: str = 'MERGE'):
         """Load chunks and link to source"""
         print(f"  [LOG] Loading {len(chunks)} chunks...")
 
-        with self.driver.session() as session:
-            for chunk in chunks:
-                # Load chunk
-                session.run("""
-                    MERGE (c:Chunk {id: $id})
-                    SET c.text = $text,
-                        c.sequence_number = $sequence_number,
-                        c.importance_score = $importance_score,
-                        c.source_id = $source_id,
-                        c.source_title = $source_title,
-                        c.source_date = $source_date,
-                        c.source_type = $source_type,
-                        c.participants = $participants,
-                        c.message_count = $message_count,
-                        c.time_start = datetime($time_start),
-                        c.time_end = datetime($time_end),
-                        c.chunk_duration_minutes = $chunk_duration_minutes,
-                        c.has_media = $has_media,
-                        c.media_count = $media_count
-                """, **chunk)
-
-                # Link to source
-                session.run("""
-                    MATCH (c:Chunk {id: $chunk_id})
-                    MATCH (s:Source {id: $source_id})
-                    MERGE (c)-[:PART_OF]->(s)
-                """, chunk_id=chunk['id'], source_id=source_id)
+        rows = [
+            {**chunk,
+             'time_start': _to_datetime(chunk['time_start']),
+             'time_end': _to_datetime(chunk['time_end'])}
+            for chunk in chunks
+        ]
+
+        # Chunk node and PART_OF link in one statement per batch
+        batch_size = self._node_batch
+        for i in range(0, len(rows), batch_size):
+            session.execute_write(self._run_write, _Q_CHUNK_PARTOF[write_op],
+                                  chunks=rows[i:i + batch_size], source_id=source_id)
 
         print(f"  [OK] {len(chunks)} chunks loaded")
 
-    def _load_entities_list(self, entities: List[Dict]):
+    def _load_entities_list(self, session, entities: List[Dict]):
         """Load entity nodes"""
         print(f"  [LOG] Loading {len(entities)} entities...")
 
-        with self.driver.session() as session:
-            for entity in entities:
-                props = entity.get('properties', {})
-                # Determine label based on type
-                entity_type = entity['type']
-                label_suffix = f":{entity_type}" if entity_type in ['Person', 'Organization', 'Topic', 'Country'] else ""
-                
-                session.run(f"""
-                    MERGE (e:Entity{label_suffix} {{id: $id}})
-                    SET e.name = $name,
-                        e.type = $type,
-                        e.role = $role,
-                        e.organization = $organization,
-                        e.org_type = $org_type,
-                        e.status = $status
-                """,
-                    id=entity['id'],
-                    name=entity['name'],
-                    type=entity['type'],
-                    role=props.get('role'),
-                    organization=props.get('organization'),
-                    org_type=props.get('org_type'),
-                    status=props.get('status')
-                )
+        # Group rows by label suffix - one query per label
+        rows_by_label = {}
+        for entity in entities:
+            props = entity.get('properties', {})
+            # Determine label based on type
+            entity_type = entity['type']
+            label_suffix = f":{entity_type}" if entity_type in _ENTITY_LABELS else ""
+
+            rows_by_label.setdefault(label_suffix, []).append({
+                'id': entity['id'],
+                'name': entity['name'],
+                'type': entity_type,
+                'role': props.get('role'),
+                'organization': props.get('organization'),
+                'org_type': props.get('org_type'),
+                'status': props.get('status')
+            })
+
+        batch_size = self._node_batch
+        for label_suffix, rows in rows_by_label.items():
+            for i in range(0, len(rows), batch_size):
+                session.execute_write(self._run_write, _Q_MERGE_ENTITY[label_suffix],
+                                      entities=rows[i:i + batch_size])
 
         print(f"  [OK] {len(entities)} entities loaded")
 
-    def _create_chunk_flow_from_list(self, chunks: List[Dict]):
+    def _create_chunk_flow_from_list(self, session, chunks: List[Dict], write_op: str = 'MERGE'):
         """Create NEXT_CHUNK relationships"""
         print(f"  [LOG] Creating chunk flow...")
 
@@ -415,64 +972,41 @@ class UnifiedRAGNeo4jLoader:
             })
 
         # Batch process
-        batch_size = 500
+        batch_size = self._rel_batch
         total_links = 0
 
         for i in range(0, len(links), batch_size):
             batch = links[i:i + batch_size]
 
-            with self.driver.session() as session:
-                session.run("""
-                    UNWIND $links as link
-                    MATCH (c1:Chunk {id: link.current_id})
-                    MATCH (c2:Chunk {id: link.next_id})
-                    MERGE (c1)-[:NEXT_CHUNK]->(c2)
-                """, links=batch)
+            session.execute_write(self._run_write, _Q_NEXT_CHUNK[write_op], links=batch)
 
-                total_links += len(batch)
+            total_links += len(batch)
 
         print(f"  [OK] {total_links} NEXT_CHUNK links created")
 
-    def _link_chunks_to_entities_from_list(self, chunks: List[Dict], chunk_entity_links: List[Dict]):
+    def _link_chunks_to_entities_from_list(self, session, chunks: List[Dict], chunk_entity_links: List[Dict],
+                                           write_op: str = 'MERGE'):
         """Create MENTIONS relationships"""
         print(f"  [LOG] Linking chunks to entities...")
 
-        # Build links with actual chunk IDs
-        links = []
-        for link in chunk_entity_links:
-            chunk_idx = link['chunk_sequence']
-            if chunk_idx < len(chunks):
-                links.append({
-                    'chunk_id': chunks[chunk_idx]['id'],
-                    'entity_id': link['entity_id']
-                })
-
-        # Batch process
-        batch_size = 500
-        total_links = 0
-
-        for i in range(0, len(links), batch_size):
-            batch = links[i:i + batch_size]
-
-            with self.driver.session() as session:
-                session.run("""
-                    UNWIND $links as link
-                    MATCH (c:Chunk {id: link.chunk_id})
-                    MATCH (e:Entity {id: link.entity_id})
-                    MERGE (c)-[:MENTIONS]->(e)
-                """, links=batch)
-
-                total_links += len(batch)
+        # Chunk sequences index the chunk list; duplicates are dropped so a
+        # CREATE load doesn't write the same MENTIONS twice
+        chunk_ids = [c['id'] for c in chunks]
+        pairs = dict.fromkeys(
+            (chunk_ids[link['chunk_sequence']], link['entity_id'])
+            for link in chunk_entity_links
+            if link['chunk_sequence'] < len(chunk_ids)
+        )
+        links = [{'chunk_id': chunk_id, 'entity_id': entity_id} for chunk_id, entity_id in pairs]
 
-            if total_links % 2000 == 0 or total_links >= len(links):
-                print(f"    Progress: {total_links}/{len(links)} MENTIONS links created")
+        total_links = self._write_rows(session, _Q_MENTIONS[write_op], links, batch_size=self._rel_batch,
+                                       label="MENTIONS links created")
 
         print(f"  [OK] {total_links} MENTIONS links created")
 
     def _generate_id(self, text: str) -> str:
         """Generate ID from text"""
-        import hashlib
-        return hashlib.md5(text.encode()).hexdigest()[:12]
+        return _hash_id(text)
 
     def get_stats(self):
         """Show database statistics"""
@@ -480,7 +1014,7 @@ class UnifiedRAGNeo4jLoader:
         print("UNIFIED RAG KNOWLEDGE GRAPH STATISTICS")
         print("="*70)
 
-        with self.driver.session() as session:
+        with self.driver.session(database=self.database) as session:
             # Node counts
             nodes = {
                 'Chunks': 'Chunk',
@@ -494,14 +1028,16 @@ class UnifiedRAGNeo4jLoader:
                 'Actions': 'Action'
             }
 
+            # One round-trip; each branch is answered from the count store
+            result = session.run(" UNION ALL ".join(
+                f"MATCH (n:{node_type}) RETURN '{node_type}' AS label, count(n) AS count"
+                for node_type in nodes.values()
+            ))
+            label_counts = {record['label']: record['count'] for record in result}
+
             print("\nNodes:")
             for label, node_type in nodes.items():
-                try:
-                    result = session.run(f"MATCH (n:{node_type}) RETURN count(n) as count")
-                    count = result.single()['count']
-                    print(f"  {label:25} {count:>6}")
-                except:
-                    pass
+                print(f"  {label:25} {label_counts.get(node_type, 0):>6}")
 
             # Relationship counts
             print("\nRelationships:")
@@ -540,10 +1076,12 @@ def main():
     import sys
 
     if len(sys.argv) < 2:
-        print("Usage: python load_to_neo4j_unified.py <whatsapp_json_file>")
+        print("Usage: python load_to_neo4j_unified.py <whatsapp_json_file> [--fresh]")
         sys.exit(1)
 
     json_file = sys.argv[1]
+    # --fresh clears the database first, so the load can CREATE instead of MERGE
+    fresh = '--fresh' in sys.argv[2:]
 
     # Configuration
     NEO4J_URI = "bolt://220210fe.databases.neo4j.io:7687"
@@ -557,13 +1095,15 @@ def main():
     loader = UnifiedRAGNeo4jLoader(NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD)
 
     try:
+        if fresh:
+            loader.clear_database()
+
         loader.create_schema()
 
-        # Load data
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # Load data (messages are streamed when ijson is installed)
+        data = read_chat_json(json_file)
 
-        loader.load_whatsapp_chat(data)
+        loader.load_whatsapp_chat(data, cold_load=fresh)
         loader.get_stats()
     finally:
         loader.close()
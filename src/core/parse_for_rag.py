@@ -3,14 +3,22 @@ RAG-Optimized Transcript Parser
 Creates chunks with entity mentions for retrieval-augmented generation
 """
 
+import base64
 import json
 import hashlib
+import heapq
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from src.core.chunking_logic import TranscriptChunker
 from src.core.langchain_extractor_simple import SimplifiedMistralExtractor
+from src.core.resilience import retry_with_backoff
 
 try:
     from src.core.embeddings import MistralEmbedder
@@ -18,19 +26,102 @@ try:
 except ImportError:
     EMBEDDINGS_AVAILABLE = False
 
+# Fast JSON encoding (optional) for export_to_json and the extraction cache
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Vectorized source-chunk scoring (optional) - falls back to a Python count
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Multi-pattern entity matching (optional) - falls back to one compiled regex per transcript
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# .txt files under the transcript directory that aren't transcripts
+_SKIP_PREFIXES = ('PARSED_', 'README', 'SETUP', 'NEO4J', 'QUICK')
+_SKIP_NAMES = frozenset({'requirements.txt', 'license.txt', 'readme.txt'})
+
+# Meeting date in a file name: "Mar 5, 2024" style first, then ISO
+_DATE_MONTH_RE = re.compile(
+    r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2}(?:,?\s+\d{4})?',
+    re.IGNORECASE
+)
+_DATE_ISO_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+# Speaker turn header at line start ("Jane Doe  00:01"), capturing the name
+_PARTICIPANT_RE = re.compile(r'^([A-Z][a-z]+(?: [A-Z][a-z]+)*)\s+\d{1,2}:\d{2}', re.MULTILINE)
+
+# Word character, as the regex fallback's (?<!\w) / (?!\w) boundaries see it
+_WORD_CHAR_RE = re.compile(r'\w')
+
+
+@lru_cache(maxsize=65536)
+def _hash_id(text: str) -> str:
+    """md5-based id; names recur across meetings, so results are cached
+
+    Stays md5: the WhatsApp parser and the loaders derive the same ids from
+    names, and existing graphs are keyed on them. Hex-encoding only the 6
+    bytes kept gives the same value as hexdigest()[:12].
+    """
+    return hashlib.md5(text.encode(), usedforsecurity=False).digest()[:6].hex()
+
+
+def _is_word_bounded(text: str, start: int, end: int) -> bool:
+    """True if text[start:end] isn't glued to a word character on either side"""
+    return ((start == 0 or not _WORD_CHAR_RE.match(text, start - 1)) and
+            (end == len(text) or not _WORD_CHAR_RE.match(text, end)))
+
+
+def _json_default(obj):
+    """json fallback for NumPy values (embeddings) that orjson handles natively"""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _quantize_int8(embeddings):
+    """Per-row symmetric int8 quantization: (base64 codes, scale) per vector"""
+    scales = np.abs(embeddings).max(axis=1) / 127.0
+    safe = np.where(scales > 0, scales, 1.0)[:, None]
+    codes = np.clip(np.rint(embeddings / safe), -127, 127).astype(np.int8)
+    return [(base64.b64encode(row.tobytes()).decode('ascii'), float(scale))
+            for row, scale in zip(codes, scales)]
+
 
 class RAGTranscriptParser:
     """Parse transcripts optimized for RAG retrieval"""
 
     def __init__(self, transcript_dir: str, mistral_api_key: str, model: str = "mistral-large-latest", 
-                 generate_embeddings: bool = False):
+                 generate_embeddings: bool = False, max_workers: int = 4, max_api_calls: int = 5,
+                 quantize_embeddings: bool = False,
+                 extraction_cache_dir: Optional[str] = ".cache/extraction"):
         self.transcript_dir = Path(transcript_dir)
         self.mistral_api_key = mistral_api_key
         self.generate_embeddings = generate_embeddings
+        # Export embeddings as base64 int8 + per-vector scale (needs NumPy)
+        self.quantize_embeddings = quantize_embeddings and NUMPY_AVAILABLE
+        if quantize_embeddings and not NUMPY_AVAILABLE:
+            print("[WARN] Embedding quantization requires numpy - exporting float embeddings")
+        # Transcripts parsed concurrently (bounded by the Mistral API, not CPU)
+        self.max_workers = max_workers
+        # Mistral requests (extraction, relationships, embeddings) in flight at
+        # once across all transcripts; the extractor holds a slot per chunk request
+        self._api_slots = threading.BoundedSemaphore(max_api_calls)
 
         # Initialize components
         self.chunker = TranscriptChunker(min_chunk_size=300, max_chunk_size=1500)
-        self.extractor = SimplifiedMistralExtractor(api_key=mistral_api_key, model=model)
+        self.extractor = SimplifiedMistralExtractor(api_key=mistral_api_key, model=model,
+                                                    request_slots=self._api_slots)
 
         # Initialize embedder if requested
         self.embedder = None
@@ -43,6 +134,10 @@ class RAGTranscriptParser:
 
         # Caches
         self.entity_cache = {}  # Unified entity cache
+        # LLM extraction per (transcript content, model) across runs (None disables)
+        self.extraction_cache_dir = Path(extraction_cache_dir) if extraction_cache_dir else None
+        if self.extraction_cache_dir:
+            self.extraction_cache_dir.mkdir(parents=True, exist_ok=True)
 
     def parse_all_transcripts(self) -> List[Dict]:
         """Parse all transcripts for RAG"""
@@ -52,30 +147,85 @@ class RAGTranscriptParser:
         print("Creating: Chunks + Entities + Relationships")
         print("="*70)
 
-        transcript_files = list(self.transcript_dir.rglob('*.txt'))
-        transcript_files = [f for f in transcript_files
-                           if not f.name.upper().startswith(('PARSED_', 'README', 'SETUP', 'NEO4J', 'QUICK'))
-                           and f.name.lower() not in ('requirements.txt', 'license.txt', 'readme.txt')]
+        transcript_files = [f for f in self.transcript_dir.rglob('*.txt')
+                            if not f.name.upper().startswith(_SKIP_PREFIXES)
+                            and f.name.lower() not in _SKIP_NAMES]
 
         print(f"\nFound {len(transcript_files)} transcripts\n")
 
-        results = []
-        for i, file_path in enumerate(transcript_files, 1):
-            try:
-                print(f"[{i}/{len(transcript_files)}] {file_path.name}")
-                result = self.parse_transcript(file_path)
-                results.append(result)
-                print()
-            except Exception as e:
-                print(f"  [ERROR] Error: {e}\n")
+        def parse(i, file_path):
+            print(f"[{i}/{len(transcript_files)}] {file_path.name}")
+            return self.parse_transcript(file_path, embed=False)
+
+        # Transcripts are independent and mostly wait on the Mistral API, so
+        # threads overlap those calls (the extractor's clients can't be pickled
+        # for a process pool). Results keep the file order.
+        results = [None] * len(transcript_files)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(parse, i, file_path): i
+                for i, file_path in enumerate(transcript_files, 1)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    results[i - 1] = future.result()
+                    print(f"  [OK] Parsed {transcript_files[i - 1].name}\n")
+                except Exception as e:
+                    print(f"  [ERROR] {transcript_files[i - 1].name}: {e}\n")
 
-        return results
+        results = [result for result in results if result is not None]
+
+        # Embeddings for the whole corpus in full API batches, rather than a
+        # partly-filled last batch per transcript
+        if self.embedder:
+            self._embed_all_chunks(results)
 
-    def parse_transcript(self, file_path: Path) -> Dict:
-        """Parse single transcript"""
+        return results
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+    def _embed_all_chunks(self, transcripts: List[Dict]):
+        """Embed every chunk of every transcript, batches dispatched concurrently"""
+        all_chunks = list(chain.from_iterable(t['chunks'] for t in transcripts))
+        if not all_chunks:
+            return
+
+        print(f"\n[LOG] Generating embeddings for {len(all_chunks)} chunks...")
+
+        batch_size = self.embedder.batch_size
+        batches = [all_chunks[i:i + batch_size] for i in range(0, len(all_chunks), batch_size)]
+
+        # Batches run concurrently, so rate limits are likely: retry with
+        # backoff (outside the request slot), and fail rather than export
+        # embed_texts' zero-vector fallback as real embeddings
+        @retry_with_backoff(max_attempts=4, initial_delay=2.0, backoff_factor=2.0)
+        def embed(batch):
+            return self._call_api(self.embedder.embed_texts, [c['text'] for c in batch], False, True)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for batch, embeddings in zip(batches, executor.map(embed, batches)):
+                if NUMPY_AVAILABLE and embeddings:
+                    # float32 rows: 4 bytes per dimension instead of a float
+                    # object each, and export_to_json writes them natively
+                    embeddings = np.asarray(embeddings, dtype=np.float32)
+                    if self.quantize_embeddings:
+                        # ~4x smaller again; loaders rebuild codes * scale
+                        for chunk, (codes, scale) in zip(batch, _quantize_int8(embeddings)):
+                            chunk['embedding_int8'] = codes
+                            chunk['embedding_scale'] = scale
+                        continue
+                for chunk, embedding in zip(batch, embeddings):
+                    chunk['embedding'] = embedding
+
+        print(f"[OK] Embeddings generated ({self.embedder.dimensions} dimensions)")
+
+    def parse_transcript(self, file_path: Path, embed: bool = True) -> Dict:
+        """Parse single transcript
+
+        With embed=False chunk embeddings are left to the caller
+        (parse_all_transcripts embeds the whole corpus at once).
+        """
+
+        content = file_path.read_text(encoding='utf-8')
 
         # Extract meeting metadata
         meeting_info = self._extract_meeting_info(file_path, content)
@@ -85,9 +235,31 @@ class RAGTranscriptParser:
         chunks = self.chunker.chunk_transcript(content, meeting_info)
         print(f"    [OK] Created {len(chunks)} chunks")
 
+        # Lowercased chunk text and its word index are shared by the matching steps
+        chunk_lowers = [c.text.lower() for c in chunks]
+        word_index = self._build_word_index(chunk_lowers)
+
+        # Convert chunks to dicts
+        chunk_dicts = [self._chunk_to_dict(c, meeting_info, i) for i, c in enumerate(chunks)]
+
+        # Embeddings only need the chunk text, so they run alongside extraction
+        embedding = None
+        if self.embedder and embed:
+            embed_pool = ThreadPoolExecutor(max_workers=1)
+            embedding = embed_pool.submit(self._call_api, self.embedder.embed_chunks, chunk_dicts)
+            embed_pool.shutdown(wait=False)
+
         print(f"  Step 2: Extracting entities...")
-        # Extract entities from full transcript
-        entities_data = self.extractor.extract_entities(content, meeting_info)
+        # Unchanged transcripts reuse the stored extraction instead of the LLM
+        cache_file = self._extraction_cache_file(content)
+        cached = self._load_extraction(cache_file)
+        if cached:
+            print(f"    [OK] Reusing cached extraction")
+            entities_data = cached['entities']
+        else:
+            # Extract entities from full transcript
+            failed_chunks = []
+            entities_data = self.extractor.extract_entities(content, meeting_info, failed_chunks)
 
         # Process entities (unified)
         entities = self._process_entities(entities_data)
@@ -95,29 +267,35 @@ class RAGTranscriptParser:
 
         print(f"  Step 3: Linking chunks to entities...")
         # Link chunks to entities they mention
-        chunk_entity_links = self._link_chunks_to_entities(chunks, entities)
+        chunk_entity_links = self._link_chunks_to_entities(chunk_lowers, entities)
         print(f"    [OK] Created {len(chunk_entity_links)} chunk-entity links")
 
         print(f"  Step 4: Extracting outcomes...")
         # Extract decisions and actions
-        decisions = self._process_decisions(entities_data, chunks)
-        actions = self._process_actions(entities_data, chunks)
+        decisions = self._process_decisions(entities_data, word_index, len(chunks))
+        actions = self._process_actions(entities_data, word_index, len(chunks))
         print(f"    [OK] {len(decisions)} decisions, {len(actions)} actions")
 
         print(f"  Step 5: Extracting entity relationships...")
-        # Extract relationships between entities
-        relationships = self.extractor.extract_relationships(content, meeting_info, entities_data)
+        if cached:
+            relationships = cached['relationships']
+        else:
+            # Extract relationships between entities
+            relationships = self.extractor.extract_relationships(content, meeting_info, entities_data,
+                                                                 failed_chunks)
+            if failed_chunks:
+                # Partial: a later run should retry the failed chunks, not reuse this
+                print(f"    [WARN] {len(failed_chunks)} chunk request(s) failed - extraction not cached")
+            else:
+                self._save_extraction(cache_file, entities_data, relationships)
         # Process relationships to match entity IDs
         processed_relationships = self._process_relationships(relationships, entities)
         print(f"    [OK] Found {len(processed_relationships)} relationships")
 
-        # Convert chunks to dicts
-        chunk_dicts = [self._chunk_to_dict(c, meeting_info, i) for i, c in enumerate(chunks)]
-
-        # Generate embeddings if enabled
-        if self.embedder:
+        # Wait for the embeddings started in step 1
+        if embedding:
             print(f"  Step 6: Generating embeddings...")
-            self.embedder.embed_chunks(chunk_dicts)
+            embedding.result()
             print(f"    [OK] Embeddings generated")
 
         return {
@@ -130,17 +308,51 @@ class RAGTranscriptParser:
             'entity_relationships': processed_relationships
         }
 
+    def _call_api(self, fn, *args):
+        """Run one Mistral call within the shared request limit (embeddings; the extractor takes its own slots)"""
+        with self._api_slots:
+            return fn(*args)
+
+    def _extraction_cache_file(self, content: str) -> Optional[Path]:
+        """Cache file for this transcript text and extraction model"""
+        if not self.extraction_cache_dir:
+            return None
+        digest = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        model = re.sub(r'[^\w.-]', '_', self.extractor.model_name)
+        return self.extraction_cache_dir / f"{digest}_{model}.json"
+
+    def _load_extraction(self, cache_file: Optional[Path]) -> Optional[Dict]:
+        """Stored {entities, relationships} for a transcript, or None"""
+        if not cache_file or not cache_file.exists():
+            return None
+        try:
+            data = cache_file.read_bytes()
+            return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+        except Exception as e:
+            print(f"    [WARN] Ignoring unreadable extraction cache {cache_file.name}: {e}")
+            return None
+
+    def _save_extraction(self, cache_file: Optional[Path], entities_data: Dict, relationships: List[Dict]):
+        """Store an extraction; empty ones (likely failed calls) are not cached"""
+        if not cache_file or not any(entities_data.values()):
+            return
+        # Write then rename, so a concurrent or interrupted run never reads half a file
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{threading.get_ident()}.tmp")
+        try:
+            tmp_file.write_bytes(self._dumps({'entities': entities_data, 'relationships': relationships}))
+            tmp_file.replace(cache_file)
+        except OSError as e:
+            print(f"    [WARN] Could not cache extraction: {e}")
+
     def _extract_meeting_info(self, file_path: Path, content: str) -> Dict:
         """Extract meeting metadata"""
-        import re
-
         filename = file_path.stem
         parent_dir = file_path.parent.name
 
         # Extract date
-        date_match = re.search(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2}(?:,?\s+\d{4})?', filename, re.IGNORECASE)
+        date_match = _DATE_MONTH_RE.search(filename)
         if not date_match:
-            date_match = re.search(r'\d{4}-\d{2}-\d{2}', filename)
+            date_match = _DATE_ISO_RE.search(filename)
 
         date_str = None
         if date_match:
@@ -176,101 +388,146 @@ class RAGTranscriptParser:
 
     def _extract_participants(self, content: str) -> List[str]:
         """Extract participant names from transcript"""
-        import re
-        pattern = r'^([A-Z][a-z]+(?: [A-Z][a-z]+)*)\s+\d{1,2}:\d{2}'
-        matches = re.findall(pattern, content, re.MULTILINE)
-        return list(set(matches))
+        return list({match.group(1) for match in _PARTICIPANT_RE.finditer(content)})
 
     def _process_entities(self, entities_data: Dict) -> List[Dict]:
         """Process all entities into unified format"""
         entities = []
+        seen = set()
+        # Names first seen in this transcript, merged into entity_cache at the end
+        new_ids = {}
+
+        def add(name, entity_type, properties):
+            # Skip if no name provided, or already listed for this transcript
+            if not name or (entity_type, name) in seen:
+                return
+            seen.add((entity_type, name))
+
+            # Names recur across transcripts - reuse the cached id
+            entity_id = self.entity_cache.get(name) or new_ids.get(name)
+            if entity_id is None:
+                entity_id = new_ids[name] = self._generate_id(name)
 
-        # People
-        for person in entities_data.get('people', []):
-            entity_id = self._generate_id(person['name'])
             entities.append({
                 'id': entity_id,
-                'name': person['name'],
-                'type': 'Person',
-                'properties': {
-                    'role': person.get('role'),
-                    'organization': person.get('organization')
-                }
+                'name': name,
+                'type': entity_type,
+                'properties': properties
+            })
+
+        # People
+        for person in entities_data.get('people', []):
+            add(person.get('name'), 'Person', {
+                'role': person.get('role'),
+                'organization': person.get('organization')
             })
-            self.entity_cache[person['name']] = entity_id
 
         # Organizations
         for org in entities_data.get('organizations', []):
-            # Skip if no name provided
-            if not org.get('name'):
-                continue
-            
-            entity_id = self._generate_id(org['name'])
-            entities.append({
-                'id': entity_id,
-                'name': org['name'],
-                'type': 'Organization',
-                'properties': {
-                    'org_type': org.get('type')
-                }
+            add(org.get('name'), 'Organization', {
+                'org_type': org.get('type')
             })
-            self.entity_cache[org['name']] = entity_id
 
         # Countries
         for country in entities_data.get('countries', []):
-            # Skip if no name provided
-            if not country.get('name'):
-                continue
-            
-            entity_id = self._generate_id(country['name'])
-            entities.append({
-                'id': entity_id,
-                'name': country['name'],
-                'type': 'Country',
-                'properties': {
-                    'status': country.get('status')
-                }
+            add(country.get('name'), 'Country', {
+                'status': country.get('status')
             })
-            self.entity_cache[country['name']] = entity_id
 
         # Topics
         for topic in entities_data.get('topics', []):
-            # Skip if no name provided
-            if not topic.get('name'):
-                continue
-            
-            entity_id = self._generate_id(topic['name'])
-            entities.append({
-                'id': entity_id,
-                'name': topic['name'],
-                'type': 'Topic',
-                'properties': {}
-            })
-            self.entity_cache[topic['name']] = entity_id
+            add(topic.get('name'), 'Topic', {})
 
-        return entities
-
-    def _link_chunks_to_entities(self, chunks, entities) -> List[Dict]:
-        """Find which entities are mentioned in which chunks"""
-        links = []
+        # One update per transcript: the shared cache is resized once for the
+        # whole batch instead of growing key by key while other threads read it
+        self.entity_cache.update(new_ids)
 
-        for chunk_idx, chunk in enumerate(chunks):
-            chunk_text_lower = chunk.text.lower()
+        return entities
 
-            for entity in entities:
-                entity_name_lower = entity['name'].lower()
+    def _link_chunks_to_entities(self, chunk_lowers: List[str], entities) -> List[Dict]:
+        """Find which entities are mentioned in which chunks (given lowercased chunk texts)
+
+        A mention must stand as whole words, so short names like "US" or "AI"
+        don't match inside "focus" or "said".
+        """
+        # Each entity name is lowercased once, not once per chunk. Entities
+        # sharing a name share a key.
+        names = {}
+        for entity_idx, entity in enumerate(entities):
+            name = entity['name'].lower()
+            if name:
+                names.setdefault(name, []).append(entity_idx)
+        if not names:
+            return []
+
+        if AHOCORASICK_AVAILABLE:
+            matches = self._match_names_automaton(chunk_lowers, names)
+        else:
+            matches = self._match_names_regex(chunk_lowers, names)
 
-                # Check if entity is mentioned in chunk
-                if entity_name_lower in chunk_text_lower:
-                    links.append({
-                        'chunk_sequence': chunk_idx,
-                        'entity_id': entity['id'],
-                        'entity_name': entity['name']
-                    })
+        links = []
+        for chunk_idx, matched in enumerate(matches):
+            # One link per entity, in entity order as before
+            for entity_idx in sorted(matched):
+                entity = entities[entity_idx]
+                links.append({
+                    'chunk_sequence': chunk_idx,
+                    'entity_id': entity['id'],
+                    'entity_name': entity['name']
+                })
 
         return links
 
-    def _process_decisions(self, entities_data: Dict, chunks) -> List[Dict]:
+    def _match_names_automaton(self, chunk_lowers: List[str], names: Dict) -> List[set]:
+        """Entity indices per chunk: one Aho-Corasick scan per chunk"""
+        automaton = ahocorasick.Automaton()
+        for name, entity_idxs in names.items():
+            automaton.add_word(name, (len(name), entity_idxs))
+        automaton.make_automaton()
+
+        matches = []
+        for text in chunk_lowers:
+            matched = set()
+            for end, (length, entity_idxs) in automaton.iter(text):
+                start = end - length + 1
+                if _is_word_bounded(text, start, end + 1):
+                    matched.update(entity_idxs)
+            matches.append(matched)
+        return matches
+
+    def _match_names_regex(self, chunk_lowers: List[str], names: Dict) -> List[set]:
+        """Entity indices per chunk: one compiled alternation, one C-level scan per chunk"""
+        # Longest first: the zero-width lookahead tries every position, but
+        # reports only the first alternative that matches there
+        ordered = sorted(names, key=len, reverse=True)
+        pattern = re.compile(
+            r'(?<!\w)(?=(' + '|'.join(map(re.escape, ordered)) + r')(?!\w))'
+        )
+        # A shorter name starting at the same position ("new" in "new york")
+        # is hidden by the longer one, so each name also carries every name
+        # found whole-word inside it
+        bounded = {name: re.compile(r'(?<!\w)' + re.escape(name) + r'(?!\w)') for name in ordered}
+        nested = {
+            name: [other for other in ordered
+                   if len(other) < len(name) and bounded[other].search(name)]
+            for name in ordered
+        }
+
+        matches = []
+        for text in chunk_lowers:
+            found = set()
+            for m in pattern.finditer(text):
+                name = m.group(1)
+                if name not in found:
+                    found.add(name)
+                    found.update(nested[name])
+            matched = set()
+            for name in found:
+                matched.update(names[name])
+            matches.append(matched)
+        return matches
+
+    def _process_decisions(self, entities_data: Dict, word_index: Dict, n_chunks: int) -> List[Dict]:
         """Process decisions and link to source chunks"""
         decisions = []
 
@@ -278,7 +535,7 @@ class RAGTranscriptParser:
             decision_id = self._generate_id(decision['description'][:50])
 
             # Find source chunk (chunk with highest similarity to decision text)
-            source_chunks = self._find_source_chunks(decision['description'], chunks)
+            source_chunks = self._find_source_chunks(decision['description'], word_index, n_chunks)
 
             decisions.append({
                 'id': decision_id,
@@ -289,7 +546,7 @@ class RAGTranscriptParser:
 
         return decisions
 
-    def _process_actions(self, entities_data: Dict, chunks) -> List[Dict]:
+    def _process_actions(self, entities_data: Dict, word_index: Dict, n_chunks: int) -> List[Dict]:
         """Process actions and link to source chunks"""
         actions = []
 
@@ -297,7 +554,7 @@ class RAGTranscriptParser:
             action_id = self._generate_id(action['task'][:50])
 
             # Find source chunk
-            source_chunks = self._find_source_chunks(action['task'], chunks)
+            source_chunks = self._find_source_chunks(action['task'], word_index, n_chunks)
 
             actions.append({
                 'id': action_id,
@@ -308,20 +565,42 @@ class RAGTranscriptParser:
 
         return actions
 
-    def _find_source_chunks(self, text: str, chunks, top_n: int = 2) -> List[int]:
-        """Find chunks most likely to contain this text"""
+    def _build_word_index(self, chunk_lowers: List[str]) -> Dict:
+        """Map each distinct chunk word to the chunks containing it"""
+        postings = {}
+        for chunk_idx, text in enumerate(chunk_lowers):
+            for word in set(text.split()):
+                postings.setdefault(word, []).append(chunk_idx)
+
+        if NUMPY_AVAILABLE:
+            return {word: np.array(idxs, dtype=np.intp) for word, idxs in postings.items()}
+        return postings
+
+    def _find_source_chunks(self, text: str, word_index: Dict, n_chunks: int, top_n: int = 2) -> List[int]:
+        """Find chunks most likely to contain this text
+
+        A chunk's score is how many distinct words of `text` it contains,
+        counted from the word index rather than intersecting every chunk.
+        """
         text_lower = text.lower()
         text_words = set(text_lower.split())
 
-        scores = []
-        for i, chunk in enumerate(chunks):
-            chunk_words = set(chunk.text.lower().split())
-            overlap = len(text_words & chunk_words)
-            scores.append((i, overlap))
+        hits = [word_index[word] for word in text_words if word in word_index]
+        if not hits:
+            return []
 
-        # Return top N chunks
-        scores.sort(key=lambda x: x[1], reverse=True)
-        return [idx for idx, score in scores[:top_n] if score > 0]
+        # Return top N chunks (ties keep chunk order)
+        if NUMPY_AVAILABLE:
+            scores = np.bincount(np.concatenate(hits), minlength=n_chunks)
+            ranked = np.argsort(-scores, kind='stable')[:top_n]
+            return [int(idx) for idx in ranked if scores[idx] > 0]
+
+        scores = [0] * n_chunks
+        for idxs in hits:
+            for idx in idxs:
+                scores[idx] += 1
+        ranked = heapq.nlargest(top_n, range(n_chunks), key=scores.__getitem__)
+        return [idx for idx in ranked if scores[idx] > 0]
 
     def _chunk_to_dict(self, chunk, meeting_info: Dict, sequence: int) -> Dict:
         """Convert chunk object to dict"""
@@ -356,7 +635,7 @@ class RAGTranscriptParser:
 
     def _generate_id(self, text: str) -> str:
         """Generate ID"""
-        return hashlib.md5(text.encode()).hexdigest()[:12]
+        return _hash_id(text)
     
     def _process_relationships(self, relationships: List[Dict], entities: List[Dict]) -> List[Dict]:
         """Process relationships and link to entity IDs"""
@@ -389,6 +668,13 @@ class RAGTranscriptParser:
         
         return processed
 
+    @staticmethod
+    def _dumps(obj) -> bytes:
+        """Encode one JSON value as indented UTF-8 (orjson when installed)"""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default).encode('utf-8')
+
     def export_to_json(self, output_file: str):
         """Export to JSON"""
 
@@ -401,23 +687,27 @@ class RAGTranscriptParser:
         total_links = sum(len(t['chunk_entity_links']) for t in transcripts)
         total_relationships = sum(len(t.get('entity_relationships', [])) for t in transcripts)
 
-        output = {
-            'metadata': {
-                'generated_at': datetime.now().isoformat(),
-                'transcript_count': len(transcripts),
-                'total_chunks': total_chunks,
-                'total_entities': total_entities,
-                'total_chunk_entity_links': total_links,
-                'total_entity_relationships': total_relationships,
-                'extraction_method': 'RAG-Optimized (Chunks + Entities + Relationships)',
-                'model': self.extractor.model_name
-            },
-            'transcripts': transcripts,
-            'entity_index': self.entity_cache
+        metadata = {
+            'generated_at': datetime.now().isoformat(),
+            'transcript_count': len(transcripts),
+            'total_chunks': total_chunks,
+            'total_entities': total_entities,
+            'total_chunk_entity_links': total_links,
+            'total_entity_relationships': total_relationships,
+            'extraction_method': 'RAG-Optimized (Chunks + Entities + Relationships)',
+            'model': self.extractor.model_name
         }
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        # Same {metadata, transcripts, entity_index} document, written one
+        # transcript at a time so the whole corpus (embeddings included) is
+        # never serialized into a single string
+        with open(output_file, 'wb') as f:
+            f.write(b'{\n"metadata": ' + self._dumps(metadata) + b',\n"transcripts": [\n')
+            for i, transcript in enumerate(transcripts):
+                if i:
+                    f.write(b',\n')
+                f.write(self._dumps(transcript))
+            f.write(b'\n],\n"entity_index": ' + self._dumps(self.entity_cache) + b'\n}\n')
 
         print("\n" + "="*70)
         print("RAG EXTRACTION COMPLETE")
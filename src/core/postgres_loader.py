@@ -4,23 +4,152 @@ Mirrors Neo4j data structure in Postgres with pgvector embeddings
 Supports: Meetings, Documents, WhatsApp Chats
 """
 
+import base64
+import io
 import json
+import multiprocessing as mp
+import struct
+import sys
+import threading
+from array import array
+from contextlib import contextmanager
+
 import psycopg2
 from psycopg2 import pool, extras
 from psycopg2.extensions import register_adapter, AsIs  
 from typing import Dict, List, Optional
 from pathlib import Path
 
+# Fast JSON encoding (optional) for JSONB columns and raw_data backups
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Vectorized float32 packing (optional) for binary COPY of embeddings
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 
 # Note: psycopg2 handles Python lists → PostgreSQL arrays natively
 # We'll use Json() for complex data and let psycopg2 handle simple arrays
 
 
+def dequantize_embedding(chunk: Dict) -> Optional[List[float]]:
+    """Chunk embedding as floats, expanding int8-quantized exports (codes * scale)"""
+    if chunk.get('embedding_int8'):
+        scale = chunk.get('embedding_scale', 1.0)
+        return [code * scale for code in array('b', base64.b64decode(chunk['embedding_int8']))]
+    return chunk.get('embedding')
+
+
+# Binary COPY framing: signature, flags, header extension length / end marker
+_PGCOPY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0)
+_PGCOPY_TRAILER = struct.pack('>h', -1)
+
+
+def _vector_binary(embedding, vector_type: str = 'vector') -> bytes:
+    """pgvector binary value: int16 dim, int16 unused, big-endian float4 (halfvec: float2) elements"""
+    if vector_type == 'halfvec':
+        if NUMPY_AVAILABLE:
+            values = np.asarray(embedding, dtype='>f2').tobytes()
+        else:
+            values = struct.pack(f'>{len(embedding)}e', *embedding)
+    elif NUMPY_AVAILABLE:
+        values = np.asarray(embedding, dtype='>f4').tobytes()
+    else:
+        floats = array('f', embedding)
+        if sys.byteorder == 'little':
+            floats.byteswap()
+        values = floats.tobytes()
+    return struct.pack('>hh', len(embedding), 0) + values
+
+
+# Column types accepted for chunks.embedding (halfvec needs pgvector >= 0.7)
+_VECTOR_TYPES = ('vector', 'halfvec')
+
+
+# chunk_metadata written for chunks without any
+_EMPTY_JSONB = '{}'
+
+
+def _json_text(obj) -> str:
+    """JSON text for a JSONB column (orjson when installed)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, ensure_ascii=False)
+
+
+# Chunk fields already stored in chunks.embedding, left out of raw_data
+_EMBEDDING_KEYS = frozenset({'embedding', 'embedding_int8', 'embedding_scale'})
+
+
+def _raw_data_json(full_data: Dict) -> str:
+    """Parsed source as JSON for sources.raw_data, without chunk embeddings"""
+    backup = dict(full_data)
+    if backup.get('chunks'):
+        backup['chunks'] = [
+            {k: v for k, v in chunk.items() if k not in _EMBEDDING_KEYS}
+            for chunk in backup['chunks']
+        ]
+    return _json_text(backup)
+
+
+# Row sets at least this large are upserted through COPY staging; smaller
+# ones in a single multi-VALUES INSERT (also its page size)
+_COPY_MIN_ROWS = 1000
+
+# Tables taking the bulk of a load: autovacuum paused while load_batch /
+# load_many run, analyzed afterwards
+_BULK_TABLES = ('chunks', 'chunk_mentions', 'chunk_outcomes', 'entities', 'messages')
+
+# COPY text format: backslash, tab and line breaks are escaped, NULL is \N
+_COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+
+def _pg_array(arr) -> str:
+    """PostgreSQL array literal '{"val1","val2"}' (quotes and backslashes escaped)"""
+    if not arr:
+        return '{}'
+    items = list(map(str, arr))
+    # Names rarely hold quotes or backslashes: one scan over all items
+    # decides, and only then is each item escaped
+    probe = ''.join(items)
+    if '"' in probe or '\\' in probe:
+        items = [item.replace('\\', '\\\\').replace('"', '\\"') for item in items]
+    return '{"' + '","'.join(items) + '"}'
+
+
+def _copy_field(value) -> str:
+    """One column value in COPY text format"""
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, (list, tuple)):
+        value = _pg_array(value)
+    return str(value).translate(_COPY_ESCAPES)
+
+
 class UnifiedPostgresLoader:
     """Load data into Postgres mirror database with pgvector support"""
     
+    # Databases (connection targets) already migrated by this process
+    _migrated_targets = set()
+    
+    # Open bulk-load windows per connection target, and the autovacuum_enabled
+    # reloptions they saved (restored when the last window closes)
+    _autovacuum_windows = {}
+    _autovacuum_lock = threading.Lock()
+    
     def __init__(self, connection_string: str = None, host: str = None, database: str = None, 
-                 user: str = None, password: str = None, port: int = 5432):
+                 user: str = None, password: str = None, port: int = 5432,
+                 min_connections: int = 1, max_connections: int = 10,
+                 vector_type: str = 'vector'):
         """
         Initialize Postgres loader
         
@@ -31,7 +160,15 @@ class UnifiedPostgresLoader:
             user: Username (alternative to connection_string)
             password: Password (alternative to connection_string)
             port: Port (default: 5432, alternative to connection_string)
+            min_connections: Connections opened up front
+            max_connections: Pool size limit (one per concurrently loading thread)
+            vector_type: 'vector' (float4) or 'halfvec' (float2, half the storage
+                and index size; pgvector >= 0.7, create_schema converts an existing column)
         """
+        if vector_type not in _VECTOR_TYPES:
+            raise ValueError(f"vector_type must be one of {_VECTOR_TYPES}, got {vector_type!r}")
+        self.vector_type = vector_type
+        
         # Support both connection string and individual parameters
         if connection_string:
             self.connection_string = connection_string
@@ -48,18 +185,21 @@ class UnifiedPostgresLoader:
             }
             connection_display = f"{host}:{port}/{database}"
         
-        # Create connection pool
+        # Connection pinned by batch(), per thread
+        self._local = threading.local()
+        
+        # Create connection pool (thread-safe, so loads can run from several threads)
         try:
             if self.connection_string:
-                self.pool = psycopg2.pool.SimpleConnectionPool(
-                    1,  # minconn
-                    10,  # maxconn
+                self.pool = psycopg2.pool.ThreadedConnectionPool(
+                    min_connections,
+                    max_connections,
                     self.connection_string
                 )
             else:
-                self.pool = psycopg2.pool.SimpleConnectionPool(
-                    1,  # minconn
-                    10,  # maxconn
+                self.pool = psycopg2.pool.ThreadedConnectionPool(
+                    min_connections,
+                    max_connections,
                     **self.connection_params
                 )
             print(f"[OK] Connected to Postgres at {connection_display}")
@@ -74,6 +214,10 @@ class UnifiedPostgresLoader:
         masked = re.sub(r'://([^:]+):([^@]+)@', r'://\1:****@', conn_str)
         return masked
     
+    def _connection_target(self):
+        """Hashable key for the database this loader connects to"""
+        return self.connection_string or tuple(sorted(self.connection_params.items()))
+    
     def get_connection(self):
         """Get connection from pool"""
         return self.pool.getconn()
@@ -82,6 +226,160 @@ class UnifiedPostgresLoader:
         """Release connection back to pool"""
         self.pool.putconn(conn)
     
+    @contextmanager
+    def batch(self):
+        """
+        Load several sources over one connection and commit once at the end
+        
+        Inside the block every load_* call on this thread reuses the pinned
+        connection; each source runs in a savepoint, so a failed source is
+        rolled back and reported without losing the others. Index changes
+        (create_vector_index) belong outside the block - they take their own
+        connection and would wait on this transaction.
+        
+            with loader.batch():
+                for data in datas:
+                    loader.load_data(data)
+        """
+        if getattr(self._local, 'conn', None) is not None:
+            # Already batching on this thread - join the outer batch
+            yield
+            return
+        
+        conn = self.get_connection()
+        self._local.conn = conn
+        try:
+            self._prepare_bulk_session(conn)
+            yield
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._local.conn = None
+            self.release_connection(conn)
+    
+    @contextmanager
+    def _source_transaction(self, label: str):
+        """Connection for loading one source: its own transaction, or a savepoint in batch()"""
+        conn = getattr(self._local, 'conn', None)
+        
+        if conn is None:
+            conn = self.get_connection()
+            try:
+                yield conn
+                conn.commit()
+                print(f"[OK] {label} loaded successfully")
+            except Exception as e:
+                conn.rollback()
+                print(f"[ERROR] {label} load failed: {e}")
+                raise
+            finally:
+                self.release_connection(conn)
+            return
+        
+        cursor = conn.cursor()
+        cursor.execute("SAVEPOINT load_source")
+        try:
+            yield conn
+            cursor.execute("RELEASE SAVEPOINT load_source")
+            print(f"[OK] {label} loaded successfully")
+        except Exception as e:
+            cursor.execute("ROLLBACK TO SAVEPOINT load_source")
+            print(f"[ERROR] {label} load failed: {e}")
+            raise
+        finally:
+            cursor.close()
+    
+    def _prepare_bulk_session(self, conn):
+        """
+        Transaction-local settings for batch() (and so load_batch / load_many)
+        
+        synchronous_commit=off returns from COMMIT before the WAL is flushed:
+        a server crash can lose the last moments of loads (never corrupt
+        them), which a mirror that can be reloaded affords. work_mem covers
+        the key-ordered staging sorts.
+        """
+        cursor = conn.cursor()
+        cursor.execute("SET LOCAL synchronous_commit = off; SET LOCAL work_mem = '64MB'")
+        cursor.close()
+    
+    @contextmanager
+    def _bulk_load_window(self, rebuild_index: bool):
+        """Around load_batch / load_many: vector index and autovacuum off, restored after"""
+        if rebuild_index:
+            self._drop_vector_index()
+        self._pause_autovacuum()
+        try:
+            yield
+        finally:
+            self._resume_autovacuum()
+            if rebuild_index:
+                self.create_vector_index()
+    
+    def _pause_autovacuum(self):
+        """Turn autovacuum off on the bulk tables, unless a window in this process already did"""
+        with UnifiedPostgresLoader._autovacuum_lock:
+            window = UnifiedPostgresLoader._autovacuum_windows.setdefault(
+                self._connection_target(), {'open': 0, 'saved': None})
+            window['open'] += 1
+            if window['open'] == 1:
+                window['saved'] = self._set_autovacuum(None)
+    
+    def _resume_autovacuum(self):
+        """Restore the saved autovacuum settings once the last open window closes"""
+        with UnifiedPostgresLoader._autovacuum_lock:
+            window = UnifiedPostgresLoader._autovacuum_windows[self._connection_target()]
+            window['open'] -= 1
+            if window['open'] == 0 and window['saved'] is not None:
+                self._set_autovacuum(window['saved'])
+                window['saved'] = None
+    
+    def _set_autovacuum(self, saved: Optional[Dict[str, Optional[str]]]):
+        """
+        Disable autovacuum on the bulk tables (saved=None), or restore it
+        
+        Disabling returns each table's autovacuum_enabled reloption (None when
+        unset), or None if they could not be read. Restoring puts those back
+        - RESET where none was set - and refreshes the tables' statistics.
+        """
+        conn = self.get_connection()
+        conn.autocommit = True  # ANALYZE per table, no long transaction
+        cursor = conn.cursor()
+        current = None
+        
+        try:
+            if saved is None:
+                cursor.execute("""
+                    SELECT relname,
+                           (SELECT option_value FROM pg_options_to_table(reloptions)
+                            WHERE option_name = 'autovacuum_enabled')
+                    FROM pg_class
+                    WHERE oid = ANY(%s::regclass[])
+                """, (list(_BULK_TABLES),))
+                current = dict(cursor.fetchall())
+                for table in _BULK_TABLES:
+                    cursor.execute(f"ALTER TABLE {table} SET (autovacuum_enabled = false)")
+            else:
+                for table in _BULK_TABLES:
+                    if saved.get(table) is None:
+                        cursor.execute(f"ALTER TABLE {table} RESET (autovacuum_enabled)")
+                    else:
+                        cursor.execute(f"ALTER TABLE {table} SET (autovacuum_enabled = %s)",
+                                       (saved[table],))
+                for table in _BULK_TABLES:
+                    cursor.execute(f"ANALYZE {table}")
+                print("[OK] Autovacuum restored, bulk tables analyzed")
+        except Exception as e:
+            # Needs table ownership - loading works without it
+            print(f"[WARN] Could not {'disable' if saved is None else 'restore'} autovacuum: {e}")
+        finally:
+            cursor.close()
+            conn.autocommit = False
+            self.release_connection(conn)
+        # Also returned when disabling failed part-way, so the restore still runs
+        return current
+    
     def close(self):
         """Close all connections"""
         if self.pool:
@@ -104,12 +402,17 @@ class UnifiedPostgresLoader:
         try:
             with open(schema_file, 'r', encoding='utf-8') as f:
                 schema_sql = f.read()
+            if self.vector_type != 'vector':
+                schema_sql = schema_sql.replace('vector(1024)', f'{self.vector_type}(1024)')
             
             cursor = conn.cursor()
             cursor.execute(schema_sql)
             conn.commit()
             cursor.close()
             
+            # CREATE TABLE IF NOT EXISTS leaves an existing embedding column as it was
+            rebuild_index = self._convert_embedding_column(conn)
+            
             # Run migrations
             self._run_migrations(conn)
             
@@ -120,17 +423,71 @@ class UnifiedPostgresLoader:
             raise
         finally:
             self.release_connection(conn)
+        
+        if rebuild_index:
+            self.create_vector_index()
+    
+    def _embedding_column_type(self, cursor) -> Optional[str]:
+        """Type of chunks.embedding without its dimension ('vector', 'halfvec'), None if absent"""
+        cursor.execute("""
+            SELECT format_type(atttypid, NULL)
+            FROM pg_attribute
+            WHERE attrelid = to_regclass('chunks')
+              AND attname = 'embedding' AND NOT attisdropped
+        """)
+        row = cursor.fetchone()
+        return row[0] if row else None
+    
+    def _convert_embedding_column(self, conn) -> bool:
+        """
+        Bring an existing chunks.embedding column to vector_type
+        
+        vector -> halfvec is converted in place (table rewrite). A halfvec
+        column is never widened implicitly: that needs vector_type='halfvec'
+        or an explicit ALTER. Returns True if the vector index was dropped
+        and needs rebuilding.
+        """
+        cursor = conn.cursor()
+        try:
+            current = self._embedding_column_type(cursor)
+            if current is None or current == self.vector_type:
+                return False
+            if self.vector_type != 'halfvec':
+                raise ValueError(f"chunks.embedding is {current}; pass vector_type='{current}' "
+                                 f"to load into this database")
+            
+            print(f"[LOG] Converting chunks.embedding from {current} to {self.vector_type}...")
+            cursor.execute("SELECT to_regclass('idx_chunks_embedding') IS NOT NULL")
+            had_index = cursor.fetchone()[0]
+            # The index's operator class is type-specific; rebuilt after the rewrite
+            cursor.execute("DROP INDEX IF EXISTS idx_chunks_embedding")
+            cursor.execute(f"""
+                ALTER TABLE chunks
+                ALTER COLUMN embedding TYPE {self.vector_type}(1024)
+                USING embedding::{self.vector_type}(1024)
+            """)
+            conn.commit()
+            print(f"[OK] chunks.embedding is now {self.vector_type}(1024)")
+            return had_index
+        finally:
+            cursor.close()
     
     def _run_migrations(self, conn):
-        """Run database migrations for schema updates"""
+        """Run database migrations for schema updates (once per database per process)"""
+        target = self._connection_target()
+        if target in UnifiedPostgresLoader._migrated_targets:
+            return
+        
         cursor = conn.cursor()
         
         try:
             # Migration 1: Add updated_at to messages table if it doesn't exist
+            # (pg_attribute via to_regclass avoids the information_schema views)
             cursor.execute("""
-                SELECT column_name 
-                FROM information_schema.columns 
-                WHERE table_name='messages' AND column_name='updated_at'
+                SELECT 1
+                FROM pg_attribute
+                WHERE attrelid = to_regclass('messages')
+                  AND attname = 'updated_at' AND NOT attisdropped
             """)
             if cursor.fetchone() is None:
                 print("[LOG] Adding updated_at column to messages table...")
@@ -138,8 +495,11 @@ class UnifiedPostgresLoader:
                     ALTER TABLE messages 
                     ADD COLUMN updated_at TIMESTAMP DEFAULT NOW()
                 """)
-                conn.commit()
                 print("[OK] Migration complete: added updated_at to messages")
+            
+            # All migrations commit together
+            conn.commit()
+            UnifiedPostgresLoader._migrated_targets.add(target)
         except Exception as e:
             conn.rollback()
             print(f"[WARN] Migration failed (may be okay if column exists): {e}")
@@ -162,8 +522,7 @@ class UnifiedPostgresLoader:
         """
         print(f"\n[LOG] Loading meeting: {data['meeting']['title']}")
         
-        conn = self.get_connection()
-        try:
+        with self._source_transaction('Meeting') as conn:
             # Load in correct order for foreign key constraints
             self._load_source(conn, data['meeting'], 'meeting', data)
             self._load_entities(conn, data.get('entities', []))
@@ -172,15 +531,6 @@ class UnifiedPostgresLoader:
             self._load_decisions(conn, data.get('decisions', []), data['meeting']['id'])
             self._load_actions(conn, data.get('actions', []), data['meeting']['id'])
             self._link_chunk_outcomes(conn, data.get('chunks', []), data.get('decisions', []), data.get('actions', []))
-            
-            conn.commit()
-            print(f"[OK] Meeting loaded successfully")
-        except Exception as e:
-            conn.rollback()
-            print(f"[ERROR] Meeting load failed: {e}")
-            raise
-        finally:
-            self.release_connection(conn)
     
     def load_whatsapp_data(self, data: Dict):
         """
@@ -198,8 +548,7 @@ class UnifiedPostgresLoader:
         """
         print(f"\n[LOG] Loading WhatsApp chat: {data['conversation']['group_name']}")
         
-        conn = self.get_connection()
-        try:
+        with self._source_transaction('WhatsApp chat') as conn:
             # Load conversation as source
             self._load_source(conn, data['conversation'], 'whatsapp_chat', data)
             
@@ -215,15 +564,6 @@ class UnifiedPostgresLoader:
             # Link chunks to entities
             if data.get('chunk_entity_links'):
                 self._link_chunk_mentions(conn, data['chunks'], data['chunk_entity_links'])
-            
-            conn.commit()
-            print(f"[OK] WhatsApp chat loaded successfully")
-        except Exception as e:
-            conn.rollback()
-            print(f"[ERROR] WhatsApp load failed: {e}")
-            raise
-        finally:
-            self.release_connection(conn)
     
     def load_document_data(self, data: Dict):
         """
@@ -239,28 +579,197 @@ class UnifiedPostgresLoader:
         """
         print(f"\n[LOG] Loading document: {data['document']['title']}")
         
-        conn = self.get_connection()
-        try:
+        with self._source_transaction('Document') as conn:
             self._load_source(conn, data['document'], 'document', data)
             self._load_entities(conn, data.get('entities', []))
             self._load_chunks(conn, data.get('chunks', []))
             self._link_chunk_mentions(conn, data.get('chunks', []), data.get('chunk_entity_links', []))
-            
-            conn.commit()
-            print(f"[OK] Document loaded successfully")
-        except Exception as e:
-            conn.rollback()
-            print(f"[ERROR] Document load failed: {e}")
-            raise
-        finally:
-            self.release_connection(conn)
+    
+    def _upsert_rows(self, cursor, table: str, columns: List[str], rows, conflict: str, action: str,
+                     vectors: Optional[Dict] = None) -> int:
+        """
+        Upsert row tuples: one multi-row INSERT for small sets, COPY staging for large ones
+
+        Args:
+            table: Target table
+            columns: Column names, in row tuple order
+            rows: Row tuples
+            conflict: Conflict target columns, e.g. "id"
+            action: "DO NOTHING" or "DO UPDATE SET ..."
+            vectors: {key: embedding} for the embedding column (single-column
+                conflict key), sent as raw float4 through a binary COPY
+
+        Returns:
+            Number of rows written (0 skips the round trips entirely)
+        """
+        if action.startswith('DO UPDATE'):
+            # A row can only be updated once per statement - keep the last
+            # version of each key, as the old row-by-row upserts did
+            key_idx = [columns.index(c.strip()) for c in conflict.split(',')]
+            by_key = {tuple(row[i] for i in key_idx): row for row in rows}
+            # Rows are locked in key order, so concurrent loads sharing keys
+            # (entities across sources) wait on each other instead of deadlocking
+            rows = [by_key[key] for key in sorted(by_key)]
+        else:
+            rows = list(rows)
+        if not rows:
+            return 0
+
+        if vectors or len(rows) >= _COPY_MIN_ROWS:
+            self._copy_upsert(cursor, table, columns, rows, conflict, action, vectors)
+        else:
+            # Below the threshold a temp table's DDL and extra round trips
+            # cost more than they save: one multi-VALUES statement instead
+            extras.execute_values(
+                cursor,
+                f"INSERT INTO {table} ({', '.join(columns)}) VALUES %s ON CONFLICT ({conflict}) {action}",
+                rows, page_size=_COPY_MIN_ROWS
+            )
+        return len(rows)
+
+    def _copy_upsert(self, cursor, table: str, columns: List[str], rows: List[tuple], conflict: str,
+                     action: str, vectors: Optional[Dict] = None):
+        """
+        Upsert rows through COPY into a temp staging table (see _upsert_rows)
+
+        COPY streams every row in one round trip with no per-row statement
+        parsing; a single INSERT ... SELECT then applies the ON CONFLICT action.
+        """
+        order_by = ''
+        if action.startswith('DO UPDATE'):
+            # Same key order as the sorted rows (byte order = Python str order)
+            order_by = 'ORDER BY ' + ', '.join(f's.{c.strip()} COLLATE "C"' for c in conflict.split(','))
+
+        buf = io.StringIO()
+        for row in rows:
+            buf.write('\t'.join(map(_copy_field, row)))
+            buf.write('\n')
+        buf.seek(0)
+
+        stage = f"stage_{table}"
+        column_list = ', '.join(columns)
+        select_list = ', '.join(f"s.{c}" for c in columns)
+        source = f"{stage} s"
+        cursor.execute(f"CREATE TEMP TABLE {stage} (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP")
+        cursor.copy_expert(f"COPY {stage} ({column_list}) FROM STDIN", buf)
+
+        drop = stage
+        if vectors:
+            # Embeddings skip float -> text -> float: binary COPY carries the
+            # float4 bytes as-is, joined back onto the staged rows by key
+            vector_stage = f"{stage}_vectors"
+            cursor.execute(f"CREATE TEMP TABLE {vector_stage} (key TEXT, embedding {self.vector_type}) ON COMMIT DROP")
+            vbuf = io.BytesIO()
+            vbuf.write(_PGCOPY_HEADER)
+            for key, embedding in vectors.items():
+                key_bytes = key.encode('utf-8')
+                value = _vector_binary(embedding, self.vector_type)
+                vbuf.write(struct.pack('>hi', 2, len(key_bytes)))
+                vbuf.write(key_bytes)
+                vbuf.write(struct.pack('>i', len(value)))
+                vbuf.write(value)
+            vbuf.write(_PGCOPY_TRAILER)
+            vbuf.seek(0)
+            cursor.copy_expert(f"COPY {vector_stage} FROM STDIN WITH (FORMAT BINARY)", vbuf)
+
+            select_list = ', '.join('v.embedding' if c == 'embedding' else f"s.{c}" for c in columns)
+            source += f" LEFT JOIN {vector_stage} v ON v.key = s.{conflict}"
+            drop += f", {vector_stage}"
+
+        # Dropped in the same round trip, so a later load in the same
+        # transaction can stage again
+        cursor.execute(f"""
+            INSERT INTO {table} ({column_list})
+            SELECT {select_list} FROM {source} {order_by}
+            ON CONFLICT ({conflict}) {action};
+            DROP TABLE {drop}
+        """)
+
+    def load_data(self, data: Dict):
+        """Load one parsed source, dispatching on its shape (meeting, chat or document)"""
+        if 'meeting' in data:
+            self.load_meeting_data(data)
+        elif 'conversation' in data:
+            self.load_whatsapp_data(data)
+        elif 'document' in data:
+            self.load_document_data(data)
+        else:
+            raise ValueError("Unrecognized source: expected a 'meeting', 'conversation' or 'document' key")
+    
+    def load_batch(self, datas: List[Dict], rebuild_index: bool = True) -> int:
+        """
+        Load many parsed sources, building the vector index once at the end
+        
+        Maintaining an IVFFLAT index row by row costs far more than building
+        it once over the loaded data, so with rebuild_index the index is
+        dropped first and recreated afterwards. For a few sources added to a
+        large table pass rebuild_index=False: a rebuild rescans every chunk.
+        Autovacuum on the bulk tables is paused meanwhile and the tables are
+        analyzed afterwards.
+        
+        Args:
+            datas: Parsed sources (any mix accepted by load_data)
+            rebuild_index: Drop idx_chunks_embedding before loading and rebuild it after
+        
+        Returns:
+            Number of sources loaded (failures are reported and skipped)
+        """
+        # One connection and one commit for the whole batch
+        loaded = 0
+        with self._bulk_load_window(rebuild_index), self.batch():
+            for i, data in enumerate(datas, 1):
+                try:
+                    self.load_data(data)
+                    loaded += 1
+                except Exception as e:
+                    print(f"[WARN] Skipping source {i}/{len(datas)}: {e}")
+        
+        print(f"\n[OK] Loaded {loaded}/{len(datas)} sources")
+        return loaded
+    
+    def load_many(self, datas: List[Dict], workers: int = 8, rebuild_index: bool = True) -> int:
+        """
+        Load sources in parallel worker processes, each with its own loader
+        
+        Sources are handed out to the workers in slices; every source is
+        committed on its own, so workers sharing entities never hold each
+        other's rows for long. The vector index is dropped up front and built
+        once after all workers finish (see load_batch). On Windows/macOS the
+        calling script needs an `if __name__ == "__main__":` guard.
+        
+        Args:
+            datas: Parsed sources (any mix accepted by load_data)
+            workers: Worker processes (one Postgres connection each)
+            rebuild_index: Drop idx_chunks_embedding before loading and rebuild it after
+        
+        Returns:
+            Number of sources loaded (failures are reported and skipped)
+        """
+        if not datas:
+            return 0
+        
+        workers = max(1, min(workers, len(datas)))
+        if self.connection_string:
+            connection_kwargs = {'connection_string': self.connection_string}
+        else:
+            connection_kwargs = dict(self.connection_params)
+        connection_kwargs['vector_type'] = self.vector_type
+        
+        print(f"\n[LOG] Loading {len(datas)} sources with {workers} workers...")
+        chunksize = max(1, len(datas) // (workers * 4))
+        with self._bulk_load_window(rebuild_index):
+            with mp.Pool(workers, initializer=_init_worker, initargs=(connection_kwargs,)) as worker_pool:
+                loaded = sum(worker_pool.imap_unordered(_worker_load, datas, chunksize=chunksize))
+        
+        print(f"\n[OK] Loaded {loaded}/{len(datas)} sources")
+        return loaded
     
     def _load_source(self, conn, source_data: Dict, source_type: str, full_data: Dict):
         """Load source with raw JSON backup"""
         cursor = conn.cursor()
         
-        # Prepare raw data (full parsed JSON for backup)
-        raw_json = json.dumps(full_data, ensure_ascii=False)
+        # Prepare raw data (full parsed JSON for backup; embeddings live in chunks)
+        raw_json = _raw_data_json(full_data)
         
         # Handle different source types
         if source_type == 'meeting':
@@ -357,16 +866,14 @@ class UnifiedPostgresLoader:
                 props.get('organization'),
                 props.get('org_type'),
                 props.get('status'),
-                json.dumps(props) if props else None
+                _json_text(props) if props else None
             ))
         
         # Batch upsert
-        sql = """
-            INSERT INTO entities (
-                id, name, type, role, organization, org_type, status, properties
-            )
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (id) DO UPDATE SET
+        self._upsert_rows(
+            cursor, 'entities',
+            ['id', 'name', 'type', 'role', 'organization', 'org_type', 'status', 'properties'],
+            entity_data, 'id', """DO UPDATE SET
                 name = EXCLUDED.name,
                 type = EXCLUDED.type,
                 role = EXCLUDED.role,
@@ -374,10 +881,8 @@ class UnifiedPostgresLoader:
                 org_type = EXCLUDED.org_type,
                 status = EXCLUDED.status,
                 properties = EXCLUDED.properties,
-                updated_at = NOW()
-        """
-        
-        extras.execute_batch(cursor, sql, entity_data, page_size=100)
+                updated_at = NOW()"""
+        )
         cursor.close()
         
         print(f"  [OK] Loaded {len(entities)} entities")
@@ -389,79 +894,59 @@ class UnifiedPostgresLoader:
         
         cursor = conn.cursor()
         
-        # Prepare chunk data
-        chunk_data = []
-        for chunk in chunks:
-            # Convert embedding to Postgres vector format
-            embedding_str = None
-            if 'embedding' in chunk and chunk['embedding']:
-                embedding_str = '[' + ','.join(map(str, chunk['embedding'])) + ']'
-            
-            # Convert arrays to PostgreSQL array format
-            speakers = chunk.get('speakers', []) or []
-            participants = chunk.get('participants', []) or []
-            # PostgreSQL array literal format: '{val1,val2}' (escape quotes in values)
-            def to_pg_array(arr):
-                if not arr:
-                    return '{}'
-                # Escape quotes and backslashes in array elements
-                escaped = [str(item).replace('\\', '\\\\').replace('"', '\\"') for item in arr]
-                return '{' + ','.join(f'"{item}"' for item in escaped) + '}'
-            
-            speakers_pg = to_pg_array(speakers)
-            participants_pg = to_pg_array(participants)
-            
-            chunk_data.append((
-                chunk['id'],
-                chunk['text'],
-                embedding_str,
-                chunk.get('source_id'),
-                chunk.get('sequence_number', 0),
-                chunk.get('importance_score', 0.5),
-                chunk.get('chunk_type'),
-                speakers_pg,
-                chunk.get('start_time'),
-                chunk.get('meeting_id'),
-                chunk.get('meeting_title'),
-                chunk.get('meeting_date'),
-                participants_pg,
-                chunk.get('message_count'),
-                chunk.get('time_start'),
-                chunk.get('time_end'),
-                chunk.get('chunk_duration_minutes'),
-                chunk.get('has_media'),
-                chunk.get('media_count'),
-                chunk.get('source_title'),
-                chunk.get('source_date'),
-                chunk.get('source_type'),
-                json.dumps(chunk.get('chunk_metadata', {})) if chunk.get('chunk_metadata') else '{}'
-            ))
-        
-        # Batch upsert - use execute_values for better array handling
-        sql = """
-            INSERT INTO chunks (
-                id, text, embedding, source_id, sequence_number,
-                importance_score, chunk_type, speakers, start_time,
-                meeting_id, meeting_title, meeting_date,
-                participants, message_count, time_start, time_end,
-                chunk_duration_minutes, has_media, media_count,
-                source_title, source_date, source_type, chunk_metadata
-            )
-            VALUES %s
-            ON CONFLICT (id) DO UPDATE SET
+        columns = ['id', 'text', 'embedding', 'source_id', 'sequence_number',
+                   'importance_score', 'chunk_type', 'speakers', 'start_time',
+                   'meeting_id', 'meeting_title', 'meeting_date',
+                   'participants', 'message_count', 'time_start', 'time_end',
+                   'chunk_duration_minutes', 'has_media', 'media_count',
+                   'source_title', 'source_date', 'source_type', 'chunk_metadata']
+        action = """DO UPDATE SET
                 text = EXCLUDED.text,
                 embedding = EXCLUDED.embedding,
                 importance_score = EXCLUDED.importance_score,
-                updated_at = NOW()
-        """
-        
-        # Use execute_values for batch insertion
-        template = """(
-            %s, %s, %s::vector, %s, %s, %s, %s, %s::TEXT[], %s, %s, %s, %s,
-            %s::TEXT[], %s, %s, %s, %s, %s, %s, %s, %s, %s, %s::JSONB
-        )"""
+                updated_at = NOW()"""
+        
+        def chunk_rows(batch, vectors):
+            for chunk in batch:
+                # Embeddings travel separately, in binary (see _copy_upsert)
+                embedding = dequantize_embedding(chunk)
+                if embedding is not None and len(embedding):
+                    vectors[chunk['id']] = embedding
+                
+                metadata = chunk.get('chunk_metadata')
+                yield (
+                    chunk['id'],
+                    chunk['text'],
+                    None,
+                    chunk.get('source_id'),
+                    chunk.get('sequence_number', 0),
+                    chunk.get('importance_score', 0.5),
+                    chunk.get('chunk_type'),
+                    chunk.get('speakers', []) or [],
+                    chunk.get('start_time'),
+                    chunk.get('meeting_id'),
+                    chunk.get('meeting_title'),
+                    chunk.get('meeting_date'),
+                    chunk.get('participants', []) or [],
+                    chunk.get('message_count'),
+                    chunk.get('time_start'),
+                    chunk.get('time_end'),
+                    chunk.get('chunk_duration_minutes'),
+                    chunk.get('has_media'),
+                    chunk.get('media_count'),
+                    chunk.get('source_title'),
+                    chunk.get('source_date'),
+                    chunk.get('source_type'),
+                    _json_text(metadata) if metadata else _EMPTY_JSONB
+                )
         
-        extras.execute_values(cursor, sql, chunk_data, template=template, page_size=50)
+        # Fixed-size batches: only one batch's rows, COPY buffers and
+        # (dequantized) embeddings are resident at a time, however many
+        # chunks the source has
+        for start in range(0, len(chunks), _COPY_MIN_ROWS):
+            vectors = {}
+            rows = list(chunk_rows(chunks[start:start + _COPY_MIN_ROWS], vectors))
+            self._upsert_rows(cursor, 'chunks', columns, rows, 'id', action, vectors=vectors)
         cursor.close()
         
         print(f"  [OK] Loaded {len(chunks)} chunks")
@@ -473,31 +958,21 @@ class UnifiedPostgresLoader:
         
         cursor = conn.cursor()
         
-        # Build links with actual chunk IDs
-        links = []
-        for link in chunk_entity_links:
-            chunk_idx = link['chunk_sequence']
-            if chunk_idx < len(chunks):
-                links.append((
-                    chunks[chunk_idx]['id'],
-                    link['entity_id'],
-                    link.get('entity_name', '')
-                ))
-        
-        if not links:
-            return
-        
-        # Batch insert
-        sql = """
-            INSERT INTO chunk_mentions (chunk_id, entity_id, entity_name)
-            VALUES (%s, %s, %s)
-            ON CONFLICT (chunk_id, entity_id) DO NOTHING
-        """
-        
-        extras.execute_batch(cursor, sql, links, page_size=100)
+        # Links with actual chunk IDs, streamed straight into COPY
+        links = (
+            (chunks[link['chunk_sequence']]['id'], link['entity_id'], link.get('entity_name', ''))
+            for link in chunk_entity_links
+            if link['chunk_sequence'] < len(chunks)
+        )
+        
+        count = self._upsert_rows(
+            cursor, 'chunk_mentions', ['chunk_id', 'entity_id', 'entity_name'],
+            links, 'chunk_id, entity_id', 'DO NOTHING'
+        )
         cursor.close()
         
-        print(f"  [OK] Created {len(links)} chunk-entity links")
+        if count:
+            print(f"  [OK] Created {count} chunk-entity links")
     
     def _load_decisions(self, conn, decisions: List[Dict], source_id: str):
         """Load decisions"""
@@ -517,16 +992,14 @@ class UnifiedPostgresLoader:
             for decision in decisions
         ]
         
-        sql = """
-            INSERT INTO decisions (id, description, rationale, source_id, meeting_id)
-            VALUES (%s, %s, %s, %s, %s)
-            ON CONFLICT (id) DO UPDATE SET
+        self._upsert_rows(
+            cursor, 'decisions',
+            ['id', 'description', 'rationale', 'source_id', 'meeting_id'],
+            decision_data, 'id', """DO UPDATE SET
                 description = EXCLUDED.description,
                 rationale = EXCLUDED.rationale,
-                updated_at = NOW()
-        """
-        
-        extras.execute_batch(cursor, sql, decision_data, page_size=100)
+                updated_at = NOW()"""
+        )
         cursor.close()
         
         print(f"  [OK] Loaded {len(decisions)} decisions")
@@ -549,16 +1022,14 @@ class UnifiedPostgresLoader:
             for action in actions
         ]
         
-        sql = """
-            INSERT INTO actions (id, task, owner, source_id, meeting_id)
-            VALUES (%s, %s, %s, %s, %s)
-            ON CONFLICT (id) DO UPDATE SET
+        self._upsert_rows(
+            cursor, 'actions',
+            ['id', 'task', 'owner', 'source_id', 'meeting_id'],
+            action_data, 'id', """DO UPDATE SET
                 task = EXCLUDED.task,
                 owner = EXCLUDED.owner,
-                updated_at = NOW()
-        """
-        
-        extras.execute_batch(cursor, sql, action_data, page_size=100)
+                updated_at = NOW()"""
+        )
         cursor.close()
         
         print(f"  [OK] Loaded {len(actions)} actions")
@@ -567,41 +1038,27 @@ class UnifiedPostgresLoader:
         """Link chunks to decisions/actions they resulted in"""
         cursor = conn.cursor()
         
-        links = []
-        
-        # Decision links
-        for decision in decisions:
-            for seq in decision.get('source_chunk_sequences', []):
-                if seq < len(chunks):
-                    links.append((
-                        chunks[seq]['id'],
-                        decision['id'],
-                        'decision'
-                    ))
-        
-        # Action links
-        for action in actions:
-            for seq in action.get('source_chunk_sequences', []):
-                if seq < len(chunks):
-                    links.append((
-                        chunks[seq]['id'],
-                        action['id'],
-                        'action'
-                    ))
-        
-        if not links:
-            return
-        
-        sql = """
-            INSERT INTO chunk_outcomes (chunk_id, outcome_id, outcome_type)
-            VALUES (%s, %s, %s)
-            ON CONFLICT (chunk_id, outcome_id) DO NOTHING
-        """
-        
-        extras.execute_batch(cursor, sql, links, page_size=100)
+        def links():
+            # Decision links
+            for decision in decisions:
+                for seq in decision.get('source_chunk_sequences', []):
+                    if seq < len(chunks):
+                        yield chunks[seq]['id'], decision['id'], 'decision'
+            
+            # Action links
+            for action in actions:
+                for seq in action.get('source_chunk_sequences', []):
+                    if seq < len(chunks):
+                        yield chunks[seq]['id'], action['id'], 'action'
+        
+        count = self._upsert_rows(
+            cursor, 'chunk_outcomes', ['chunk_id', 'outcome_id', 'outcome_type'],
+            links(), 'chunk_id, outcome_id', 'DO NOTHING'
+        )
         cursor.close()
         
-        print(f"  [OK] Created {len(links)} chunk-outcome links")
+        if count:
+            print(f"  [OK] Created {count} chunk-outcome links")
     
     def _load_messages(self, conn, messages: List[Dict]):
         """Load WhatsApp messages"""
@@ -625,18 +1082,14 @@ class UnifiedPostgresLoader:
             for msg in messages
         ]
         
-        sql = """
-            INSERT INTO messages (
-                id, text, sender, timestamp, message_type,
-                media_type, is_forwarded, conversation_id, sequence_in_conversation
-            )
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (id) DO UPDATE SET
+        self._upsert_rows(
+            cursor, 'messages',
+            ['id', 'text', 'sender', 'timestamp', 'message_type',
+             'media_type', 'is_forwarded', 'conversation_id', 'sequence_in_conversation'],
+            message_data, 'id', """DO UPDATE SET
                 text = EXCLUDED.text,
-                updated_at = NOW()
-        """
-        
-        extras.execute_batch(cursor, sql, message_data, page_size=100)
+                updated_at = NOW()"""
+        )
         cursor.close()
         
         print(f"  [OK] Loaded {len(messages)} messages")
@@ -664,19 +1117,15 @@ class UnifiedPostgresLoader:
             for p in participants
         ]
         
-        sql = """
-            INSERT INTO participants (
-                id, name, conversation_id, message_count,
-                media_shared_count, first_message_date, last_message_date
-            )
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (name, conversation_id) DO UPDATE SET
+        self._upsert_rows(
+            cursor, 'participants',
+            ['id', 'name', 'conversation_id', 'message_count',
+             'media_shared_count', 'first_message_date', 'last_message_date'],
+            participant_data, 'name, conversation_id', """DO UPDATE SET
                 message_count = EXCLUDED.message_count,
                 media_shared_count = EXCLUDED.media_shared_count,
-                last_message_date = EXCLUDED.last_message_date
-        """
-        
-        extras.execute_batch(cursor, sql, participant_data, page_size=100)
+                last_message_date = EXCLUDED.last_message_date"""
+        )
         cursor.close()
         
         print(f"  [OK] Loaded {len(participants)} participants")
@@ -762,18 +1211,47 @@ class UnifiedPostgresLoader:
             cursor.close()
             self.release_connection(conn)
     
-    def create_vector_index(self):
-        """Create pgvector index (run after data is loaded for better performance)"""
+    def _drop_vector_index(self):
+        """Drop the pgvector index ahead of a bulk load (create_vector_index rebuilds it)"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute("DROP INDEX IF EXISTS idx_chunks_embedding")
+            conn.commit()
+            print("[LOG] Dropped pgvector index for bulk load")
+        except Exception as e:
+            conn.rollback()
+            print(f"[WARN] Could not drop vector index: {e}")
+        finally:
+            cursor.close()
+            self.release_connection(conn)
+    
+    def create_vector_index(self, maintenance_work_mem: str = '1GB', parallel_workers: int = 4):
+        """
+        Create pgvector index (run after data is loaded for better performance)
+        
+        Args:
+            maintenance_work_mem: Memory for the index build (this transaction only)
+            parallel_workers: max_parallel_maintenance_workers for the build
+        """
         print("\n[LOG] Creating pgvector index...")
         
         conn = self.get_connection()
         cursor = conn.cursor()
         
         try:
-            # Create IVFFLAT index for cosine similarity
-            cursor.execute("""
+            # Build settings apply to this transaction only
+            cursor.execute("SELECT set_config('maintenance_work_mem', %s, true)", (maintenance_work_mem,))
+            cursor.execute("SELECT set_config('max_parallel_maintenance_workers', %s, true)",
+                           (str(parallel_workers),))
+            
+            # Create IVFFLAT index for cosine similarity (operator class of the
+            # column's actual type, which may predate this loader's vector_type)
+            column_type = self._embedding_column_type(cursor) or self.vector_type
+            cursor.execute(f"""
                 CREATE INDEX IF NOT EXISTS idx_chunks_embedding 
-                ON chunks USING ivfflat (embedding vector_cosine_ops)
+                ON chunks USING ivfflat (embedding {column_type}_cosine_ops)
                 WITH (lists = 100)
             """)
             conn.commit()
@@ -786,6 +1264,36 @@ class UnifiedPostgresLoader:
             self.release_connection(conn)
 
 
+# Loader owned by each load_many worker process
+_worker_loader = None
+
+
+def _init_worker(connection_kwargs: Dict):
+    """Pool initializer: one single-connection loader per worker process"""
+    global _worker_loader
+    try:
+        _worker_loader = UnifiedPostgresLoader(**connection_kwargs, min_connections=1, max_connections=1)
+    except Exception:
+        # A raising initializer makes the pool respawn workers forever;
+        # _worker_load reports the missing loader per source instead
+        _worker_loader = None
+
+
+def _worker_load(data: Dict) -> int:
+    """Load one source in a worker; 1 if loaded, 0 if it failed"""
+    if _worker_loader is None:
+        print("[WARN] Skipping source: worker could not connect to Postgres")
+        return 0
+    try:
+        # One-source batch: its own commit, with the bulk session settings
+        with _worker_loader.batch():
+            _worker_loader.load_data(data)
+        return 1
+    except Exception as e:
+        print(f"[WARN] Skipping source: {e}")
+        return 0
+
+
 def main():
     """Test Postgres loader"""
     import sys
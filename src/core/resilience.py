@@ -6,7 +6,8 @@ Includes retry logic, circuit breakers, and timeout handling.
 import time
 import logging
 import functools
-from typing import Callable, Any, Optional, Type, Tuple
+import threading
+from typing import Callable, Any, Optional, Type, Tuple, Union
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
@@ -98,7 +99,7 @@ class CircuitBreaker:
         self,
         failure_threshold: int = 5,
         timeout: float = 60.0,
-        expected_exception: Type[Exception] = Exception
+        expected_exception: Union[Type[Exception], Tuple[Type[Exception], ...]] = Exception
     ):
         """
         Initialize circuit breaker.
@@ -106,7 +107,7 @@ class CircuitBreaker:
         Args:
             failure_threshold: Number of failures before opening circuit
             timeout: Seconds to wait before attempting recovery (HALF_OPEN)
-            expected_exception: Exception type that triggers the circuit breaker
+            expected_exception: Exception type (or tuple) that triggers the circuit breaker
         """
         self.failure_threshold = failure_threshold
         self.timeout = timeout
@@ -116,6 +117,9 @@ class CircuitBreaker:
         self.last_failure_time: Optional[datetime] = None
         self.state = self.CLOSED
         
+        # State is shared by every thread calling the protected function
+        self._lock = threading.Lock()
+        
         logger.info(
             f"CircuitBreaker initialized: threshold={failure_threshold}, "
             f"timeout={timeout}s"
@@ -125,17 +129,18 @@ class CircuitBreaker:
         """Decorator to protect a function with circuit breaker."""
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            if self.state == self.OPEN:
-                if self._should_attempt_reset():
-                    logger.info(f"Circuit breaker entering HALF_OPEN state for {func.__name__}")
-                    self.state = self.HALF_OPEN
-                else:
-                    elapsed = (datetime.now() - self.last_failure_time).total_seconds()
-                    wait_time = self.timeout - elapsed
-                    raise CircuitBreakerOpenError(
-                        f"Circuit breaker is OPEN for {func.__name__}. "
-                        f"Try again in {wait_time:.0f}s"
-                    )
+            with self._lock:
+                if self.state == self.OPEN:
+                    if self._should_attempt_reset():
+                        logger.info(f"Circuit breaker entering HALF_OPEN state for {func.__name__}")
+                        self.state = self.HALF_OPEN
+                    else:
+                        elapsed = (datetime.now() - self.last_failure_time).total_seconds()
+                        wait_time = self.timeout - elapsed
+                        raise CircuitBreakerOpenError(
+                            f"Circuit breaker is OPEN for {func.__name__}. "
+                            f"Try again in {wait_time:.0f}s"
+                        )
             
             try:
                 result = func(*args, **kwargs)
@@ -157,31 +162,34 @@ class CircuitBreaker:
     
     def _on_success(self):
         """Handle successful call."""
-        if self.state == self.HALF_OPEN:
-            logger.info("Circuit breaker recovered, returning to CLOSED state")
-            self.state = self.CLOSED
-        
-        self.failure_count = 0
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                logger.info("Circuit breaker recovered, returning to CLOSED state")
+                self.state = self.CLOSED
+            
+            self.failure_count = 0
     
     def _on_failure(self):
         """Handle failed call."""
-        self.failure_count += 1
-        self.last_failure_time = datetime.now()
-        
-        if self.failure_count >= self.failure_threshold:
-            if self.state != self.OPEN:
-                logger.error(
-                    f"Circuit breaker OPEN after {self.failure_count} failures. "
-                    f"Will attempt recovery in {self.timeout}s"
-                )
-                self.state = self.OPEN
+        with self._lock:
+            self.failure_count += 1
+            self.last_failure_time = datetime.now()
+            
+            if self.failure_count >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.error(
+                        f"Circuit breaker OPEN after {self.failure_count} failures. "
+                        f"Will attempt recovery in {self.timeout}s"
+                    )
+                    self.state = self.OPEN
     
     def reset(self):
         """Manually reset the circuit breaker."""
         logger.info("Circuit breaker manually reset")
-        self.failure_count = 0
-        self.last_failure_time = None
-        self.state = self.CLOSED
+        with self._lock:
+            self.failure_count = 0
+            self.last_failure_time = None
+            self.state = self.CLOSED
     
     def get_status(self) -> dict:
         """Get current circuit breaker status."""
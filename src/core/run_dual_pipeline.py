@@ -150,17 +150,9 @@ class DualPipelineOrchestrator:
             print("LOADING TO POSTGRES")
             print("="*70)
             
-            for i, transcript in enumerate(transcripts, 1):
-                print(f"\n[{i}/{len(transcripts)}] Loading: {transcript['meeting']['title']}")
-                try:
-                    self.postgres_loader.load_meeting_data(transcript)
-                except Exception as e:
-                    print(f"[ERROR] Failed to load to Postgres: {e}")
-                    print("[WARN] Continuing with next transcript...")
-            
-            # Create vector index after loading
-            if self.enable_embeddings:
-                self.postgres_loader.create_vector_index()
+            # Failed transcripts are skipped; the vector index is rebuilt
+            # once after loading instead of maintained per row
+            self.postgres_loader.load_batch(transcripts, rebuild_index=self.enable_embeddings)
     
     def load_whatsapp_chat(self, chat_file: str):
         """
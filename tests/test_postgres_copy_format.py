@@ -0,0 +1,150 @@
+"""
+Test the Postgres loader's COPY encodings (no database needed)
+
+Covers the hand-written parts of the bulk load path: COPY text escaping,
+pgvector's binary value layout (vector and halfvec), the binary COPY stream
+for staged embeddings, and int8 embedding exports.
+"""
+
+import io
+import struct
+import sys
+from pathlib import Path
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import src.core.postgres_loader as postgres_loader
+from src.core.postgres_loader import (
+    UnifiedPostgresLoader, _PGCOPY_HEADER, _PGCOPY_TRAILER,
+    _copy_field, _vector_binary, dequantize_embedding
+)
+
+
+class RecordingCursor:
+    """Cursor stand-in keeping the statements and COPY payloads it receives"""
+
+    def __init__(self):
+        self.statements = []
+        self.copies = []
+
+    def execute(self, sql, params=None):
+        self.statements.append(sql)
+
+    def copy_expert(self, sql, buf):
+        self.copies.append((sql, buf.read()))
+
+
+def test_copy_field_escaping():
+    """Backslash, tab, newline and CR are escaped; None is \\N"""
+    assert _copy_field('a\\b\tc\nd\re') == 'a\\\\b\\tc\\nd\\re'
+    assert _copy_field(None) == '\\N'
+    assert _copy_field(True) == 't' and _copy_field(False) == 'f'
+    assert _copy_field(3) == '3'
+    # Array literals escape quotes/backslashes, then the COPY escapes apply
+    assert _copy_field(['x', 'a"b']) == '{"x","a\\\\"b"}'
+    assert _copy_field(['tab\there']) == '{"tab\\there"}'
+    assert _copy_field([]) == '{}'
+
+
+def test_vector_binary_layout():
+    """vector: int16 dim, int16 unused, big-endian float4 elements"""
+    embedding = [1.0, -2.5, 0.25]
+    expected = struct.pack('>hh', 3, 0) + struct.pack('>3f', *embedding)
+    assert _vector_binary(embedding) == expected
+
+    numpy_available = postgres_loader.NUMPY_AVAILABLE
+    postgres_loader.NUMPY_AVAILABLE = False
+    try:
+        assert _vector_binary(embedding) == expected
+    finally:
+        postgres_loader.NUMPY_AVAILABLE = numpy_available
+
+
+def test_halfvec_binary_layout():
+    """halfvec: int16 dim, int16 unused, big-endian float2 elements"""
+    embedding = [1.0, -2.5, 0.25, 65504.0]
+    expected = struct.pack('>hh', 4, 0) + struct.pack('>4e', *embedding)
+    assert _vector_binary(embedding, 'halfvec') == expected
+
+    numpy_available = postgres_loader.NUMPY_AVAILABLE
+    postgres_loader.NUMPY_AVAILABLE = False
+    try:
+        assert _vector_binary(embedding, 'halfvec') == expected
+    finally:
+        postgres_loader.NUMPY_AVAILABLE = numpy_available
+
+
+def test_copy_upsert_streams():
+    """Staged rows go as COPY text, embeddings as a binary COPY keyed by id"""
+    loader = UnifiedPostgresLoader.__new__(UnifiedPostgresLoader)
+    loader.vector_type = 'vector'
+    cursor = RecordingCursor()
+    rows = [('c1', 'line\none', None), ('c2', 'tab\there', None)]
+    vectors = {'c1': [0.5, 1.5], 'c2': [-1.0, 2.0]}
+
+    loader._copy_upsert(cursor, 'chunks', ['id', 'text', 'embedding'], rows,
+                        'id', 'DO NOTHING', vectors)
+
+    (text_sql, text_data), (binary_sql, binary_data) = cursor.copies
+    assert text_sql == "COPY stage_chunks (id, text, embedding) FROM STDIN"
+    assert text_data == 'c1\tline\\none\t\\N\nc2\ttab\\there\t\\N\n'
+    assert 'FORMAT BINARY' in binary_sql
+
+    # Header, then per tuple: int16 field count, int32-length-prefixed fields
+    stream = io.BytesIO(binary_data)
+    assert stream.read(len(_PGCOPY_HEADER)) == _PGCOPY_HEADER
+    for key, embedding in vectors.items():
+        assert struct.unpack('>h', stream.read(2)) == (2,)
+        key_len, = struct.unpack('>i', stream.read(4))
+        assert stream.read(key_len) == key.encode('utf-8')
+        value_len, = struct.unpack('>i', stream.read(4))
+        assert stream.read(value_len) == _vector_binary(embedding)
+    assert stream.read() == _PGCOPY_TRAILER
+
+
+def test_dequantize_int8_roundtrip():
+    """dequantize_embedding undoes parse_for_rag's int8 export within half a step"""
+    import numpy as np
+    from src.core.parse_for_rag import _quantize_int8
+
+    rng = np.random.default_rng(0)
+    embeddings = rng.normal(size=(3, 1024)).astype(np.float32)
+    embeddings[2] = 0.0  # all-zero vector: scale 0, codes 0
+
+    for row, (codes, scale) in zip(embeddings, _quantize_int8(embeddings)):
+        chunk = {'embedding_int8': codes, 'embedding_scale': scale}
+        restored = np.array(dequantize_embedding(chunk))
+        assert restored.shape == row.shape
+        assert np.max(np.abs(restored - row)) <= scale / 2 + 1e-6
+
+    # Float exports pass through unchanged
+    assert dequantize_embedding({'embedding': [0.1, 0.2]}) == [0.1, 0.2]
+    assert dequantize_embedding({}) is None
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        ("COPY Text Escaping", test_copy_field_escaping),
+        ("Vector Binary Layout", test_vector_binary_layout),
+        ("Halfvec Binary Layout", test_halfvec_binary_layout),
+        ("COPY Upsert Streams", test_copy_upsert_streams),
+        ("Int8 Roundtrip", test_dequantize_int8_roundtrip)
+    ]
+
+    failed = 0
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            print(f"  {test_name:25} ✓ PASSED")
+        except Exception as e:
+            failed += 1
+            print(f"  {test_name:25} ✗ FAILED ({type(e).__name__}: {e})")
+
+    print(f"\nTotal: {len(tests) - failed}/{len(tests)} tests passed")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()